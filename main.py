@@ -17,7 +17,9 @@ Run
 python main.py
 """
 
+import inspect
 import sys
+from contextlib import ExitStack, contextmanager
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 
@@ -28,6 +30,260 @@ from modules.land_prep_tab import LandPrepTab
 from modules.manpower_tab import ManpowerTab
 from modules.equipment_tab import EquipmentTab
 from modules.summary_tab import SummaryTab
+from modules.project_io import (
+    PROJECT_FILE_EXT,
+    load_project,
+    load_summary_cache,
+    save_project,
+    save_summary_cache,
+)
+
+# ----------------------------------------------------------------------
+# Theme, prepared once at import time
+# ----------------------------------------------------------------------
+
+# Signature colours (shared by the palette and the stylesheet)
+_ORANGE = "#FF7A00"
+_ORANGE_HOVER = "#FF8E2B"
+_ORANGE_PRESSED = "#E96F00"
+
+_BG = "#050B1A"          # deep navy
+_PANEL = "#0B1020"       # slightly lighter panels
+_PANEL_2 = "#0E1630"     # input backgrounds
+_BORDER = "#223056"
+_TEXT = "#F5F5F5"        # main text
+_TEXT_DIM = "#A9B0C5"    # secondary text
+_DISABLED = "#6B7280"
+
+# The full application stylesheet is a constant; formatting it per
+# MainWindow construction just made Qt re-parse an identical sheet.
+_STYLESHEET = f"""
+    /* -------------------------
+    GLOBAL / BASE
+    --------------------------*/
+    QWidget {{
+        background-color: {_BG};
+        color: {_TEXT};
+        font-size: 13px;
+    }}
+
+    QMainWindow {{
+        background-color: {_BG};
+    }}
+
+    /* -------------------------
+    TABS
+    --------------------------*/
+    QTabWidget::pane {{
+        border-top: 2px solid {_ORANGE};
+        background: {_BG};
+    }}
+
+    QTabBar::tab {{
+        background: {_PANEL};
+        color: {_TEXT_DIM};
+        padding: 7px 16px;
+        margin-right: 2px;
+        border-top-left-radius: 8px;
+        border-top-right-radius: 8px;
+        border: 1px solid {_BORDER};
+        border-bottom: none;
+    }}
+
+    QTabBar::tab:selected {{
+        background: {_PANEL_2};
+        color: {_TEXT};
+    }}
+
+    QTabBar::tab:hover {{
+        color: {_TEXT};
+        border: 1px solid {_ORANGE};
+        border-bottom: none;
+    }}
+
+    /* -------------------------
+    GROUP BOXES
+    --------------------------*/
+    QGroupBox {{
+        border: 1px solid {_BORDER};
+        border-radius: 10px;
+        margin-top: 18px;
+        padding: 12px;
+        background-color: {_PANEL};
+    }}
+
+    QGroupBox::title {{
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        padding: 0 8px;
+        color: {_TEXT};
+        font-weight: bold;
+    }}
+
+    /* -------------------------
+    INPUTS
+    --------------------------*/
+    QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox, QPlainTextEdit, QTextEdit {{
+        background-color: {_PANEL_2};
+        color: {_TEXT};
+        border: 1px solid {_BORDER};
+        border-radius: 8px;
+        padding: 4px 8px;
+        selection-background-color: {_ORANGE};
+        selection-color: {_BG};
+    }}
+
+    QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QComboBox:focus,
+    QPlainTextEdit:focus, QTextEdit:focus {{
+        border: 1px solid {_ORANGE};
+    }}
+
+    QComboBox::drop-down {{
+        border: 0px;
+        width: 28px;
+    }}
+
+    QComboBox QAbstractItemView {{
+        background-color: {_PANEL};
+        color: {_TEXT};
+        border: 1px solid {_BORDER};
+        selection-background-color: {_ORANGE};
+        selection-color: {_BG};
+    }}
+
+    /* -------------------------
+    SCROLLBARS
+    --------------------------*/
+    QScrollBar:vertical {{
+        background: {_PANEL};
+        width: 12px;
+        margin: 0px;
+        border-radius: 6px;
+    }}
+    QScrollBar::handle:vertical {{
+        background: {_ORANGE};
+        min-height: 24px;
+        border-radius: 6px;
+    }}
+    QScrollBar::handle:vertical:hover {{
+        background: {_ORANGE_HOVER};
+    }}
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+        height: 0px;
+    }}
+    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
+        background: none;
+    }}
+
+    /* -------------------------
+    BUTTONS
+    --------------------------*/
+    QPushButton {{
+        background-color: {_PANEL_2};
+        color: {_TEXT};
+        border: 1px solid {_BORDER};
+        border-radius: 10px;
+        padding: 8px 14px;
+    }}
+
+    QPushButton:hover {{
+        border: 1px solid {_ORANGE};
+    }}
+
+    QPushButton#primaryButton {{
+        background-color: {_ORANGE};
+        color: {_BG};
+        font-weight: bold;
+        border: 1px solid {_ORANGE};
+    }}
+
+    QPushButton#primaryButton:hover {{
+        background-color: {_ORANGE_HOVER};
+        border: 1px solid {_ORANGE_HOVER};
+    }}
+
+    QPushButton#primaryButton:pressed {{
+        background-color: {_ORANGE_PRESSED};
+        border: 1px solid {_ORANGE_PRESSED};
+    }}
+
+    QPushButton#secondaryButton {{
+        background-color: {_PANEL_2};
+        color: {_TEXT};
+    }}
+
+    QPushButton#secondaryButton:hover {{
+        border: 1px solid {_ORANGE};
+    }}
+
+    QPushButton:disabled {{
+        background-color: {_PANEL};
+        color: #7C849A;
+        border: 1px solid {_BORDER};
+    }}
+
+    /* -------------------------
+    TOOLTIP
+    --------------------------*/
+    QToolTip {{
+        background-color: {_PANEL};
+        color: {_TEXT};
+        border: 1px solid {_ORANGE};
+        padding: 6px;
+    }}
+"""
+
+# Built lazily (QPalette wants the GUI libs warmed up) and then reused
+# for every window.
+_DARK_PALETTE: QtGui.QPalette | None = None
+
+
+def _dark_palette() -> QtGui.QPalette:
+    """Return the shared dark-blue + orange palette, building it once."""
+    global _DARK_PALETTE
+    if _DARK_PALETTE is None:
+        BG = QtGui.QColor(_BG)
+        BG_ALT = QtGui.QColor(_PANEL)
+        BASE = QtGui.QColor(_PANEL_2)
+        TEXT = QtGui.QColor(_TEXT)
+        ORANGE = QtGui.QColor(_ORANGE)
+        DISABLED = QtGui.QColor(_DISABLED)
+
+        palette = QtGui.QPalette()
+
+        palette.setColor(QtGui.QPalette.Window, BG)
+        palette.setColor(QtGui.QPalette.WindowText, TEXT)
+
+        palette.setColor(QtGui.QPalette.Base, BASE)
+        palette.setColor(QtGui.QPalette.AlternateBase, BG_ALT)
+
+        palette.setColor(QtGui.QPalette.Text, TEXT)
+        palette.setColor(QtGui.QPalette.Disabled, QtGui.QPalette.Text, DISABLED)
+
+        palette.setColor(QtGui.QPalette.Button, BG_ALT)
+        palette.setColor(QtGui.QPalette.ButtonText, TEXT)
+        palette.setColor(QtGui.QPalette.Disabled, QtGui.QPalette.ButtonText, DISABLED)
+
+        palette.setColor(QtGui.QPalette.ToolTipBase, BG_ALT)
+        palette.setColor(QtGui.QPalette.ToolTipText, TEXT)
+
+        palette.setColor(QtGui.QPalette.Highlight, ORANGE)
+        palette.setColor(QtGui.QPalette.HighlightedText, QtGui.QColor(_BG))
+
+        _DARK_PALETTE = palette
+
+    return _DARK_PALETTE
+
+
+# Maps the short tab keys used by SummaryTab's provider to tab titles.
+_TAB_TITLES_BY_KEY = {
+    "breeze_block": "Breeze Block Calculator",
+    "sweet_sand": "Sweet Sand Calculator",
+    "concrete": "Concrete Works",
+    "land_prep": "Land Preparation",
+    "manpower": "Manpower",
+    "equipment": "Equipment and Machinery",
+}
 
 
 class MainWindow(QtWidgets.QMainWindow):
@@ -42,46 +298,58 @@ class MainWindow(QtWidgets.QMainWindow):
     def __init__(self) -> None:
         super().__init__()
 
-        from modules.project_io import PROJECT_FILE_EXT, load_project, save_project
+        self._current_project_path: str | None = None
 
-        self._PROJECT_FILE_EXT = PROJECT_FILE_EXT
-        self._load_project_file = load_project
-        self._save_project_file = save_project
+        # Cached export_state snapshots keyed by tab key, each paired
+        # with the tab _state_version it was taken at.
+        self._export_cache: dict[str, tuple[int, dict]] = {}
 
-        self._current_project_path: str | None = None
+        # Set by bulk mutations (load/reset); consumed by exactly one
+        # Summary refresh at the end of the high-level action.
+        self._summary_dirty = False
 
         # Create the QTabWidget
         self.tab_widget = QtWidgets.QTabWidget(self)
         self.setCentralWidget(self.tab_widget)
 
-        # --- Create all functional tabs ---
-        self.breeze_tab = BreezeBlockTab(self)
-        self.sweet_sand_tab = SweetSandTab(self)
-        self.concrete_tab = ConcreteTab(self)
-        self.land_prep_tab = LandPrepTab(self)
-        self.manpower_tab = ManpowerTab(self)
-        self.equipment_tab = EquipmentTab(self)
-
-        # Add them (excluding summary for the moment)
-        self.tab_widget.addTab(self.breeze_tab, "Breeze Block Calculator")
-        self.tab_widget.addTab(self.sweet_sand_tab, "Sweet Sand Calculator")
-        self.tab_widget.addTab(self.concrete_tab, "Concrete Works")
-        self.tab_widget.addTab(self.land_prep_tab, "Land Preparation")
-        self.tab_widget.addTab(self.manpower_tab, "Manpower")
-        self.tab_widget.addTab(self.equipment_tab, "Equipment and Machinery")
+        # --- Lazy calculator tabs ---
+        # Building every tab up front makes startup pay for seven widget
+        # trees even though only Summary is visible first. Instead we add
+        # cheap placeholder widgets and build the real tab on first use
+        # (user visit, or project save/load touching its state).
+        self._tab_factories = {
+            "Breeze Block Calculator": lambda: BreezeBlockTab(self),
+            "Sweet Sand Calculator": lambda: SweetSandTab(self),
+            "Concrete Works": lambda: ConcreteTab(self),
+            "Land Preparation": lambda: LandPrepTab(self),
+            "Manpower": lambda: ManpowerTab(self),
+            "Equipment and Machinery": lambda: EquipmentTab(self),
+        }
+        self._tab_instances: dict[str, QtWidgets.QWidget] = {}
+
+        # Recalc dispatch table: one bound callable per materialized tab,
+        # probed once at construction instead of hasattr/TypeError per call.
+        self._recalc_callbacks: dict[str, object] = {}
+
+        for title in self._tab_factories:
+            self.tab_widget.addTab(QtWidgets.QWidget(), title)
 
         # --- Summary tab as FIRST tab ---
-        self.summary_tab = SummaryTab(
-            breeze_tab=self.breeze_tab,
-            sweet_sand_tab=self.sweet_sand_tab,
-            concrete_tab=self.concrete_tab,
-            land_prep_tab=self.land_prep_tab,
-            manpower_tab=self.manpower_tab,
-            equipment_tab=self.equipment_tab,
-            parent=self,
-        )
-        self.tab_widget.insertTab(0, self.summary_tab, "Summary")
+        # Summary resolves the other tabs through a provider callable,
+        # so building it no longer materializes the six calculators.
+        # It is itself deferred to just after the window first paints.
+        self._summary_instance: SummaryTab | None = None
+        self.tab_widget.insertTab(0, QtWidgets.QWidget(), "Summary")
         self.tab_widget.setCurrentIndex(0)
+        QtCore.QTimer.singleShot(0, self._ensure_summary_tab)
+
+        # Coalesce rapid tab flips into at most one Summary recompute per
+        # event-loop turn: currentChanged only schedules the refresh.
+        self._summary_refresh_pending = False
+        self._summary_refresh_timer = QtCore.QTimer(self)
+        self._summary_refresh_timer.setSingleShot(True)
+        self._summary_refresh_timer.setInterval(0)
+        self._summary_refresh_timer.timeout.connect(self._do_summary_refresh)
 
         # Ensure the summary refreshes whenever the user switches to it
         self.tab_widget.currentChanged.connect(self._on_tab_changed)
@@ -137,14 +405,143 @@ class MainWindow(QtWidgets.QMainWindow):
 
 
 
+    # ------------------------------------------------------------------
+    # Lazy tab access
+    # ------------------------------------------------------------------
+
+    def _tab_index(self, title: str) -> int:
+        """Return the QTabWidget index for a tab title, or -1 if absent."""
+        for i in range(self.tab_widget.count()):
+            if self.tab_widget.tabText(i) == title:
+                return i
+        return -1
+
+    def _ensure_tab(self, title: str) -> QtWidgets.QWidget:
+        """
+        Return the real tab widget for `title`, building it on first access
+        and swapping it in place of its placeholder.
+        """
+        widget = self._tab_instances.get(title)
+        if widget is not None:
+            return widget
+
+        widget = self._tab_factories[title]()
+        self._tab_instances[title] = widget
+        self._recalc_callbacks[title] = self._make_recalc_callback(widget)
+
+        index = self._tab_index(title)
+        if index >= 0:
+            current = self.tab_widget.currentIndex()
+            # Swap silently so the placeholder replacement doesn't
+            # re-enter _on_tab_changed.
+            self.tab_widget.blockSignals(True)
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, widget, title)
+            self.tab_widget.setCurrentIndex(current)
+            self.tab_widget.blockSignals(False)
+
+        return widget
+
+    @staticmethod
+    def _make_recalc_callback(tab: QtWidgets.QWidget):
+        """
+        Probe a tab once for its recalculation entry point and return a
+        bound callable for the hot _recalculate_all_tabs loop.
+
+        Prefers a public `recalculate` (silent when it takes show_dialogs,
+        like ConcreteTab's) and falls back to the synchronous compute slot
+        (`_do_calculate` where the button handler is debounced, else the
+        calculate-button slot itself).
+        """
+        recalc = getattr(tab, "recalculate", None)
+        if recalc is not None:
+            try:
+                inspect.signature(recalc).bind(show_dialogs=False)
+            except TypeError:
+                return recalc
+            return lambda: recalc(show_dialogs=False)
+
+        do_calc = getattr(tab, "_do_calculate", None)
+        if do_calc is not None:
+            return do_calc
+        return getattr(tab, "_on_calculate_clicked", lambda: None)
+
+    def _tab_for_key(self, key: str) -> QtWidgets.QWidget:
+        """Tab provider passed to SummaryTab: resolve a tab by short key."""
+        return self._ensure_tab(_TAB_TITLES_BY_KEY[key])
+
+    def _ensure_summary_tab(self) -> "SummaryTab":
+        """Build the Summary tab on first use and swap out its placeholder."""
+        if self._summary_instance is None:
+            summary = SummaryTab(tab_provider=self._tab_for_key, parent=self)
+            self._summary_instance = summary
+
+            index = self._tab_index("Summary")
+            if index >= 0:
+                current = self.tab_widget.currentIndex()
+                self.tab_widget.blockSignals(True)
+                self.tab_widget.removeTab(index)
+                self.tab_widget.insertTab(index, summary, "Summary")
+                self.tab_widget.setCurrentIndex(current)
+                self.tab_widget.blockSignals(False)
+
+        return self._summary_instance
+
+    @property
+    def summary_tab(self) -> "SummaryTab":
+        return self._ensure_summary_tab()
+
+    @property
+    def breeze_tab(self) -> QtWidgets.QWidget:
+        return self._ensure_tab("Breeze Block Calculator")
+
+    @property
+    def sweet_sand_tab(self) -> QtWidgets.QWidget:
+        return self._ensure_tab("Sweet Sand Calculator")
+
+    @property
+    def concrete_tab(self) -> QtWidgets.QWidget:
+        return self._ensure_tab("Concrete Works")
+
+    @property
+    def land_prep_tab(self) -> QtWidgets.QWidget:
+        return self._ensure_tab("Land Preparation")
+
+    @property
+    def manpower_tab(self) -> QtWidgets.QWidget:
+        return self._ensure_tab("Manpower")
+
+    @property
+    def equipment_tab(self) -> QtWidgets.QWidget:
+        return self._ensure_tab("Equipment and Machinery")
+
     def _on_tab_changed(self, index: int) -> None:
         """
-        When user switches to Summary, force a full recalc first so the totals are correct.
+        Materialize the selected tab if it is still a placeholder, and when
+        the user switches to Summary, force a full recalc first so the
+        totals are correct.
         """
-        widget = self.tab_widget.widget(index)
-        if widget is self.summary_tab:
-            self._recalculate_all_tabs()
-            self.summary_tab.refresh_summary()
+        title = self.tab_widget.tabText(index)
+        if title == "Summary":
+            # Don't reschedule while a refresh is already pending; the
+            # queued one picks up whatever the final state is.
+            if not self._summary_refresh_pending:
+                self._summary_refresh_pending = True
+                self._summary_refresh_timer.start()
+        elif title in self._tab_factories:
+            self._ensure_tab(title)
+
+    def _do_summary_refresh(self) -> None:
+        """Run the coalesced full recalc + Summary refresh."""
+        self._summary_refresh_pending = False
+
+        # The user may already have flipped away again; skip the work then.
+        if self.tab_widget.tabText(self.tab_widget.currentIndex()) != "Summary":
+            return
+
+        summary = self._ensure_summary_tab()
+        self._recalculate_all_tabs()
+        summary.refresh_summary()
 
 
     # ------------------------------------------------------------------
@@ -154,73 +551,120 @@ class MainWindow(QtWidgets.QMainWindow):
     def _collect_project_state(self) -> dict:
         """
         Grab all user-input values from every tab into one dict.
+
+        Snapshots are cached per tab against its _state_version, so tabs
+        that haven't been edited since the last collect skip the widget
+        walk entirely.
         """
-        return {
-            "breeze_block": self.breeze_tab.export_state(),
-            "sweet_sand": self.sweet_sand_tab.export_state(),
-            "concrete": self.concrete_tab.export_state(),
-            "land_prep": self.land_prep_tab.export_state(),
-            "manpower": self.manpower_tab.export_state(),
-            "equipment": self.equipment_tab.export_state(),
-        }
+        state: dict = {}
+        for key, title in _TAB_TITLES_BY_KEY.items():
+            tab = self._ensure_tab(title)
+            version = getattr(tab, "_state_version", None)
+
+            if version is not None:
+                cached = self._export_cache.get(key)
+                if cached is not None and cached[0] == version:
+                    state[key] = cached[1]
+                    continue
+
+            snapshot = tab.export_state()
+            if version is not None:
+                self._export_cache[key] = (version, snapshot)
+            state[key] = snapshot
 
+        return state
 
-    def _apply_project_state(self, state: dict) -> None:
+
+    def _apply_project_state(self, state: dict, cached_totals: dict | None = None) -> None:
         """
         Push a loaded dict back into the UI, then recalc everything so Summary is correct.
+
+        import_state must run on the GUI thread (it writes widgets), but
+        the recompute pass is deferred to the next event-loop iteration:
+        the freshly loaded values paint immediately instead of the window
+        freezing through import + six recalculations in one call stack.
+
+        If `cached_totals` is given (a verified sidecar-cache hit), the
+        Summary labels are restored from it for an instant first paint;
+        the deferred recompute still runs, because import_state alone
+        leaves several tabs' results and total_cost_value mirrors stale,
+        and the next Summary refresh would overwrite the cached labels
+        from those mirrors.
         """
-        self.breeze_tab.import_state(state.get("breeze_block", {}))
-        self.sweet_sand_tab.import_state(state.get("sweet_sand", {}))
-        self.concrete_tab.import_state(state.get("concrete", {}))
-        self.land_prep_tab.import_state(state.get("land_prep", {}))
-        self.manpower_tab.import_state(state.get("manpower", {}))
-        self.equipment_tab.import_state(state.get("equipment", {}))
-
-        # Auto-recompute all derived outputs (so Summary isn't stale)
+        with self._batched_updates():
+            self.breeze_tab.import_state(state.get("breeze_block", {}))
+            self.sweet_sand_tab.import_state(state.get("sweet_sand", {}))
+            self.concrete_tab.import_state(state.get("concrete", {}))
+            self.land_prep_tab.import_state(state.get("land_prep", {}))
+            self.manpower_tab.import_state(state.get("manpower", {}))
+            self.equipment_tab.import_state(state.get("equipment", {}))
+
+        if cached_totals is not None:
+            self._ensure_summary_tab().apply_cached_totals(cached_totals)
+
+        self._summary_dirty = True
+        QtCore.QTimer.singleShot(0, self._finish_project_load)
+
+    def _finish_project_load(self) -> None:
+        """Deferred recompute pass scheduled by _apply_project_state."""
         self._recalculate_all_tabs()
+        self._refresh_summary_if_dirty()
 
-        # Now refresh summary once everything is “real”
+    def _refresh_summary_if_dirty(self) -> None:
+        """Run a single Summary refresh if a bulk mutation marked it stale."""
+        if not self._summary_dirty:
+            return
+        self._summary_dirty = False
         try:
             self.summary_tab.refresh_summary()
         except Exception:
             pass
 
 
+    @contextmanager
+    def _batched_updates(self):
+        """
+        Suppress the signal storm from mass widget writes.
+
+        Blocks signals on every child input widget and disables repaints
+        for the duration of the block, so bulk operations (project load,
+        full recalc) emit one final refresh instead of one per setValue.
+        """
+        input_types = (
+            QtWidgets.QLineEdit,
+            QtWidgets.QSpinBox,
+            QtWidgets.QDoubleSpinBox,
+            QtWidgets.QComboBox,
+        )
+        self.setUpdatesEnabled(False)
+        try:
+            with ExitStack() as stack:
+                for w in self.findChildren(input_types):
+                    stack.enter_context(QtCore.QSignalBlocker(w))
+                yield
+        finally:
+            self.setUpdatesEnabled(True)
+            self.repaint()
 
     def _recalculate_all_tabs(self) -> None:
         """
         Force every calculator tab to recompute its outputs so Summary is always correct.
 
         Important:
-        - ConcreteTab supports silent recalculation to avoid QMessageBox spam.
-        - Other tabs use their existing calculate slot.
+        - Dispatch goes through the per-tab callbacks precomputed in
+          _ensure_tab (silent recalc for tabs that support it).
+        - Runs inside _batched_updates so intermediate label writes don't
+          trigger per-widget repaints.
         """
-        tabs = [
-            self.breeze_tab,
-            self.sweet_sand_tab,
-            self.concrete_tab,
-            self.land_prep_tab,
-            self.manpower_tab,
-            self.equipment_tab,
-        ]
-
-        for tab in tabs:
-            try:
-                # Prefer a public recalc hook if present
-                if hasattr(tab, "recalculate"):
-                    try:
-                        tab.recalculate(show_dialogs=False)  # ConcreteTab accepts this
-                    except TypeError:
-                        tab.recalculate()  # other tabs might not take args
-                    continue
-
-                # Fall back to the existing button handler
-                if hasattr(tab, "_on_calculate_clicked"):
-                    tab._on_calculate_clicked()
-
-            except Exception:
-                # Never crash the whole app because one tab had weird state.
-                pass
+        with self._batched_updates():
+            for title in self._tab_factories:
+                self._ensure_tab(title)
+                callback = self._recalc_callbacks[title]
+                try:
+                    callback()
+                except Exception:
+                    # Never crash the whole app because one tab had weird state.
+                    pass
 
 
 
@@ -230,30 +674,45 @@ class MainWindow(QtWidgets.QMainWindow):
     # File actions
     # ------------------------------------------------------------------
 
+    def _fresh_summary_totals(self) -> dict:
+        """
+        Recompute every tab and refresh the Summary, then snapshot its
+        totals for the sidecar cache.
+
+        The Summary labels only track the other tabs when that tab is
+        actually visited, so snapshotting them as-is could persist
+        stale (or never-computed "$0.00") totals against the freshly
+        saved state's digest — which a later open would trust as a
+        verified cache hit.
+        """
+        self._recalculate_all_tabs()
+        self._summary_dirty = True
+        self._refresh_summary_if_dirty()
+        return self.summary_tab.export_totals()
+
     def _new_project(self) -> None:
         """
         Reset all tabs to defaults and clear current project path.
         """
-        self.breeze_tab._on_reset_clicked()
-        self.sweet_sand_tab._on_reset_clicked()
-        self.concrete_tab._on_reset_clicked()
-        self.land_prep_tab._on_reset_clicked()
-        self.manpower_tab._on_reset_clicked()
-        self.equipment_tab._on_reset_clicked()
+        with self._batched_updates():
+            self.breeze_tab._on_reset_clicked()
+            self.sweet_sand_tab._on_reset_clicked()
+            self.concrete_tab._on_reset_clicked()
+            self.land_prep_tab._on_reset_clicked()
+            self.manpower_tab._on_reset_clicked()
+            self.equipment_tab._on_reset_clicked()
 
         self._current_project_path = None
         self._update_title()
 
-        try:
-            self.summary_tab.refresh_summary()
-        except Exception:
-            pass
+        self._summary_dirty = True
+        self._refresh_summary_if_dirty()
 
     def _open_project(self) -> None:
         """
         Load a .gdtproj.json and restore the UI.
         """
-        filt = f"GDT Project (*{self._PROJECT_FILE_EXT});;JSON (*.json);;All Files (*.*)"
+        filt = f"GDT Project (*{PROJECT_FILE_EXT});;JSON (*.json);;All Files (*.*)"
         path, _ = QtWidgets.QFileDialog.getOpenFileName(
             self,
             "Open Project",
@@ -264,7 +723,7 @@ class MainWindow(QtWidgets.QMainWindow):
             return
 
         try:
-            data = self._load_project_file(path)
+            data = load_project(path)
         except Exception as exc:
             QtWidgets.QMessageBox.critical(
                 self,
@@ -273,7 +732,11 @@ class MainWindow(QtWidgets.QMainWindow):
             )
             return
 
-        self._apply_project_state(data)
+        # If the sidecar cache still matches this state, restore the
+        # Summary totals directly and skip the six-tab recompute.
+        cached_totals = load_summary_cache(path, data)
+
+        self._apply_project_state(data, cached_totals=cached_totals)
         self._current_project_path = path
         self._update_title()
 
@@ -287,7 +750,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         try:
             state = self._collect_project_state()
-            self._save_project_file(self._current_project_path, state)
+            save_project(self._current_project_path, state)
         except Exception as exc:
             QtWidgets.QMessageBox.critical(
                 self,
@@ -296,29 +759,33 @@ class MainWindow(QtWidgets.QMainWindow):
             )
             return
 
+        save_summary_cache(
+            self._current_project_path, state, self._fresh_summary_totals()
+        )
+
         QtWidgets.QMessageBox.information(self, "Saved", "Project saved successfully.")
 
     def _save_project_as(self) -> None:
         """
         Save to a new file path.
         """
-        filt = f"GDT Project (*{self._PROJECT_FILE_EXT});;JSON (*.json);;All Files (*.*)"
+        filt = f"GDT Project (*{PROJECT_FILE_EXT});;JSON (*.json);;All Files (*.*)"
         path, _ = QtWidgets.QFileDialog.getSaveFileName(
             self,
             "Save Project As",
-            "my_project" + self._PROJECT_FILE_EXT,
+            "my_project" + PROJECT_FILE_EXT,
             filt,
         )
         if not path:
             return
 
         # Enforce extension if user deletes it
-        if not path.endswith(self._PROJECT_FILE_EXT):
-            path += self._PROJECT_FILE_EXT
+        if not path.endswith(PROJECT_FILE_EXT):
+            path += PROJECT_FILE_EXT
 
         try:
             state = self._collect_project_state()
-            self._save_project_file(path, state)
+            save_project(path, state)
         except Exception as exc:
             QtWidgets.QMessageBox.critical(
                 self,
@@ -327,6 +794,8 @@ class MainWindow(QtWidgets.QMainWindow):
             )
             return
 
+        save_summary_cache(path, state, self._fresh_summary_totals())
+
         self._current_project_path = path
         self._update_title()
 
@@ -343,37 +812,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if app is None:
             return
 
-        # Signature colours
-        BG = QtGui.QColor("#050B1A")          # deep navy
-        BG_ALT = QtGui.QColor("#0B1020")      # slightly lighter panels
-        BASE = QtGui.QColor("#0E1630")        # input backgrounds
-        TEXT = QtGui.QColor("#F5F5F5")        # main text
-        TEXT_DIM = QtGui.QColor("#A9B0C5")    # secondary text
-        ORANGE = QtGui.QColor("#FF7A00")      # vibrant accent
-        DISABLED = QtGui.QColor("#6B7280")
-
-        palette = QtGui.QPalette()
-
-        palette.setColor(QtGui.QPalette.Window, BG)
-        palette.setColor(QtGui.QPalette.WindowText, TEXT)
-
-        palette.setColor(QtGui.QPalette.Base, BASE)
-        palette.setColor(QtGui.QPalette.AlternateBase, BG_ALT)
-
-        palette.setColor(QtGui.QPalette.Text, TEXT)
-        palette.setColor(QtGui.QPalette.Disabled, QtGui.QPalette.Text, DISABLED)
-
-        palette.setColor(QtGui.QPalette.Button, BG_ALT)
-        palette.setColor(QtGui.QPalette.ButtonText, TEXT)
-        palette.setColor(QtGui.QPalette.Disabled, QtGui.QPalette.ButtonText, DISABLED)
-
-        palette.setColor(QtGui.QPalette.ToolTipBase, BG_ALT)
-        palette.setColor(QtGui.QPalette.ToolTipText, TEXT)
-
-        palette.setColor(QtGui.QPalette.Highlight, ORANGE)
-        palette.setColor(QtGui.QPalette.HighlightedText, QtGui.QColor("#050B1A"))
-
-        app.setPalette(palette)
+        app.setPalette(_dark_palette())
         app.setStyle("Fusion")
 
 
@@ -381,7 +820,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _apply_styles(self) -> None:
         """
-        Apply a consistent dark-blue + orange stylesheet across all widgets.
+        Apply the consistent dark-blue + orange stylesheet across all widgets.
         Uses objectName hooks:
         - QPushButton#primaryButton
         - QPushButton#secondaryButton
@@ -390,194 +829,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if app is None:
             return
 
-        ORANGE = "#FF7A00"
-        ORANGE_HOVER = "#FF8E2B"
-        ORANGE_PRESSED = "#E96F00"
-
-        BG = "#050B1A"
-        PANEL = "#0B1020"
-        PANEL_2 = "#0E1630"
-        BORDER = "#223056"
-        TEXT = "#F5F5F5"
-        TEXT_DIM = "#A9B0C5"
-
-        app.setStyleSheet(
-            f"""
-            /* -------------------------
-            GLOBAL / BASE
-            --------------------------*/
-            QWidget {{
-                background-color: {BG};
-                color: {TEXT};
-                font-size: 13px;
-            }}
-
-            QMainWindow {{
-                background-color: {BG};
-            }}
-
-            /* -------------------------
-            TABS
-            --------------------------*/
-            QTabWidget::pane {{
-                border-top: 2px solid {ORANGE};
-                background: {BG};
-            }}
-
-            QTabBar::tab {{
-                background: {PANEL};
-                color: {TEXT_DIM};
-                padding: 7px 16px;
-                margin-right: 2px;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-                border: 1px solid {BORDER};
-                border-bottom: none;
-            }}
-
-            QTabBar::tab:selected {{
-                background: {PANEL_2};
-                color: {TEXT};
-            }}
-
-            QTabBar::tab:hover {{
-                color: {TEXT};
-                border: 1px solid {ORANGE};
-                border-bottom: none;
-            }}
-
-            /* -------------------------
-            GROUP BOXES
-            --------------------------*/
-            QGroupBox {{
-                border: 1px solid {BORDER};
-                border-radius: 10px;
-                margin-top: 18px;
-                padding: 12px;
-                background-color: {PANEL};
-            }}
-
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 0 8px;
-                color: {TEXT};
-                font-weight: bold;
-            }}
-
-            /* -------------------------
-            INPUTS
-            --------------------------*/
-            QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox, QPlainTextEdit, QTextEdit {{
-                background-color: {PANEL_2};
-                color: {TEXT};
-                border: 1px solid {BORDER};
-                border-radius: 8px;
-                padding: 4px 8px;
-                selection-background-color: {ORANGE};
-                selection-color: {BG};
-            }}
-
-            QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QComboBox:focus,
-            QPlainTextEdit:focus, QTextEdit:focus {{
-                border: 1px solid {ORANGE};
-            }}
-
-            QComboBox::drop-down {{
-                border: 0px;
-                width: 28px;
-            }}
-
-            QComboBox QAbstractItemView {{
-                background-color: {PANEL};
-                color: {TEXT};
-                border: 1px solid {BORDER};
-                selection-background-color: {ORANGE};
-                selection-color: {BG};
-            }}
-
-            /* -------------------------
-            SCROLLBARS
-            --------------------------*/
-            QScrollBar:vertical {{
-                background: {PANEL};
-                width: 12px;
-                margin: 0px;
-                border-radius: 6px;
-            }}
-            QScrollBar::handle:vertical {{
-                background: {ORANGE};
-                min-height: 24px;
-                border-radius: 6px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background: {ORANGE_HOVER};
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0px;
-            }}
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
-                background: none;
-            }}
-
-            /* -------------------------
-            BUTTONS
-            --------------------------*/
-            QPushButton {{
-                background-color: {PANEL_2};
-                color: {TEXT};
-                border: 1px solid {BORDER};
-                border-radius: 10px;
-                padding: 8px 14px;
-            }}
-
-            QPushButton:hover {{
-                border: 1px solid {ORANGE};
-            }}
-
-            QPushButton#primaryButton {{
-                background-color: {ORANGE};
-                color: {BG};
-                font-weight: bold;
-                border: 1px solid {ORANGE};
-            }}
-
-            QPushButton#primaryButton:hover {{
-                background-color: {ORANGE_HOVER};
-                border: 1px solid {ORANGE_HOVER};
-            }}
-
-            QPushButton#primaryButton:pressed {{
-                background-color: {ORANGE_PRESSED};
-                border: 1px solid {ORANGE_PRESSED};
-            }}
-
-            QPushButton#secondaryButton {{
-                background-color: {PANEL_2};
-                color: {TEXT};
-            }}
-
-            QPushButton#secondaryButton:hover {{
-                border: 1px solid {ORANGE};
-            }}
-
-            QPushButton:disabled {{
-                background-color: {PANEL};
-                color: #7C849A;
-                border: 1px solid {BORDER};
-            }}
-
-            /* -------------------------
-            TOOLTIP
-            --------------------------*/
-            QToolTip {{
-                background-color: {PANEL};
-                color: {TEXT};
-                border: 1px solid {ORANGE};
-                padding: 6px;
-            }}
-            """
-        )
+        app.setStyleSheet(_STYLESHEET)
 
 
 
@@ -585,11 +837,12 @@ def main() -> None:
     """Application entry point."""
     app = QtWidgets.QApplication(sys.argv)
 
-    # Optional: try to use a nicer font if available
-    font = QtGui.QFont("Poppins", 10)
-    if not QtGui.QFontInfo(font).family():
-        font = QtGui.QFont("Segoe UI", 10)  # fallback
-    app.setFont(font)
+    # Optional: try to use a nicer font if available. Checking the font
+    # database directly avoids running Qt's font-substitution pipeline
+    # on systems where Poppins is missing.
+    families = set(QtGui.QFontDatabase().families())
+    name = "Poppins" if "Poppins" in families else "Segoe UI"
+    app.setFont(QtGui.QFont(name, 10))
 
     window = MainWindow()
     window.showMaximized()
@@ -13,13 +13,18 @@ Notes
 - User can override cost per block in the GUI at any time.
 """
 
-from dataclasses import dataclass
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, NamedTuple, Tuple
 
 
-@dataclass
-class BlockType:
-    """Represents a block size and commercial info."""
+class BlockType(NamedTuple):
+    """
+    Represents a block size and commercial info.
+
+    A NamedTuple rather than a dataclass: instances carry no __dict__,
+    and attribute access is C-level tuple indexing on the hot
+    area-to-block-count path.
+    """
     name: str
     length_m: float        # length along the wall (m)
     height_m: float        # vertical dimension (m)
@@ -158,17 +163,53 @@ BLOCK_TYPES: Dict[str, BlockType] = {
 # }
 
 
-def get_block_names() -> List[str]:
+# ----------------------------------------------------------------------
+# Structure-of-arrays view, built once at import time.
+#
+# Parallel tuples over the block catalogue in a stable order, so hot
+# lookups (combo population, area -> block count) index plain tuples
+# instead of re-iterating the dict and crossing dataclass attributes.
+# ----------------------------------------------------------------------
+
+BLOCK_NAMES: Tuple[str, ...] = tuple(BLOCK_TYPES)
+LENGTH_M: Tuple[float, ...] = tuple(b.length_m for b in BLOCK_TYPES.values())
+HEIGHT_M: Tuple[float, ...] = tuple(b.height_m for b in BLOCK_TYPES.values())
+THICKNESS_M: Tuple[float, ...] = tuple(b.thickness_m for b in BLOCK_TYPES.values())
+BLOCKS_PER_PALLET: Tuple[int, ...] = tuple(b.blocks_per_pallet for b in BLOCK_TYPES.values())
+DEFAULT_COST_USD: Tuple[float, ...] = tuple(b.default_cost_usd for b in BLOCK_TYPES.values())
+
+# Precomputed face area (length x height) per block, m²
+FACE_AREA_M2: Tuple[float, ...] = tuple(
+    length * height for length, height in zip(LENGTH_M, HEIGHT_M)
+)
+
+_NAME_TO_INDEX: Dict[str, int] = {name: i for i, name in enumerate(BLOCK_NAMES)}
+
+
+def get_block_index(name: str) -> int:
+    """
+    Return the index of a block name into the parallel tuples above.
+    Raises KeyError if not found.
     """
-    Return the list of available block type names
+    return _NAME_TO_INDEX[name]
+
+
+@lru_cache(maxsize=1)
+def get_block_names() -> Tuple[str, ...]:
+    """
+    Return the available block type names
     in a stable order for use in drop-downs.
     """
-    return list(BLOCK_TYPES.keys())
+    return BLOCK_NAMES
 
 
+@lru_cache(maxsize=None)
 def get_block_type(name: str) -> BlockType:
     """
     Safely retrieve a BlockType by name.
     Raises KeyError if not found.
+
+    Cached: the catalogue is effectively immutable at runtime, so
+    repeated lookups on the recalculation path are O(1) cache hits.
     """
     return BLOCK_TYPES[name]
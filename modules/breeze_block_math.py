@@ -0,0 +1,59 @@
+"""
+breeze_block_math.py
+
+The arithmetic behind the breeze block tab, kept free of Qt imports so
+it can be driven in batch (what-if sweeps over reactor geometries) or
+profiled standalone. The GUI's single-shot calculation goes through the
+same functions, so there is exactly one implementation of the formulas.
+"""
+
+import math
+from typing import List, Sequence
+
+_PI = math.pi
+
+
+def reactor_wall_area(length_m: float, width_m: float, height_m: float) -> float:
+    """
+    Wall area of one raceway reactor.
+
+    Geometry: two long side walls plus one central wall (all length L)
+    and two end arches of radius W/2, i.e. A = H * (3·L + π·W).
+    """
+    return height_m * (3.0 * length_m + _PI * width_m)
+
+
+def blocks_for_area(total_area_m2: float, face_area_m2: float) -> int:
+    """Blocks needed to cover an area, rounded up; 0 for empty input."""
+    if total_area_m2 <= 0.0 or face_area_m2 <= 0.0:
+        return 0
+    return math.ceil(total_area_m2 / face_area_m2)
+
+
+def pallets_for_blocks(blocks: int, blocks_per_pallet: int) -> int:
+    """Pallets holding `blocks`, via exact integer ceiling division."""
+    if blocks <= 0:
+        return 0
+    return -(-blocks // max(1, blocks_per_pallet))
+
+
+def blocks_for_sweep(
+    lengths: Sequence[float],
+    widths: Sequence[float],
+    heights: Sequence[float],
+    counts: Sequence[int],
+    face_area_m2: float,
+) -> List[int]:
+    """
+    Blocks required for each (L, W, H, count) reactor scenario.
+
+    Plain-Python batch loop with the hot names bound locally; fast
+    enough for the few-thousand-point sweeps a cost-curve panel needs
+    without pulling a numeric dependency into the app.
+    """
+    area = reactor_wall_area
+    blocks = blocks_for_area
+    return [
+        blocks(n * area(length, width, height), face_area_m2)
+        for length, width, height, n in zip(lengths, widths, heights, counts)
+    ]
@@ -40,13 +40,17 @@ Features
 """
 
 import math
+from contextlib import ExitStack
 from typing import Optional
 
 from PyQt5 import QtCore, QtWidgets
 
 # from block_data import get_block_names, get_block_type, BlockType
 from .block_data import get_block_names, get_block_type, BlockType
+from .breeze_block_math import blocks_for_area, pallets_for_blocks, reactor_wall_area
 
+# Hoisted so the hot calculate path skips the math-module attribute lookup.
+_PI = math.pi
 
 
 class BreezeBlockTab(QtWidgets.QWidget):
@@ -61,6 +65,10 @@ class BreezeBlockTab(QtWidgets.QWidget):
     # ------------------------------------------------------------------
 
     def export_state(self) -> dict:
+        # The arc/reactor groups build lazily; materialize them so the
+        # saved schema stays stable.
+        self._ensure_arc_group()
+        self._ensure_reactor_group()
         return {
             "block_name": self.block_combo.currentText(),
             "cost_per_block": float(self.cost_per_block_spin.value()),
@@ -94,6 +102,9 @@ class BreezeBlockTab(QtWidgets.QWidget):
         self.wall_height_spin.setValue(float(state.get("wall_height", 0.0)))
         self.wall_count_spin.setValue(int(state.get("wall_count", 1)))
 
+        self._ensure_arc_group()
+        self._ensure_reactor_group()
+
         self.arc_radius_spin.setValue(float(state.get("arc_radius", 0.0)))
         self.arc_height_spin.setValue(float(state.get("arc_height", 0.0)))
         self.arc_count_spin.setValue(int(state.get("arc_count", 0)))
@@ -103,6 +114,14 @@ class BreezeBlockTab(QtWidgets.QWidget):
         self.reactor_height_spin.setValue(float(state.get("reactor_height", 0.0)))
         self.reactor_count_spin.setValue(int(state.get("reactor_count", 0)))
 
+        # Expand the groups that actually carry data so loaded values
+        # are visible and included in the next calculation.
+        self.arc_group.setChecked(self.arc_count_spin.value() > 0)
+        self.reactor_group.setChecked(self.reactor_count_spin.value() > 0)
+
+        # Explicit bump: widget signals may be blocked during a bulk apply.
+        self._bump_state_version()
+
 
 
 
@@ -110,6 +129,26 @@ class BreezeBlockTab(QtWidgets.QWidget):
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
         self._current_block: Optional[BlockType] = None
+        self._state_version = 0
+        # Numeric mirror of lbl_total_cost, read by the Summary tab
+        # so it never has to parse the formatted string back.
+        self.total_cost_value = 0.0
+        # Monotonic counter bumped whenever the result labels are
+        # rewritten; the Summary tab uses it to skip stale-free
+        # refreshes.
+        self.results_version = 0
+
+        # Last text written per result label; lets a recalculation skip
+        # setText (and the repaint it triggers) when nothing changed.
+        self._last_results: dict = {}
+
+        # Debounce timer: rapid calculate requests (e.g. if inputs are
+        # later wired to valueChanged) collapse into one recompute.
+        self._recalc_timer = QtCore.QTimer(self)
+        self._recalc_timer.setSingleShot(True)
+        self._recalc_timer.setInterval(16)  # ~one frame
+        self._recalc_timer.timeout.connect(self._do_calculate)
+
         self._build_ui()
         self._connect_signals()
         self._load_initial_block_type()
@@ -183,57 +222,26 @@ class BreezeBlockTab(QtWidgets.QWidget):
         wall_form.addRow("Wall height:", self.wall_height_spin)
         wall_form.addRow("Number of walls:", self.wall_count_spin)
 
-        # -------- Arc inputs --------
-        arc_group = QtWidgets.QGroupBox("Half-circle Arcs (General)", content_widget)
-        arc_form = QtWidgets.QFormLayout(arc_group)
-        arc_form.setLabelAlignment(QtCore.Qt.AlignRight)
-
-        self.arc_radius_spin = QtWidgets.QDoubleSpinBox(arc_group)
-        self.arc_radius_spin.setSuffix(" m")
-        self.arc_radius_spin.setDecimals(3)
-        self.arc_radius_spin.setRange(0.0, 1000.0)
-
-        self.arc_height_spin = QtWidgets.QDoubleSpinBox(arc_group)
-        self.arc_height_spin.setSuffix(" m")
-        self.arc_height_spin.setDecimals(3)
-        self.arc_height_spin.setRange(0.0, 100.0)
-
-        self.arc_count_spin = QtWidgets.QSpinBox(arc_group)
-        self.arc_count_spin.setRange(0, 9999)
-        self.arc_count_spin.setValue(0)
-
-        arc_form.addRow("Arc radius:", self.arc_radius_spin)
-        arc_form.addRow("Arc height:", self.arc_height_spin)
-        arc_form.addRow("Number of arcs:", self.arc_count_spin)
-
-        # -------- Reactor inputs --------
-        reactor_group = QtWidgets.QGroupBox("Reactors (Raceway Walls)", content_widget)
-        reactor_form = QtWidgets.QFormLayout(reactor_group)
-        reactor_form.setLabelAlignment(QtCore.Qt.AlignRight)
-
-        self.reactor_length_spin = QtWidgets.QDoubleSpinBox(reactor_group)
-        self.reactor_length_spin.setSuffix(" m")
-        self.reactor_length_spin.setDecimals(3)
-        self.reactor_length_spin.setRange(0.0, 10000.0)
-
-        self.reactor_width_spin = QtWidgets.QDoubleSpinBox(reactor_group)
-        self.reactor_width_spin.setSuffix(" m")
-        self.reactor_width_spin.setDecimals(3)
-        self.reactor_width_spin.setRange(0.0, 10000.0)
-
-        self.reactor_height_spin = QtWidgets.QDoubleSpinBox(reactor_group)
-        self.reactor_height_spin.setSuffix(" m")
-        self.reactor_height_spin.setDecimals(3)
-        self.reactor_height_spin.setRange(0.0, 100.0)
-
-        self.reactor_count_spin = QtWidgets.QSpinBox(reactor_group)
-        self.reactor_count_spin.setRange(0, 9999)
-        self.reactor_count_spin.setValue(0)
+        # -------- Arc + reactor inputs (built on first expansion) --------
+        # Many projects never touch arcs or reactors, so these groups
+        # start collapsed (unchecked) and construct their spin boxes the
+        # first time the user ticks them — roughly halving the widgets
+        # built when the tab first shows.
+        self.arc_group = QtWidgets.QGroupBox(
+            "Half-circle Arcs (General)", content_widget
+        )
+        self.arc_group.setCheckable(True)
+        self.arc_group.setChecked(False)
+        self._arc_built = False
+        self.arc_group.toggled.connect(self._on_arc_group_toggled)
 
-        reactor_form.addRow("Reactor length L:", self.reactor_length_spin)
-        reactor_form.addRow("Reactor width W:", self.reactor_width_spin)
-        reactor_form.addRow("Reactor wall height H:", self.reactor_height_spin)
-        reactor_form.addRow("Number of reactors:", self.reactor_count_spin)
+        self.reactor_group = QtWidgets.QGroupBox(
+            "Reactors (Raceway Walls)", content_widget
+        )
+        self.reactor_group.setCheckable(True)
+        self.reactor_group.setChecked(False)
+        self._reactor_built = False
+        self.reactor_group.toggled.connect(self._on_reactor_group_toggled)
 
         reactor_note = QtWidgets.QLabel(
             "Reactor geometry:\n"
@@ -283,8 +291,8 @@ class BreezeBlockTab(QtWidgets.QWidget):
         # -------- Add groups to scrollable layout --------
         content_layout.addWidget(block_group)
         content_layout.addWidget(wall_group)
-        content_layout.addWidget(arc_group)
-        content_layout.addWidget(reactor_group)
+        content_layout.addWidget(self.arc_group)
+        content_layout.addWidget(self.reactor_group)
         content_layout.addWidget(reactor_note)
         content_layout.addLayout(button_layout)
         content_layout.addWidget(result_group)
@@ -293,6 +301,90 @@ class BreezeBlockTab(QtWidgets.QWidget):
         scroll_area.setWidget(content_widget)
         outer_layout.addWidget(scroll_area)
 
+    # ------------------------------------------------------------------
+    # Deferred group construction
+    # ------------------------------------------------------------------
+
+    def _on_arc_group_toggled(self, on: bool) -> None:
+        if on:
+            self._ensure_arc_group()
+
+    def _on_reactor_group_toggled(self, on: bool) -> None:
+        if on:
+            self._ensure_reactor_group()
+
+    def _ensure_arc_group(self) -> None:
+        """Build the arc input widgets on first use."""
+        if self._arc_built:
+            return
+        self._arc_built = True
+
+        arc_form = QtWidgets.QFormLayout(self.arc_group)
+        arc_form.setLabelAlignment(QtCore.Qt.AlignRight)
+
+        self.arc_radius_spin = QtWidgets.QDoubleSpinBox(self.arc_group)
+        self.arc_radius_spin.setSuffix(" m")
+        self.arc_radius_spin.setDecimals(3)
+        self.arc_radius_spin.setRange(0.0, 1000.0)
+
+        self.arc_height_spin = QtWidgets.QDoubleSpinBox(self.arc_group)
+        self.arc_height_spin.setSuffix(" m")
+        self.arc_height_spin.setDecimals(3)
+        self.arc_height_spin.setRange(0.0, 100.0)
+
+        self.arc_count_spin = QtWidgets.QSpinBox(self.arc_group)
+        self.arc_count_spin.setRange(0, 9999)
+        self.arc_count_spin.setValue(0)
+
+        arc_form.addRow("Arc radius:", self.arc_radius_spin)
+        arc_form.addRow("Arc height:", self.arc_height_spin)
+        arc_form.addRow("Number of arcs:", self.arc_count_spin)
+
+        # Widgets built after _connect_signals ran wire themselves up.
+        for spin in (self.arc_radius_spin, self.arc_height_spin, self.arc_count_spin):
+            spin.valueChanged.connect(self._bump_state_version)
+
+    def _ensure_reactor_group(self) -> None:
+        """Build the reactor input widgets on first use."""
+        if self._reactor_built:
+            return
+        self._reactor_built = True
+
+        reactor_form = QtWidgets.QFormLayout(self.reactor_group)
+        reactor_form.setLabelAlignment(QtCore.Qt.AlignRight)
+
+        self.reactor_length_spin = QtWidgets.QDoubleSpinBox(self.reactor_group)
+        self.reactor_length_spin.setSuffix(" m")
+        self.reactor_length_spin.setDecimals(3)
+        self.reactor_length_spin.setRange(0.0, 10000.0)
+
+        self.reactor_width_spin = QtWidgets.QDoubleSpinBox(self.reactor_group)
+        self.reactor_width_spin.setSuffix(" m")
+        self.reactor_width_spin.setDecimals(3)
+        self.reactor_width_spin.setRange(0.0, 10000.0)
+
+        self.reactor_height_spin = QtWidgets.QDoubleSpinBox(self.reactor_group)
+        self.reactor_height_spin.setSuffix(" m")
+        self.reactor_height_spin.setDecimals(3)
+        self.reactor_height_spin.setRange(0.0, 100.0)
+
+        self.reactor_count_spin = QtWidgets.QSpinBox(self.reactor_group)
+        self.reactor_count_spin.setRange(0, 9999)
+        self.reactor_count_spin.setValue(0)
+
+        reactor_form.addRow("Reactor length L:", self.reactor_length_spin)
+        reactor_form.addRow("Reactor width W:", self.reactor_width_spin)
+        reactor_form.addRow("Reactor wall height H:", self.reactor_height_spin)
+        reactor_form.addRow("Number of reactors:", self.reactor_count_spin)
+
+        for spin in (
+            self.reactor_length_spin,
+            self.reactor_width_spin,
+            self.reactor_height_spin,
+            self.reactor_count_spin,
+        ):
+            spin.valueChanged.connect(self._bump_state_version)
+
     # ------------------------------------------------------------------
     # Signal wiring
     # ------------------------------------------------------------------
@@ -302,6 +394,20 @@ class BreezeBlockTab(QtWidgets.QWidget):
         self.block_combo.currentTextChanged.connect(self._on_block_changed)
         self.calculate_button.clicked.connect(self._on_calculate_clicked)
         self.reset_button.clicked.connect(self._on_reset_clicked)
+        self._connect_state_version_signals()
+
+    def _connect_state_version_signals(self) -> None:
+        """
+        Bump the state version on any input edit so cached export_state
+        snapshots (see MainWindow._collect_project_state) stay valid.
+        """
+        for spin in self.findChildren((QtWidgets.QSpinBox, QtWidgets.QDoubleSpinBox)):
+            spin.valueChanged.connect(self._bump_state_version)
+        for combo in self.findChildren(QtWidgets.QComboBox):
+            combo.currentIndexChanged.connect(self._bump_state_version)
+
+    def _bump_state_version(self, *_args) -> None:
+        self._state_version += 1
 
     # ------------------------------------------------------------------
     # Initial state / helpers
@@ -329,17 +435,30 @@ class BreezeBlockTab(QtWidgets.QWidget):
             return
 
         self._current_block = block
-        # Set default cost but don't block user edits later.
-        self.cost_per_block_spin.blockSignals(True)
-        self.cost_per_block_spin.setValue(block.default_cost_usd)
-        self.cost_per_block_spin.blockSignals(False)
+        # Set default cost but don't block user edits later. QSignalBlocker
+        # restores signal state even if setValue raises, and the guard
+        # avoids a redundant write (plus repaint) when the value already
+        # matches — e.g. re-selecting the same block.
+        if self.cost_per_block_spin.value() != block.default_cost_usd:
+            blocker = QtCore.QSignalBlocker(self.cost_per_block_spin)
+            self.cost_per_block_spin.setValue(block.default_cost_usd)
+            del blocker
 
     # ------------------------------------------------------------------
     # Slots
     # ------------------------------------------------------------------
 
     def _on_calculate_clicked(self) -> None:
+        """Button handler: funnel through the debounce timer."""
+        self._schedule_calculate()
+
+    def _schedule_calculate(self) -> None:
+        """Start (or restart) the single-shot recalc timer."""
+        self._recalc_timer.start()
+
+    def _do_calculate(self) -> None:
         """Perform the block, pallet and cost calculations."""
+        self._recalc_timer.stop()
 
         if self._current_block is None:
             QtWidgets.QMessageBox.warning(
@@ -349,26 +468,38 @@ class BreezeBlockTab(QtWidgets.QWidget):
             )
             return
 
+        # Read the block attributes once; they are fixed for this pass.
         block = self._current_block
+        block_face_area = block.length_m * block.height_m
+        blocks_per_pallet = max(1, block.blocks_per_pallet)
 
         # -------- Gather input values --------
+        # Qt already hands back float/int here; no conversion needed.
         # Straight walls
-        wall_length = float(self.wall_length_spin.value())
-        wall_height = float(self.wall_height_spin.value())
-        wall_count = int(self.wall_count_spin.value())
-
-        # Generic arcs
-        arc_radius = float(self.arc_radius_spin.value())
-        arc_height = float(self.arc_height_spin.value())
-        arc_count = int(self.arc_count_spin.value())
-
-        # Reactors
-        reactor_length = float(self.reactor_length_spin.value())
-        reactor_width = float(self.reactor_width_spin.value())
-        reactor_height = float(self.reactor_height_spin.value())
-        reactor_count = int(self.reactor_count_spin.value())
+        wall_length = self.wall_length_spin.value()
+        wall_height = self.wall_height_spin.value()
+        wall_count = self.wall_count_spin.value()
+
+        # Generic arcs (zero contribution while collapsed/never built)
+        if self._arc_built and self.arc_group.isChecked():
+            arc_radius = self.arc_radius_spin.value()
+            arc_height = self.arc_height_spin.value()
+            arc_count = self.arc_count_spin.value()
+        else:
+            arc_radius = arc_height = 0.0
+            arc_count = 0
+
+        # Reactors (same deal)
+        if self._reactor_built and self.reactor_group.isChecked():
+            reactor_length = self.reactor_length_spin.value()
+            reactor_width = self.reactor_width_spin.value()
+            reactor_height = self.reactor_height_spin.value()
+            reactor_count = self.reactor_count_spin.value()
+        else:
+            reactor_length = reactor_width = reactor_height = 0.0
+            reactor_count = 0
 
-        cost_per_block = float(self.cost_per_block_spin.value())
+        cost_per_block = self.cost_per_block_spin.value()
 
         # -------- Compute wall areas --------
         # Straight walls
@@ -379,7 +510,7 @@ class BreezeBlockTab(QtWidgets.QWidget):
 
         # Generic half-circle arcs: arc length = π * radius, area = length * height
         if arc_radius > 0 and arc_height > 0 and arc_count > 0:
-            arc_area_per = math.pi * arc_radius * arc_height
+            arc_area_per = _PI * arc_radius * arc_height
             arc_area_total = arc_area_per * arc_count
         else:
             arc_area_total = 0.0
@@ -391,46 +522,69 @@ class BreezeBlockTab(QtWidgets.QWidget):
             and reactor_height > 0
             and reactor_count > 0
         ):
-            R = reactor_width / 2.0  # radius of each end arch
-            # Total straight length per reactor: 3 * L
-            straight_length = 3.0 * reactor_length
-            # Total arch length per reactor: 2 * (π * R)
-            arch_length = 2.0 * math.pi * R
-            wall_length_per_reactor = straight_length + arch_length
-            reactor_area_total = wall_length_per_reactor * reactor_height * reactor_count
+            reactor_area_total = (
+                reactor_wall_area(reactor_length, reactor_width, reactor_height)
+                * reactor_count
+            )
         else:
             reactor_area_total = 0.0
 
         total_area = wall_area + arc_area_total + reactor_area_total
 
         # -------- Compute blocks and pallets --------
-        block_face_area = block.length_m * block.height_m
-        if block_face_area > 0 and total_area > 0:
-            blocks_required = math.ceil(total_area / block_face_area)
-        else:
-            blocks_required = 0
-
-        blocks_per_pallet = max(1, block.blocks_per_pallet)
+        blocks_required = blocks_for_area(total_area, block_face_area)
+        pallets_required = pallets_for_blocks(blocks_required, blocks_per_pallet)
         if blocks_required > 0:
-            pallets_required = math.ceil(blocks_required / blocks_per_pallet)
             leftover_blocks = pallets_required * blocks_per_pallet - blocks_required
         else:
-            pallets_required = 0
             leftover_blocks = 0
 
         total_cost = blocks_required * cost_per_block
 
-        # -------- Update labels --------
-        self.lbl_wall_area.setText(f"{wall_area:,.2f} m²")
-        self.lbl_arc_area.setText(f"{arc_area_total:,.2f} m²")
-        self.lbl_reactor_area.setText(f"{reactor_area_total:,.2f} m²")
-        self.lbl_total_area.setText(f"{total_area:,.2f} m²")
-        self.lbl_blocks.setText(f"{blocks_required:,d} blocks")
-        self.lbl_pallets.setText(f"{pallets_required:,d} pallets")
-        self.lbl_leftover.setText(f"{leftover_blocks:,d} blocks")
-        self.lbl_total_cost.setText(f"${total_cost:,.2f}")
+        # -------- Update labels (one repaint for the batch) --------
+        self.setUpdatesEnabled(False)
+        try:
+            set_result = self._set_result
+            set_result(self.lbl_wall_area, f"{wall_area:,.2f} m²")
+            set_result(self.lbl_arc_area, f"{arc_area_total:,.2f} m²")
+            set_result(self.lbl_reactor_area, f"{reactor_area_total:,.2f} m²")
+            set_result(self.lbl_total_area, f"{total_area:,.2f} m²")
+            set_result(self.lbl_blocks, f"{blocks_required:,d} blocks")
+            set_result(self.lbl_pallets, f"{pallets_required:,d} pallets")
+            set_result(self.lbl_leftover, f"{leftover_blocks:,d} blocks")
+            set_result(self.lbl_total_cost, f"${total_cost:,.2f}")
+            self.total_cost_value = total_cost
+            self.results_version += 1
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+
+    def _set_result(self, label: QtWidgets.QLabel, text: str) -> None:
+        """Write a result label only if its text actually changed."""
+        if self._last_results.get(label) != text:
+            self._last_results[label] = text
+            label.setText(text)
 
     def _on_reset_clicked(self) -> None:
+        """
+        Reset to defaults with input signals blocked, so the burst of
+        widget writes does not fire connected slots once per assignment.
+        """
+        with ExitStack() as stack:
+            for w in self.findChildren(
+                (
+                    QtWidgets.QLineEdit,
+                    QtWidgets.QSpinBox,
+                    QtWidgets.QDoubleSpinBox,
+                    QtWidgets.QComboBox,
+                )
+            ):
+                stack.enter_context(QtCore.QSignalBlocker(w))
+            self._apply_defaults()
+        # Blocked signals also suppress the version bump; do it once here.
+        self._bump_state_version()
+
+    def _apply_defaults(self) -> None:
         """
         Reset all inputs to sensible defaults and clear results.
         """
@@ -439,22 +593,28 @@ class BreezeBlockTab(QtWidgets.QWidget):
         self.wall_height_spin.setValue(0.0)
         self.wall_count_spin.setValue(1)
 
-        # Generic arcs
-        self.arc_radius_spin.setValue(0.0)
-        self.arc_height_spin.setValue(0.0)
-        self.arc_count_spin.setValue(0)
+        # Generic arcs (only if ever built; collapse either way)
+        if self._arc_built:
+            self.arc_radius_spin.setValue(0.0)
+            self.arc_height_spin.setValue(0.0)
+            self.arc_count_spin.setValue(0)
+        self.arc_group.setChecked(False)
 
         # Reactors
-        self.reactor_length_spin.setValue(0.0)
-        self.reactor_width_spin.setValue(0.0)
-        self.reactor_height_spin.setValue(0.0)
-        self.reactor_count_spin.setValue(0)
+        if self._reactor_built:
+            self.reactor_length_spin.setValue(0.0)
+            self.reactor_width_spin.setValue(0.0)
+            self.reactor_height_spin.setValue(0.0)
+            self.reactor_count_spin.setValue(0)
+        self.reactor_group.setChecked(False)
 
         # Reset cost to default for selected block
         if self._current_block is not None:
             self.cost_per_block_spin.setValue(self._current_block.default_cost_usd)
 
-        # Clear results
+        # Clear results (labels are written directly here, so drop the
+        # dirty-check cache too or the next recalc could skip updates)
+        self._last_results.clear()
         self.lbl_wall_area.setText("0.00 m²")
         self.lbl_arc_area.setText("0.00 m²")
         self.lbl_reactor_area.setText("0.00 m²")
@@ -463,6 +623,8 @@ class BreezeBlockTab(QtWidgets.QWidget):
         self.lbl_pallets.setText("0 pallets")
         self.lbl_leftover.setText("0 blocks")
         self.lbl_total_cost.setText("$0.00")
+        self.total_cost_value = 0.0
+        self.results_version += 1
 
 
 
@@ -0,0 +1,89 @@
+"""
+concrete_math.py
+
+Geometry kernel behind the concrete works tab, free of Qt imports so it
+can be batch-driven (sensitivity sweeps over dimensions or counts) or
+exercised standalone. The GUI's single-shot path and any future sweep
+share the same _ELEMENT_SPECS table, so each formula exists once.
+"""
+
+from functools import lru_cache
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+
+class _ElementSpec(NamedTuple):
+    """Everything element-specific in one row: inputs, formulas, error."""
+    input_keys: Tuple[str, str, str, Optional[str]]   # (L, x, T_cm, count or None)
+    vol_fn: Callable[[float, float, float, int], float]
+    form_fn: Callable[[float, float, float, int], float]
+    error_msg: str
+
+
+# Indexed by element_type_combo position. `x` is the width for
+# slabs/footings and the height for walls; `t` is already in metres.
+_ELEMENT_SPECS: Tuple[_ElementSpec, ...] = (
+    _ElementSpec(
+        ("slab_length", "slab_width", "slab_thickness_cm", "slab_count"),
+        lambda L, x, t, n: L * x * t * n,
+        lambda L, x, t, n: 2.0 * (L + x) * t * n,
+        "For slabs, length, width, thickness and count must all be > 0.",
+    ),
+    _ElementSpec(
+        ("strip_length", "strip_width", "strip_thickness_cm", None),
+        lambda L, x, t, n: L * x * t,
+        lambda L, x, t, n: 2.0 * L * t,   # cast in a trench; side faces only
+        "For strip footings, length, width and thickness must all be > 0.",
+    ),
+    _ElementSpec(
+        ("wall_length", "wall_height", "wall_thickness_cm", "wall_count"),
+        lambda L, x, t, n: L * x * t * n,
+        lambda L, x, t, n: 2.0 * L * x * n,   # both faces formed
+        "For walls, length, height, thickness and count must all be > 0.",
+    ),
+    _ElementSpec(
+        ("iso_length", "iso_width", "iso_thickness_cm", "iso_count"),
+        lambda L, x, t, n: L * x * t * n,
+        lambda L, x, t, n: 2.0 * (L + x) * t * n,
+        "For isolated footings, length, width, thickness and count must all be > 0.",
+    ),
+)
+
+
+@lru_cache(maxsize=64)
+def _geom_core(element_index: int, L: float, x: float, t_cm: float, n: int) -> Tuple[float, float]:
+    """
+    Pure geometry core: (volume m³, formwork area m²) for one element,
+    dispatched through _ELEMENT_SPECS. Keyed on the raw inputs so
+    repeated identical recalculations — Calculate mashing, silent
+    post-load recalcs — return the cached pair without re-running the
+    arithmetic. Validation stays with the caller.
+    """
+    if not 0 <= element_index < len(_ELEMENT_SPECS):
+        raise ValueError("Unknown element type index.")
+    spec = _ELEMENT_SPECS[element_index]
+    t = t_cm / 100.0
+    return spec.vol_fn(L, x, t, n), spec.form_fn(L, x, t, n)
+
+
+def geom_core_batch(
+    element_indices: Sequence[int],
+    lengths: Sequence[float],
+    xs: Sequence[float],
+    thicknesses_cm: Sequence[float],
+    counts: Sequence[int],
+) -> List[Tuple[float, float]]:
+    """
+    Evaluate the geometry core over parallel scenario sequences,
+    returning one (volume, formwork area) pair per scenario.
+
+    Bypasses the lru_cache deliberately — sweep inputs rarely repeat,
+    and filling the cache with them would evict the GUI's entries.
+    """
+    specs = _ELEMENT_SPECS
+    out: List[Tuple[float, float]] = []
+    append = out.append
+    for idx, L, x, t_cm, n in zip(element_indices, lengths, xs, thicknesses_cm, counts):
+        spec = specs[idx]
+        t = t_cm / 100.0
+        append((spec.vol_fn(L, x, t, n), spec.form_fn(L, x, t, n)))
+    return out
@@ -91,10 +91,13 @@ All dimensions are in meters unless noted.
 
 from __future__ import annotations
 
+from contextlib import ExitStack
 from typing import Optional
 
 from PyQt5 import QtCore, QtWidgets
 
+from .concrete_math import _ELEMENT_SPECS, _geom_core
+
 
 class ConcreteTab(QtWidgets.QWidget):
     """
@@ -102,6 +105,14 @@ class ConcreteTab(QtWidgets.QWidget):
     Designed to be dropped into a QTabWidget.
     """
 
+    # Pre-bound format callables: the spec string is parsed once here
+    # instead of inside an f-string on every recompute.
+    _FMT_VOLUME = "{:,.3f} m³".format
+    _FMT_KG = "{:,.0f} kg".format
+    _FMT_AREA = "{:,.2f} m²".format
+    _FMT_TONS = "{:,.3f} t".format
+    _FMT_MONEY = "${:,.2f}".format
+
     # ------------------------------------------------------------------
     # Project Save/Load
     # ------------------------------------------------------------------
@@ -110,45 +121,47 @@ class ConcreteTab(QtWidgets.QWidget):
         """
         Return a JSON-serializable snapshot of ConcreteTab inputs.
         Keep keys stable for project-file compatibility.
+
+        The snapshot is cached against _state_version: back-to-back
+        saves with no edits in between reuse it instead of re-reading
+        every widget.
         """
-        return {
-            "element_type_index": int(self.element_type_combo.currentIndex()),
-
-            # Slab / base
-            "slab_length": float(self.slab_length_spin.value()),
-            "slab_width": float(self.slab_width_spin.value()),
-            "slab_thickness_cm": float(self.slab_thickness_spin.value()),
-            "slab_count": int(self.slab_count_spin.value()),
-
-            # Strip footing
-            "strip_length": float(self.strip_length_spin.value()),
-            "strip_width": float(self.strip_width_spin.value()),
-            "strip_thickness_cm": float(self.strip_thickness_spin.value()),
-
-            # Wall
-            "wall_length": float(self.wall_length_spin.value()),
-            "wall_height": float(self.wall_height_spin.value()),
-            "wall_thickness_cm": float(self.wall_thickness_spin.value()),
-            "wall_count": int(self.wall_count_spin.value()),
-
-            # Isolated footing
-            "iso_length": float(self.iso_length_spin.value()),
-            "iso_width": float(self.iso_width_spin.value()),
-            "iso_thickness_cm": float(self.iso_thickness_spin.value()),
-            "iso_count": int(self.iso_count_spin.value()),
-
-            # Materials
-            "conc_density": float(self.conc_density_spin.value()),
-            "conc_cost": float(self.conc_cost_spin.value()),
-            "rebar_intensity": float(self.rebar_intensity_spin.value()),
-            "rebar_cost_per_t": float(self.rebar_cost_spin.value()),
-            "formwork_rate": float(self.formwork_rate_spin.value()),
-        }
+        if (
+            self._cached_state is not None
+            and self._cached_state_version == self._state_version
+        ):
+            return dict(self._cached_state)
+
+        # _spin_map's keys are the project-file keys; Qt returns int for
+        # QSpinBox and float for QDoubleSpinBox, matching the schema.
+        # Lazy geometry forms must all exist for a complete snapshot.
+        self._ensure_all_geom_widgets()
+        state = {"element_type_index": int(self.element_type_combo.currentIndex())}
+        state.update({name: spin.value() for name, spin in self._spin_map.items()})
+
+        self._cached_state = state
+        self._cached_state_version = self._state_version
+        return dict(state)
+
+    # Fallback per project key when absent from a loaded state;
+    # None means keep whatever the widget currently shows (used for the
+    # materials inputs, preserving backwards compatibility).
+    _IMPORT_DEFAULTS = {
+        "slab_length": 0.0, "slab_width": 0.0, "slab_thickness_cm": 0.0, "slab_count": 1,
+        "strip_length": 0.0, "strip_width": 0.0, "strip_thickness_cm": 0.0,
+        "wall_length": 0.0, "wall_height": 0.0, "wall_thickness_cm": 0.0, "wall_count": 1,
+        "iso_length": 0.0, "iso_width": 0.0, "iso_thickness_cm": 0.0, "iso_count": 1,
+        "conc_density": None, "conc_cost": None, "rebar_intensity": None,
+        "rebar_cost_per_t": None, "formwork_rate": None,
+    }
 
     def import_state(self, state: dict) -> None:
         """
         Restore ConcreteTab inputs from a saved project snapshot.
         Missing keys fall back to existing widget values (backwards compatible).
+
+        All writes happen with per-widget signals blocked, followed by a
+        single silent recalculate — not one recompute per setValue.
         """
         if not isinstance(state, dict):
             return
@@ -157,35 +170,22 @@ class ConcreteTab(QtWidgets.QWidget):
         if 0 <= idx < self.element_type_combo.count():
             self.element_type_combo.setCurrentIndex(idx)
 
-        # Slab
-        self.slab_length_spin.setValue(float(state.get("slab_length", 0.0)))
-        self.slab_width_spin.setValue(float(state.get("slab_width", 0.0)))
-        self.slab_thickness_spin.setValue(float(state.get("slab_thickness_cm", 0.0)))
-        self.slab_count_spin.setValue(int(state.get("slab_count", 1)))
-
-        # Strip footing
-        self.strip_length_spin.setValue(float(state.get("strip_length", 0.0)))
-        self.strip_width_spin.setValue(float(state.get("strip_width", 0.0)))
-        self.strip_thickness_spin.setValue(float(state.get("strip_thickness_cm", 0.0)))
-
-        # Wall
-        self.wall_length_spin.setValue(float(state.get("wall_length", 0.0)))
-        self.wall_height_spin.setValue(float(state.get("wall_height", 0.0)))
-        self.wall_thickness_spin.setValue(float(state.get("wall_thickness_cm", 0.0)))
-        self.wall_count_spin.setValue(int(state.get("wall_count", 1)))
-
-        # Isolated footing
-        self.iso_length_spin.setValue(float(state.get("iso_length", 0.0)))
-        self.iso_width_spin.setValue(float(state.get("iso_width", 0.0)))
-        self.iso_thickness_spin.setValue(float(state.get("iso_thickness_cm", 0.0)))
-        self.iso_count_spin.setValue(int(state.get("iso_count", 1)))
-
-        # Materials
-        self.conc_density_spin.setValue(float(state.get("conc_density", self.conc_density_spin.value())))
-        self.conc_cost_spin.setValue(float(state.get("conc_cost", self.conc_cost_spin.value())))
-        self.rebar_intensity_spin.setValue(float(state.get("rebar_intensity", self.rebar_intensity_spin.value())))
-        self.rebar_cost_spin.setValue(float(state.get("rebar_cost_per_t", self.rebar_cost_spin.value())))
-        self.formwork_rate_spin.setValue(float(state.get("formwork_rate", self.formwork_rate_spin.value())))
+        self._ensure_all_geom_widgets()
+        with ExitStack() as stack:
+            for spin in self._spin_map.values():
+                stack.enter_context(QtCore.QSignalBlocker(spin))
+            for key, default in self._IMPORT_DEFAULTS.items():
+                spin = self._spin_map[key]
+                fallback = spin.value() if default is None else default
+                value = state.get(key, fallback)
+                if isinstance(spin, QtWidgets.QSpinBox):
+                    spin.setValue(int(value))
+                else:
+                    spin.setValue(float(value))
+
+        # Explicit bump: the widget signals were blocked during the apply.
+        self._bump_state_version()
+        self.recalculate()
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -193,8 +193,34 @@ class ConcreteTab(QtWidgets.QWidget):
 
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
+        self._state_version = 0
+        # Numeric mirror of lbl_total_cost; the Summary tab reads
+        # this float instead of parsing the label text.
+        self.total_cost_value = 0.0
+        # Monotonic counter bumped whenever the result labels are
+        # rewritten; the Summary tab uses it to skip stale-free
+        # refreshes.
+        self.results_version = 0
+
+        # export_state cache, valid while _state_version is unchanged
+        self._cached_state: Optional[dict] = None
+        self._cached_state_version = -1
+
+        # Last text written per result label, so unchanged values skip
+        # the setText (and its repaint) entirely.
+        self._last_results: dict = {}
+
+        # Coalesces bursts of input edits into one silent recompute at
+        # UI idle instead of one per keystroke.
+        self._recalc_timer = QtCore.QTimer(self)
+        self._recalc_timer.setSingleShot(True)
+        self._recalc_timer.setInterval(50)
+        self._recalc_timer.timeout.connect(self.recalculate)
+
         self._build_ui()
         self._connect_signals()
+        # Materialize only the default element's form at startup
+        self._ensure_geom_widget(self.element_type_combo.currentIndex())
         self._update_element_description(self.element_type_combo.currentIndex())
 
     # ------------------------------------------------------------------
@@ -232,105 +258,20 @@ class ConcreteTab(QtWidgets.QWidget):
         self.element_description_label.setStyleSheet("color: #A9B0C5; font-size: 11px;")
         geom_layout.addWidget(self.element_description_label)
 
-        # Stacked widget for element-specific geometry inputs
+        # Stacked widget for element-specific geometry inputs. Each form
+        # starts as an empty placeholder and is built the first time its
+        # element is selected — only the default (slab) form exists at
+        # startup, cutting the tab's initial widget count by ~3/4.
         self.geom_stack = QtWidgets.QStackedWidget(geom_group)
-
-        # --- Slab / Base ---
-        self.slab_widget = QtWidgets.QWidget(geom_group)
-        slab_form = QtWidgets.QFormLayout(self.slab_widget)
-        slab_form.setLabelAlignment(QtCore.Qt.AlignRight)
-
-        self.slab_length_spin = QtWidgets.QDoubleSpinBox(self.slab_widget)
-        self._setup_length_width(self.slab_length_spin)
-
-        self.slab_width_spin = QtWidgets.QDoubleSpinBox(self.slab_widget)
-        self._setup_length_width(self.slab_width_spin)
-
-        self.slab_thickness_spin = QtWidgets.QDoubleSpinBox(self.slab_widget)
-        self._setup_thickness_cm(self.slab_thickness_spin)
-
-        self.slab_count_spin = QtWidgets.QSpinBox(self.slab_widget)
-        self.slab_count_spin.setRange(1, 9999)
-        self.slab_count_spin.setValue(1)
-
-        slab_form.addRow("Length L (m):", self.slab_length_spin)
-        slab_form.addRow("Width W (m):", self.slab_width_spin)
-        slab_form.addRow("Thickness T (cm):", self.slab_thickness_spin)
-        slab_form.addRow("Number of slabs:", self.slab_count_spin)
-
-        # --- Strip Footing ---
-        self.footing_strip_widget = QtWidgets.QWidget(geom_group)
-        strip_form = QtWidgets.QFormLayout(self.footing_strip_widget)
-        strip_form.setLabelAlignment(QtCore.Qt.AlignRight)
-
-        self.strip_length_spin = QtWidgets.QDoubleSpinBox(self.footing_strip_widget)
-        self._setup_length_width(self.strip_length_spin)
-        self.strip_length_spin.setToolTip("Total length of all strip footings (m).")
-
-        self.strip_width_spin = QtWidgets.QDoubleSpinBox(self.footing_strip_widget)
-        self._setup_length_width(self.strip_width_spin)
-
-        self.strip_thickness_spin = QtWidgets.QDoubleSpinBox(self.footing_strip_widget)
-        self._setup_thickness_cm(self.strip_thickness_spin)
-
-        strip_form.addRow("Total footing length L (m):", self.strip_length_spin)
-        strip_form.addRow("Footing width W (m):", self.strip_width_spin)
-        strip_form.addRow("Footing thickness T (cm):", self.strip_thickness_spin)
-
-        # --- Wall ---
-        self.wall_widget = QtWidgets.QWidget(geom_group)
-        wall_form = QtWidgets.QFormLayout(self.wall_widget)
-        wall_form.setLabelAlignment(QtCore.Qt.AlignRight)
-
-        self.wall_length_spin = QtWidgets.QDoubleSpinBox(self.wall_widget)
-        self._setup_length_width(self.wall_length_spin)
-
-        self.wall_height_spin = QtWidgets.QDoubleSpinBox(self.wall_widget)
-        self.wall_height_spin.setSuffix(" m")
-        self.wall_height_spin.setDecimals(3)
-        self.wall_height_spin.setRange(0.0, 100.0)
-        self.wall_height_spin.setSingleStep(0.1)
-
-        self.wall_thickness_spin = QtWidgets.QDoubleSpinBox(self.wall_widget)
-        self._setup_thickness_cm(self.wall_thickness_spin)
-
-        self.wall_count_spin = QtWidgets.QSpinBox(self.wall_widget)
-        self.wall_count_spin.setRange(1, 9999)
-        self.wall_count_spin.setValue(1)
-
-        wall_form.addRow("Wall length L (m):", self.wall_length_spin)
-        wall_form.addRow("Wall height H (m):", self.wall_height_spin)
-        wall_form.addRow("Wall thickness T (cm):", self.wall_thickness_spin)
-        wall_form.addRow("Number of walls:", self.wall_count_spin)
-
-        # --- Isolated Footing ---
-        self.footing_iso_widget = QtWidgets.QWidget(geom_group)
-        iso_form = QtWidgets.QFormLayout(self.footing_iso_widget)
-        iso_form.setLabelAlignment(QtCore.Qt.AlignRight)
-
-        self.iso_length_spin = QtWidgets.QDoubleSpinBox(self.footing_iso_widget)
-        self._setup_length_width(self.iso_length_spin)
-
-        self.iso_width_spin = QtWidgets.QDoubleSpinBox(self.footing_iso_widget)
-        self._setup_length_width(self.iso_width_spin)
-
-        self.iso_thickness_spin = QtWidgets.QDoubleSpinBox(self.footing_iso_widget)
-        self._setup_thickness_cm(self.iso_thickness_spin)
-
-        self.iso_count_spin = QtWidgets.QSpinBox(self.footing_iso_widget)
-        self.iso_count_spin.setRange(1, 9999)
-        self.iso_count_spin.setValue(1)
-
-        iso_form.addRow("Footing length L (m):", self.iso_length_spin)
-        iso_form.addRow("Footing width W (m):", self.iso_width_spin)
-        iso_form.addRow("Footing thickness T (cm):", self.iso_thickness_spin)
-        iso_form.addRow("Number of footings:", self.iso_count_spin)
-
-        # Add to stack
-        self.geom_stack.addWidget(self.slab_widget)           # index 0
-        self.geom_stack.addWidget(self.footing_strip_widget)  # index 1
-        self.geom_stack.addWidget(self.wall_widget)           # index 2
-        self.geom_stack.addWidget(self.footing_iso_widget)    # index 3
+        self._geom_builders = (
+            self._build_slab_widget,
+            self._build_strip_widget,
+            self._build_wall_widget,
+            self._build_iso_widget,
+        )
+        self._geom_built = [False] * len(self._geom_builders)
+        for _ in self._geom_builders:
+            self.geom_stack.addWidget(QtWidgets.QWidget(self.geom_stack))
 
         geom_layout.addWidget(self.geom_stack)
 
@@ -454,6 +395,164 @@ class ConcreteTab(QtWidgets.QWidget):
         main_layout.addWidget(result_group)
         main_layout.addStretch(1)
 
+        # Every numeric input by name. A calculation pass snapshots this
+        # map once, so each value crosses the Python/C++ boundary a
+        # single time per recompute. Geometry spins are added by their
+        # lazy builders as the forms materialize.
+        self._spin_map = {
+            "conc_density": self.conc_density_spin,
+            "conc_cost": self.conc_cost_spin,
+            "rebar_intensity": self.rebar_intensity_spin,
+            "rebar_cost_per_t": self.rebar_cost_spin,
+            "formwork_rate": self.formwork_rate_spin,
+        }
+
+    # ------------------------------------------------------------------
+    # Lazy geometry forms
+    # ------------------------------------------------------------------
+
+    def _ensure_geom_widget(self, index: int) -> None:
+        """Build the geometry form at `index` on first use."""
+        if not 0 <= index < len(self._geom_builders) or self._geom_built[index]:
+            return
+        self._geom_built[index] = True
+
+        widget, spins = self._geom_builders[index]()
+        placeholder = self.geom_stack.widget(index)
+        self.geom_stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self.geom_stack.insertWidget(index, widget)
+
+        # These spins were born after _connect_signals ran, so wire
+        # them here and register them for snapshots/exports.
+        for key, spin in spins.items():
+            self._spin_map[key] = spin
+            spin.valueChanged.connect(self._bump_state_version)
+            spin.valueChanged.connect(self._schedule_recalculate)
+
+    def _ensure_all_geom_widgets(self) -> None:
+        """Materialize every geometry form (save/load need them all)."""
+        for index in range(len(self._geom_builders)):
+            self._ensure_geom_widget(index)
+
+    def _build_slab_widget(self) -> tuple[QtWidgets.QWidget, dict]:
+        self.slab_widget = QtWidgets.QWidget(self.geom_stack)
+        slab_form = QtWidgets.QFormLayout(self.slab_widget)
+        slab_form.setLabelAlignment(QtCore.Qt.AlignRight)
+
+        self.slab_length_spin = QtWidgets.QDoubleSpinBox(self.slab_widget)
+        self._setup_length_width(self.slab_length_spin)
+
+        self.slab_width_spin = QtWidgets.QDoubleSpinBox(self.slab_widget)
+        self._setup_length_width(self.slab_width_spin)
+
+        self.slab_thickness_spin = QtWidgets.QDoubleSpinBox(self.slab_widget)
+        self._setup_thickness_cm(self.slab_thickness_spin)
+
+        self.slab_count_spin = QtWidgets.QSpinBox(self.slab_widget)
+        self.slab_count_spin.setRange(1, 9999)
+        self.slab_count_spin.setValue(1)
+
+        slab_form.addRow("Length L (m):", self.slab_length_spin)
+        slab_form.addRow("Width W (m):", self.slab_width_spin)
+        slab_form.addRow("Thickness T (cm):", self.slab_thickness_spin)
+        slab_form.addRow("Number of slabs:", self.slab_count_spin)
+
+        return self.slab_widget, {
+            "slab_length": self.slab_length_spin,
+            "slab_width": self.slab_width_spin,
+            "slab_thickness_cm": self.slab_thickness_spin,
+            "slab_count": self.slab_count_spin,
+        }
+
+    def _build_strip_widget(self) -> tuple[QtWidgets.QWidget, dict]:
+        self.footing_strip_widget = QtWidgets.QWidget(self.geom_stack)
+        strip_form = QtWidgets.QFormLayout(self.footing_strip_widget)
+        strip_form.setLabelAlignment(QtCore.Qt.AlignRight)
+
+        self.strip_length_spin = QtWidgets.QDoubleSpinBox(self.footing_strip_widget)
+        self._setup_length_width(self.strip_length_spin)
+        self.strip_length_spin.setToolTip("Total length of all strip footings (m).")
+
+        self.strip_width_spin = QtWidgets.QDoubleSpinBox(self.footing_strip_widget)
+        self._setup_length_width(self.strip_width_spin)
+
+        self.strip_thickness_spin = QtWidgets.QDoubleSpinBox(self.footing_strip_widget)
+        self._setup_thickness_cm(self.strip_thickness_spin)
+
+        strip_form.addRow("Total footing length L (m):", self.strip_length_spin)
+        strip_form.addRow("Footing width W (m):", self.strip_width_spin)
+        strip_form.addRow("Footing thickness T (cm):", self.strip_thickness_spin)
+
+        return self.footing_strip_widget, {
+            "strip_length": self.strip_length_spin,
+            "strip_width": self.strip_width_spin,
+            "strip_thickness_cm": self.strip_thickness_spin,
+        }
+
+    def _build_wall_widget(self) -> tuple[QtWidgets.QWidget, dict]:
+        self.wall_widget = QtWidgets.QWidget(self.geom_stack)
+        wall_form = QtWidgets.QFormLayout(self.wall_widget)
+        wall_form.setLabelAlignment(QtCore.Qt.AlignRight)
+
+        self.wall_length_spin = QtWidgets.QDoubleSpinBox(self.wall_widget)
+        self._setup_length_width(self.wall_length_spin)
+
+        self.wall_height_spin = QtWidgets.QDoubleSpinBox(self.wall_widget)
+        self.wall_height_spin.setSuffix(" m")
+        self.wall_height_spin.setDecimals(3)
+        self.wall_height_spin.setRange(0.0, 100.0)
+        self.wall_height_spin.setSingleStep(0.1)
+
+        self.wall_thickness_spin = QtWidgets.QDoubleSpinBox(self.wall_widget)
+        self._setup_thickness_cm(self.wall_thickness_spin)
+
+        self.wall_count_spin = QtWidgets.QSpinBox(self.wall_widget)
+        self.wall_count_spin.setRange(1, 9999)
+        self.wall_count_spin.setValue(1)
+
+        wall_form.addRow("Wall length L (m):", self.wall_length_spin)
+        wall_form.addRow("Wall height H (m):", self.wall_height_spin)
+        wall_form.addRow("Wall thickness T (cm):", self.wall_thickness_spin)
+        wall_form.addRow("Number of walls:", self.wall_count_spin)
+
+        return self.wall_widget, {
+            "wall_length": self.wall_length_spin,
+            "wall_height": self.wall_height_spin,
+            "wall_thickness_cm": self.wall_thickness_spin,
+            "wall_count": self.wall_count_spin,
+        }
+
+    def _build_iso_widget(self) -> tuple[QtWidgets.QWidget, dict]:
+        self.footing_iso_widget = QtWidgets.QWidget(self.geom_stack)
+        iso_form = QtWidgets.QFormLayout(self.footing_iso_widget)
+        iso_form.setLabelAlignment(QtCore.Qt.AlignRight)
+
+        self.iso_length_spin = QtWidgets.QDoubleSpinBox(self.footing_iso_widget)
+        self._setup_length_width(self.iso_length_spin)
+
+        self.iso_width_spin = QtWidgets.QDoubleSpinBox(self.footing_iso_widget)
+        self._setup_length_width(self.iso_width_spin)
+
+        self.iso_thickness_spin = QtWidgets.QDoubleSpinBox(self.footing_iso_widget)
+        self._setup_thickness_cm(self.iso_thickness_spin)
+
+        self.iso_count_spin = QtWidgets.QSpinBox(self.footing_iso_widget)
+        self.iso_count_spin.setRange(1, 9999)
+        self.iso_count_spin.setValue(1)
+
+        iso_form.addRow("Footing length L (m):", self.iso_length_spin)
+        iso_form.addRow("Footing width W (m):", self.iso_width_spin)
+        iso_form.addRow("Footing thickness T (cm):", self.iso_thickness_spin)
+        iso_form.addRow("Number of footings:", self.iso_count_spin)
+
+        return self.footing_iso_widget, {
+            "iso_length": self.iso_length_spin,
+            "iso_width": self.iso_width_spin,
+            "iso_thickness_cm": self.iso_thickness_spin,
+            "iso_count": self.iso_count_spin,
+        }
+
     # ------------------------------------------------------------------
     # Helper configuration for spin boxes
     # ------------------------------------------------------------------
@@ -485,37 +584,48 @@ class ConcreteTab(QtWidgets.QWidget):
         self.calculate_button.clicked.connect(self._on_calculate_clicked)
         self.reset_button.clicked.connect(self._on_reset_clicked)
 
+        # Any input edit bumps the state version so MainWindow can reuse
+        # cached export_state snapshots for unchanged tabs, and restarts
+        # the debounce timer for a live (silent) recompute.
+        for spin in self.findChildren((QtWidgets.QSpinBox, QtWidgets.QDoubleSpinBox)):
+            spin.valueChanged.connect(self._bump_state_version)
+            spin.valueChanged.connect(self._schedule_recalculate)
+        for combo in self.findChildren(QtWidgets.QComboBox):
+            combo.currentIndexChanged.connect(self._bump_state_version)
+
+    def _bump_state_version(self, *_args) -> None:
+        self._state_version += 1
+
+    def _schedule_recalculate(self, *_args) -> None:
+        """Restart the debounce timer; one recompute fires per pause."""
+        self._recalc_timer.start()
+
     # ------------------------------------------------------------------
     # Element description logic
     # ------------------------------------------------------------------
 
+    # One description per element_type_combo entry, built once.
+    _ELEMENT_DESCRIPTIONS = (
+        "Slab / Base: A flat, horizontal concrete element such as a floor slab, "
+        "equipment pad or raft base. Defined by length, width and thickness, "
+        "with one or more identical slabs.",
+
+        "Strip Footing: A continuous strip of concrete running under walls or rows of columns. "
+        "Defined by total strip length, width and thickness. Often cast in a trench.",
+
+        "Wall: A vertical reinforced concrete wall, such as a retaining wall or tank wall. "
+        "Defined by length, clear height and thickness, with an optional count of identical walls.",
+
+        "Isolated Footing: A single pad footing under a column or small group of columns. "
+        "Defined by plan length, plan width and thickness, with a count for multiple footings.",
+    )
+
     def _update_element_description(self, index: int) -> None:
         """Update the descriptive text for the selected element type."""
-        if index == 0:
-            text = (
-                "Slab / Base: A flat, horizontal concrete element such as a floor slab, "
-                "equipment pad or raft base. Defined by length, width and thickness, "
-                "with one or more identical slabs."
-            )
-        elif index == 1:
-            text = (
-                "Strip Footing: A continuous strip of concrete running under walls or rows of columns. "
-                "Defined by total strip length, width and thickness. Often cast in a trench."
-            )
-        elif index == 2:
-            text = (
-                "Wall: A vertical reinforced concrete wall, such as a retaining wall or tank wall. "
-                "Defined by length, clear height and thickness, with an optional count of identical walls."
-            )
-        elif index == 3:
-            text = (
-                "Isolated Footing: A single pad footing under a column or small group of columns. "
-                "Defined by plan length, plan width and thickness, with a count for multiple footings."
-            )
-        else:
-            text = ""
-
-        self.element_description_label.setText(text)
+        descriptions = self._ELEMENT_DESCRIPTIONS
+        text = descriptions[index] if 0 <= index < len(descriptions) else ""
+        if self.element_description_label.text() != text:
+            self.element_description_label.setText(text)
 
     # ------------------------------------------------------------------
     # Slots and core logic
@@ -523,21 +633,21 @@ class ConcreteTab(QtWidgets.QWidget):
 
     def _on_element_type_changed(self, index: int) -> None:
         """Switch visible geometry input form based on element type."""
+        self._ensure_geom_widget(index)
         self.geom_stack.setCurrentIndex(index)
         self._update_element_description(index)
 
+    # Preset kg/m³ per rebar_level_combo entry; None = Custom (no-op).
+    _REBAR_PRESETS = (None, 60.0, 90.0, 120.0)
+
     def _on_rebar_level_changed(self, index: int) -> None:
         """
         Apply preset rebar intensities when a level is selected.
         Index 0 = Custom, do nothing.
         """
-        if index == 1:      # Light
-            value = 60.0
-        elif index == 2:    # Medium
-            value = 90.0
-        elif index == 3:    # Heavy
-            value = 120.0
-        else:
+        presets = self._REBAR_PRESETS
+        value = presets[index] if 0 <= index < len(presets) else None
+        if value is None:
             return
 
         self.rebar_intensity_spin.blockSignals(True)
@@ -564,19 +674,22 @@ class ConcreteTab(QtWidgets.QWidget):
         """
         element_index = self.element_type_combo.currentIndex()
 
+        # One snapshot of every numeric input for this pass
+        vals = {name: spin.value() for name, spin in self._spin_map.items()}
+
         try:
-            vol_m3, form_area_m2 = self._calculate_geometry(element_index)
+            vol_m3, form_area_m2 = self._calculate_geometry(element_index, vals)
         except ValueError as exc:
             if show_dialogs:
                 QtWidgets.QMessageBox.warning(self, "Invalid Input", str(exc))
             return
 
         # Materials & cost inputs
-        conc_density = float(self.conc_density_spin.value())           # kg/m³
-        conc_cost_per_m3 = float(self.conc_cost_spin.value())          # USD/m³
-        rebar_intensity = float(self.rebar_intensity_spin.value())     # kg/m³
-        rebar_cost_per_t = float(self.rebar_cost_spin.value())         # USD/t
-        formwork_rate = float(self.formwork_rate_spin.value())         # USD/m²
+        conc_density = vals["conc_density"]           # kg/m³
+        conc_cost_per_m3 = vals["conc_cost"]          # USD/m³
+        rebar_intensity = vals["rebar_intensity"]     # kg/m³
+        rebar_cost_per_t = vals["rebar_cost_per_t"]   # USD/t
+        formwork_rate = vals["formwork_rate"]         # USD/m²
 
         # Unit conversion: USD/t -> USD/kg
         rebar_cost_per_kg = rebar_cost_per_t / 1000.0
@@ -592,107 +705,80 @@ class ConcreteTab(QtWidgets.QWidget):
         cost_formwork = form_area_m2 * formwork_rate
         total = cost_conc + cost_rebar + cost_formwork
 
-        # Update UI (with sane formatting)
-        self.lbl_volume.setText(f"{vol_m3:,.3f} m³")
-        self.lbl_conc_weight.setText(f"{conc_weight_kg:,.0f} kg")
-        self.lbl_form_area.setText(f"{form_area_m2:,.2f} m²")
-
-        self.lbl_rebar_kg.setText(f"{rebar_kg:,.0f} kg")
-        self.lbl_rebar_tons.setText(f"{rebar_tons:,.3f} t")
-
-        self.lbl_conc_cost.setText(f"${cost_conc:,.2f}")
-        self.lbl_rebar_cost.setText(f"${cost_rebar:,.2f}")
-        self.lbl_formwork_cost.setText(f"${cost_formwork:,.2f}")
-        self.lbl_total_cost.setText(f"${total:,.2f}")
-
-    def _calculate_geometry(self, element_index: int) -> tuple[float, float]:
+        # Update UI (with sane formatting, skipping unchanged labels)
+        set_result = self._set_result
+        set_result(self.lbl_volume, self._FMT_VOLUME(vol_m3))
+        set_result(self.lbl_conc_weight, self._FMT_KG(conc_weight_kg))
+        set_result(self.lbl_form_area, self._FMT_AREA(form_area_m2))
+
+        set_result(self.lbl_rebar_kg, self._FMT_KG(rebar_kg))
+        set_result(self.lbl_rebar_tons, self._FMT_TONS(rebar_tons))
+
+        set_result(self.lbl_conc_cost, self._FMT_MONEY(cost_conc))
+        set_result(self.lbl_rebar_cost, self._FMT_MONEY(cost_rebar))
+        set_result(self.lbl_formwork_cost, self._FMT_MONEY(cost_formwork))
+        set_result(self.lbl_total_cost, self._FMT_MONEY(total))
+        self.total_cost_value = total
+        self.results_version += 1
+
+    def _set_result(self, label: QtWidgets.QLabel, text: str) -> None:
+        """Write a result label only if its text actually changed."""
+        if self._last_results.get(label) != text:
+            self._last_results[label] = text
+            label.setText(text)
+
+    def _calculate_geometry(self, element_index: int, vals: dict) -> tuple[float, float]:
         """
         Calculate volume (m³) and approximate formwork area (m²)
-        for the selected element type.
+        for the selected element type, reading from a `vals` snapshot
+        (see _spin_map) rather than the widgets.
 
         Raises ValueError if any geometric input is non-positive where it must be.
         """
-        if element_index == 0:
-            # Slab / Base
-            L = float(self.slab_length_spin.value())
-            W = float(self.slab_width_spin.value())
-            T_cm = float(self.slab_thickness_spin.value())
-            N = int(self.slab_count_spin.value())
-
-            T = T_cm / 100.0
-            if L <= 0 or W <= 0 or T <= 0 or N <= 0:
-                raise ValueError("For slabs, length, width, thickness and count must all be > 0.")
-
-            vol_m3 = L * W * T * N
-            form_area = 2.0 * (L + W) * T * N
-
-        elif element_index == 1:
-            # Strip footing
-            L = float(self.strip_length_spin.value())
-            W = float(self.strip_width_spin.value())
-            T_cm = float(self.strip_thickness_spin.value())
-
-            T = T_cm / 100.0
-            if L <= 0 or W <= 0 or T <= 0:
-                raise ValueError("For strip footings, length, width and thickness must all be > 0.")
-
-            vol_m3 = L * W * T
-            form_area = 2.0 * L * T
-
-        elif element_index == 2:
-            # Wall
-            L = float(self.wall_length_spin.value())
-            H = float(self.wall_height_spin.value())
-            T_cm = float(self.wall_thickness_spin.value())
-            N = int(self.wall_count_spin.value())
-
-            T = T_cm / 100.0
-            if L <= 0 or H <= 0 or T <= 0 or N <= 0:
-                raise ValueError("For walls, length, height, thickness and count must all be > 0.")
-
-            vol_m3 = L * H * T * N
-            form_area = 2.0 * L * H * N
-
-        elif element_index == 3:
-            # Isolated footing
-            L = float(self.iso_length_spin.value())
-            W = float(self.iso_width_spin.value())
-            T_cm = float(self.iso_thickness_spin.value())
-            N = int(self.iso_count_spin.value())
-
-            T = T_cm / 100.0
-            if L <= 0 or W <= 0 or T <= 0 or N <= 0:
-                raise ValueError("For isolated footings, length, width, thickness and count must all be > 0.")
-
-            vol_m3 = L * W * T * N
-            form_area = 2.0 * (L + W) * T * N
-
-        else:
+        if not 0 <= element_index < len(_ELEMENT_SPECS):
             raise ValueError("Unknown element type index.")
+        spec = _ELEMENT_SPECS[element_index]
 
-        return vol_m3, form_area
+        l_key, x_key, t_key, n_key = spec.input_keys
+        L = vals[l_key]
+        X = vals[x_key]
+        T_cm = vals[t_key]
+        N = vals[n_key] if n_key is not None else 1
 
-    def _on_reset_clicked(self) -> None:
-        """Reset all inputs and results to default values."""
-        # Geometry defaults
-        self.slab_length_spin.setValue(0.0)
-        self.slab_width_spin.setValue(0.0)
-        self.slab_thickness_spin.setValue(0.0)
-        self.slab_count_spin.setValue(1)
+        if L <= 0 or X <= 0 or T_cm <= 0 or N <= 0:
+            raise ValueError(spec.error_msg)
 
-        self.strip_length_spin.setValue(0.0)
-        self.strip_width_spin.setValue(0.0)
-        self.strip_thickness_spin.setValue(0.0)
+        return _geom_core(element_index, L, X, T_cm, N)
 
-        self.wall_length_spin.setValue(0.0)
-        self.wall_height_spin.setValue(0.0)
-        self.wall_thickness_spin.setValue(0.0)
-        self.wall_count_spin.setValue(1)
-
-        self.iso_length_spin.setValue(0.0)
-        self.iso_width_spin.setValue(0.0)
-        self.iso_thickness_spin.setValue(0.0)
-        self.iso_count_spin.setValue(1)
+    def _on_reset_clicked(self) -> None:
+        """
+        Reset to defaults with input signals blocked, so the burst of
+        widget writes does not fire connected slots once per assignment.
+        """
+        with ExitStack() as stack:
+            for w in self.findChildren(
+                (
+                    QtWidgets.QLineEdit,
+                    QtWidgets.QSpinBox,
+                    QtWidgets.QDoubleSpinBox,
+                    QtWidgets.QComboBox,
+                )
+            ):
+                stack.enter_context(QtCore.QSignalBlocker(w))
+            self._apply_defaults()
+        # Blocked signals also suppress the version bump; do it once here.
+        self._bump_state_version()
+
+    def _apply_defaults(self) -> None:
+        """Reset all inputs and results to default values."""
+        # Geometry defaults. Never-built lazy forms are skipped: their
+        # widgets are still factory-fresh at these exact values.
+        for key, default in self._IMPORT_DEFAULTS.items():
+            if default is None:
+                continue
+            spin = self._spin_map.get(key)
+            if spin is not None:
+                spin.setValue(default)
 
         # Materials defaults
         self.conc_density_spin.setValue(2400.0)
@@ -702,7 +788,9 @@ class ConcreteTab(QtWidgets.QWidget):
         self.rebar_cost_spin.setValue(640.0)
         self.formwork_rate_spin.setValue(15.0)
 
-        # Results defaults
+        # Results defaults (labels written directly, so drop the
+        # dirty-check memo or the next recalc could skip updates)
+        self._last_results.clear()
         self.lbl_volume.setText("0.000 m³")
         self.lbl_conc_weight.setText("0 kg")
         self.lbl_form_area.setText("0.00 m²")
@@ -712,5 +800,7 @@ class ConcreteTab(QtWidgets.QWidget):
         self.lbl_rebar_cost.setText("$0.00")
         self.lbl_formwork_cost.setText("$0.00")
         self.lbl_total_cost.setText("$0.00")
+        self.total_cost_value = 0.0
+        self.results_version += 1
 
         self._update_element_description(self.element_type_combo.currentIndex())
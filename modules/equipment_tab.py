@@ -61,10 +61,38 @@ Grand total:
     cost_total = hire_cost_total + fuel_cost_total + mob_cost + overhead_cost + misc_plant_allow
 """
 
-from typing import Optional, List
+from contextlib import ExitStack
+from typing import List, NamedTuple, Optional, Tuple
 
 from PyQt5 import QtCore, QtWidgets
 
+from .equipment_math import fleet_costs
+
+
+# Default fleet rows (purely example placeholders). Module-level tuples
+# so the constants are built once at import time, not per tab instance.
+_DEFAULT_NAMES: Tuple[str, ...] = (
+    "20t Excavator",
+    "Wheel Loader",
+    "Vibratory Roller",
+    "Water Tanker",
+    "Concrete Pump",
+    "Mobile Crane",
+    "Tipper Truck",
+    "Telehandler / Forklift",
+)
+_DEFAULT_RATES: Tuple[float, ...] = (90.0, 80.0, 60.0, 55.0, 120.0, 150.0, 70.0, 65.0)
+_DEFAULT_FUEL: Tuple[float, ...] = (18.0, 15.0, 10.0, 8.0, 20.0, 22.0, 14.0, 9.0)
+
+
+class _EquipRow(NamedTuple):
+    """The five input widgets making up one fleet row."""
+    name: QtWidgets.QLineEdit
+    count: QtWidgets.QSpinBox
+    rate: QtWidgets.QDoubleSpinBox
+    fuel: QtWidgets.QDoubleSpinBox
+    util: QtWidgets.QDoubleSpinBox
+
 
 class EquipmentTab(QtWidgets.QWidget):
     """
@@ -90,56 +118,96 @@ class EquipmentTab(QtWidgets.QWidget):
     # ------------------------------------------------------------------
 
     def export_state(self) -> dict:
-        rows = []
-        for i in range(len(self.equip_name_edits)):
-            rows.append(
-                {
-                    "name": self.equip_name_edits[i].text(),
-                    "count": int(self.equip_count_spins[i].value()),
-                    "hire_rate_day": float(self.equip_rate_spins[i].value()),
-                    "fuel_lph": float(self.equip_fuel_spins[i].value()),
-                    "util_pct": float(self.equip_util_spins[i].value()),
-                }
-            )
+        # Bind each widget's getter once up front; the row comprehension
+        # then just calls them, instead of re-resolving attribute chains
+        # and list indices per row.
+        name_get = [r.name.text for r in self.rows]
+        count_get = [r.count.value for r in self.rows]
+        rate_get = [r.rate.value for r in self.rows]
+        fuel_get = [r.fuel.value for r in self.rows]
+        util_get = [r.util.value for r in self.rows]
+
+        # QSpinBox.value() is already int and QDoubleSpinBox.value()
+        # already float, so the values go straight into the state dict.
+        rows = [
+            {
+                "name": n(),
+                "count": c(),
+                "hire_rate_day": r(),
+                "fuel_lph": f(),
+                "util_pct": u(),
+            }
+            for n, c, r, f, u in zip(name_get, count_get, rate_get, fuel_get, util_get)
+        ]
 
         return {
             "rows": rows,
-            "days": int(self.days_spin.value()),
-            "hours_per_day": float(self.hours_per_day_spin.value()),
-            "fuel_price": float(self.fuel_price_spin.value()),
-            "mobilisation": float(self.mobilisation_spin.value()),
-            "demobilisation": float(self.demobilisation_spin.value()),
-            "daily_plant_overhead": float(self.daily_plant_overhead_spin.value()),
-            "misc_plant_allow": float(self.misc_plant_allow_spin.value()),
+            "days": self.days_spin.value(),
+            "hours_per_day": self.hours_per_day_spin.value(),
+            "fuel_price": self.fuel_price_spin.value(),
+            "mobilisation": self.mobilisation_spin.value(),
+            "demobilisation": self.demobilisation_spin.value(),
+            "daily_plant_overhead": self.daily_plant_overhead_spin.value(),
+            "misc_plant_allow": self.misc_plant_allow_spin.value(),
         }
 
     def import_state(self, state: dict) -> None:
         if not isinstance(state, dict):
             return
 
+        # Block every input widget for the duration of the bulk apply so
+        # the ~40 setValue/setText calls below fire no per-widget signals;
+        # the single explicit bump at the end propagates the new state.
+        with ExitStack() as stack:
+            for w in (
+                [w for row in self.rows for w in row]
+                + [
+                    self.days_spin,
+                    self.hours_per_day_spin,
+                    self.fuel_price_spin,
+                    self.mobilisation_spin,
+                    self.demobilisation_spin,
+                    self.daily_plant_overhead_spin,
+                    self.misc_plant_allow_spin,
+                ]
+            ):
+                stack.enter_context(QtCore.QSignalBlocker(w))
+            self._apply_state(state)
+
+        # Explicit bump: widget signals were blocked during the apply.
+        self._bump_state_version()
+
+    def _apply_state(self, state: dict) -> None:
+        def set_num(spin, raw, cast):
+            # Inbound JSON values may be strings or junk; skip a bad
+            # field rather than aborting the whole import.
+            try:
+                spin.setValue(cast(raw))
+            except (TypeError, ValueError):
+                pass
+
         rows = state.get("rows", [])
         if isinstance(rows, list):
-            for i in range(min(len(rows), len(self.equip_name_edits))):
-                row = rows[i]
+            for widgets, row in zip(self.rows, rows):
                 if not isinstance(row, dict):
                     continue
 
-                self.equip_name_edits[i].setText(str(row.get("name", self.equip_name_edits[i].text())))
-                self.equip_count_spins[i].setValue(int(row.get("count", 0)))
-                self.equip_rate_spins[i].setValue(float(row.get("hire_rate_day", self.equip_rate_spins[i].value())))
-                self.equip_fuel_spins[i].setValue(float(row.get("fuel_lph", self.equip_fuel_spins[i].value())))
-                self.equip_util_spins[i].setValue(float(row.get("util_pct", self.equip_util_spins[i].value())))
+                widgets.name.setText(str(row.get("name", widgets.name.text())))
+                set_num(widgets.count, row.get("count", 0), int)
+                set_num(widgets.rate, row.get("hire_rate_day", widgets.rate.value()), float)
+                set_num(widgets.fuel, row.get("fuel_lph", widgets.fuel.value()), float)
+                set_num(widgets.util, row.get("util_pct", widgets.util.value()), float)
 
         # Schedule
-        self.days_spin.setValue(int(state.get("days", self.days_spin.value())))
-        self.hours_per_day_spin.setValue(float(state.get("hours_per_day", self.hours_per_day_spin.value())))
-        self.fuel_price_spin.setValue(float(state.get("fuel_price", self.fuel_price_spin.value())))
+        set_num(self.days_spin, state.get("days", self.days_spin.value()), int)
+        set_num(self.hours_per_day_spin, state.get("hours_per_day", self.hours_per_day_spin.value()), float)
+        set_num(self.fuel_price_spin, state.get("fuel_price", self.fuel_price_spin.value()), float)
 
         # Overheads
-        self.mobilisation_spin.setValue(float(state.get("mobilisation", self.mobilisation_spin.value())))
-        self.demobilisation_spin.setValue(float(state.get("demobilisation", self.demobilisation_spin.value())))
-        self.daily_plant_overhead_spin.setValue(float(state.get("daily_plant_overhead", self.daily_plant_overhead_spin.value())))
-        self.misc_plant_allow_spin.setValue(float(state.get("misc_plant_allow", self.misc_plant_allow_spin.value())))
+        set_num(self.mobilisation_spin, state.get("mobilisation", self.mobilisation_spin.value()), float)
+        set_num(self.demobilisation_spin, state.get("demobilisation", self.demobilisation_spin.value()), float)
+        set_num(self.daily_plant_overhead_spin, state.get("daily_plant_overhead", self.daily_plant_overhead_spin.value()), float)
+        set_num(self.misc_plant_allow_spin, state.get("misc_plant_allow", self.misc_plant_allow_spin.value()), float)
 
 
 
@@ -147,12 +215,22 @@ class EquipmentTab(QtWidgets.QWidget):
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
 
-        # Lists of per-row widgets so we can iterate for calculations
-        self.equip_name_edits: List[QtWidgets.QLineEdit] = []
-        self.equip_count_spins: List[QtWidgets.QSpinBox] = []
-        self.equip_rate_spins: List[QtWidgets.QDoubleSpinBox] = []
-        self.equip_fuel_spins: List[QtWidgets.QDoubleSpinBox] = []
-        self.equip_util_spins: List[QtWidgets.QDoubleSpinBox] = []
+        # One record per fleet row, bundling its five input widgets
+        self.rows: List[_EquipRow] = []
+        self._state_version = 0
+        # Numeric mirror of lbl_grand_total; lets the Summary tab
+        # skip re-parsing the formatted currency text.
+        self.total_cost_value = 0.0
+        # Monotonic counter bumped whenever the result labels are
+        # rewritten; the Summary tab uses it to skip stale-free
+        # refreshes.
+        self.results_version = 0
+        # Plain-list mirror of breakdown_text's contents; the Summary
+        # tab reads this for the PDF snapshot instead of copying the
+        # whole QTextDocument back out through toPlainText().
+        self.breakdown_rows: List[str] = []
+        # Version last run through _on_calculate_clicked; None = never
+        self._last_calc_version: Optional[int] = None
 
         self._build_ui()
         self._connect_signals()
@@ -219,27 +297,11 @@ class EquipmentTab(QtWidgets.QWidget):
         grid.addWidget(lbl_fuel, 0, 3)
         grid.addWidget(lbl_util, 0, 4)
 
-        # Default row labels for user convenience (these are just examples)
-        default_names = [
-            "20t Excavator",
-            "Wheel Loader",
-            "Vibratory Roller",
-            "Water Tanker",
-            "Concrete Pump",
-            "Mobile Crane",
-            "Tipper Truck",
-            "Telehandler / Forklift",
-        ]
-
-        # Reasonable example default rates (purely placeholders)
-        default_rates = [90.0, 80.0, 60.0, 55.0, 120.0, 150.0, 70.0, 65.0]
-        default_fuel = [18.0, 15.0, 10.0, 8.0, 20.0, 22.0, 14.0, 9.0]
-
-        num_rows = len(default_names)
+        num_rows = len(_DEFAULT_NAMES)
         for row in range(num_rows):
             name_edit = QtWidgets.QLineEdit(equip_group)
             name_edit.setPlaceholderText("Equipment description")
-            name_edit.setText(default_names[row])
+            name_edit.setText(_DEFAULT_NAMES[row])
 
             count_spin = QtWidgets.QSpinBox(equip_group)
             count_spin.setRange(0, 1000)
@@ -250,14 +312,14 @@ class EquipmentTab(QtWidgets.QWidget):
             rate_spin.setDecimals(2)
             rate_spin.setRange(0.0, 10_000.0)
             rate_spin.setSingleStep(5.0)
-            rate_spin.setValue(default_rates[row])
+            rate_spin.setValue(_DEFAULT_RATES[row])
 
             fuel_spin = QtWidgets.QDoubleSpinBox(equip_group)
             fuel_spin.setSuffix(" L/h")
             fuel_spin.setDecimals(1)
             fuel_spin.setRange(0.0, 1000.0)
             fuel_spin.setSingleStep(0.5)
-            fuel_spin.setValue(default_fuel[row])
+            fuel_spin.setValue(_DEFAULT_FUEL[row])
 
             util_spin = QtWidgets.QDoubleSpinBox(equip_group)
             util_spin.setSuffix(" %")
@@ -272,11 +334,9 @@ class EquipmentTab(QtWidgets.QWidget):
             grid.addWidget(fuel_spin, row + 1, 3)
             grid.addWidget(util_spin, row + 1, 4)
 
-            self.equip_name_edits.append(name_edit)
-            self.equip_count_spins.append(count_spin)
-            self.equip_rate_spins.append(rate_spin)
-            self.equip_fuel_spins.append(fuel_spin)
-            self.equip_util_spins.append(util_spin)
+            self.rows.append(
+                _EquipRow(name_edit, count_spin, rate_spin, fuel_spin, util_spin)
+            )
 
         equip_layout.addLayout(grid)
 
@@ -382,7 +442,8 @@ class EquipmentTab(QtWidgets.QWidget):
         button_layout.addWidget(self.calculate_button)
 
         # ---------------- Results ----------------
-        result_group = QtWidgets.QGroupBox("Results", content_widget)
+        self.result_group = QtWidgets.QGroupBox("Results", content_widget)
+        result_group = self.result_group
         result_form = QtWidgets.QFormLayout(result_group)
         result_form.setLabelAlignment(QtCore.Qt.AlignRight)
 
@@ -432,6 +493,16 @@ class EquipmentTab(QtWidgets.QWidget):
         self.calculate_button.clicked.connect(self._on_calculate_clicked)
         self.reset_button.clicked.connect(self._on_reset_clicked)
 
+        # Any input edit bumps the state version so MainWindow can reuse
+        # cached export_state snapshots for unchanged tabs.
+        for spin in self.findChildren((QtWidgets.QSpinBox, QtWidgets.QDoubleSpinBox)):
+            spin.valueChanged.connect(self._bump_state_version)
+        for row in self.rows:
+            row.name.textChanged.connect(self._bump_state_version)
+
+    def _bump_state_version(self, *_args) -> None:
+        self._state_version += 1
+
     # ------------------------------------------------------------------
     # Core calculation logic
     # ------------------------------------------------------------------
@@ -441,6 +512,11 @@ class EquipmentTab(QtWidgets.QWidget):
         Calculate operating hours, fuel, costs and totals
         for all defined equipment rows.
         """
+        # Nothing changed since the last run: the displayed results are
+        # still valid, so skip the recompute and document rebuild.
+        if self._state_version == self._last_calc_version:
+            return
+
         days = int(self.days_spin.value())
         hours_per_day = float(self.hours_per_day_spin.value())
         fuel_price = float(self.fuel_price_spin.value())
@@ -478,58 +554,40 @@ class EquipmentTab(QtWidgets.QWidget):
         # Schedule hours available per unit
         schedule_hours = days * hours_per_day
 
-        total_hours = 0.0
-        total_hire_cost = 0.0
-        total_fuel_litres = 0.0
-        total_fuel_cost = 0.0
+        # Snapshot the row inputs, then run the whole fleet through the
+        # shared single-pass kernel.
+        names = [r.name.text().strip() for r in self.rows]
+        counts = [r.count.value() for r in self.rows]
+        rates = [r.rate.value() for r in self.rows]
+        fuel_lph = [r.fuel.value() for r in self.rows]
+        util_pct = [r.util.value() for r in self.rows]
 
-        breakdown_lines: List[str] = []
-        breakdown_lines.append(
-            f"Schedule: {days} days × {hours_per_day:.1f} h/day = {schedule_hours:.1f} h per unit (100% utilisation)."
-        )
-        breakdown_lines.append(
-            f"Fuel price: ${fuel_price:.3f} per litre."
+        row_results, totals = fleet_costs(
+            counts, rates, fuel_lph, util_pct, schedule_hours, fuel_price
         )
-        breakdown_lines.append("")
-        breakdown_lines.append("Per-equipment details:")
-        breakdown_lines.append(
-            "Name | Units | Utilisation | Hours | Fuel (L) | Hire cost (USD) | Fuel cost (USD)"
-        )
-        breakdown_lines.append("-" * 90)
-
-        # Iterate over each equipment row
-        num_rows = len(self.equip_name_edits)
-        for i in range(num_rows):
-            name = self.equip_name_edits[i].text().strip()
-            if not name:
-                name = f"Item {i + 1}"
-
-            count = int(self.equip_count_spins[i].value())
-            rate_hour = float(self.equip_rate_spins[i].value())
-            fuel_lph = float(self.equip_fuel_spins[i].value())
-            util_pct = float(self.equip_util_spins[i].value())
-
-            # If effectively zero, skip this row
-            if count <= 0 or rate_hour <= 0 or util_pct <= 0 or hours_per_day == 0:
-                continue
-
-            utilisation_factor = util_pct / 100.0
-            hours_effective = count * schedule_hours * utilisation_factor
-
-            hire_cost = hours_effective * rate_hour
-            fuel_litres = hours_effective * fuel_lph
-            fuel_cost = fuel_litres * fuel_price
-
-            total_hours += hours_effective
-            total_hire_cost += hire_cost
-            total_fuel_litres += fuel_litres
-            total_fuel_cost += fuel_cost
-
-            breakdown_lines.append(
-                f"{name} | {count} | {util_pct:.1f}% | "
-                f"{hours_effective:,.1f} h | {fuel_litres:,.1f} L | "
-                f"${hire_cost:,.2f} | ${fuel_cost:,.2f}"
-            )
+        total_hours = totals.hours
+        total_hire_cost = totals.hire_cost
+        total_fuel_litres = totals.fuel_litres
+        total_fuel_cost = totals.fuel_cost
+
+        header_lines = [
+            f"Schedule: {days} days × {hours_per_day:.1f} h/day = {schedule_hours:.1f} h per unit (100% utilisation).",
+            f"Fuel price: ${fuel_price:.3f} per litre.",
+            "",
+            "Per-equipment details:",
+            "Name | Units | Utilisation | Hours | Fuel (L) | Hire cost (USD) | Fuel cost (USD)",
+            "-" * 90,
+        ]
+
+        # One preformatted line per active row, built in a single
+        # comprehension rather than grown append-by-append.
+        row_lines = [
+            f"{names[r.index] or f'Item {r.index + 1}'} | {counts[r.index]} | "
+            f"{util_pct[r.index]:.1f}% | "
+            f"{r.hours:,.1f} h | {r.fuel_litres:,.1f} L | "
+            f"${r.hire_cost:,.2f} | ${r.fuel_cost:,.2f}"
+            for r in row_results
+        ]
 
         # Overheads & mobilisation
         mob_cost = mobilisation + demobilisation
@@ -537,32 +595,65 @@ class EquipmentTab(QtWidgets.QWidget):
 
         grand_total = total_hire_cost + total_fuel_cost + mob_cost + overhead_cost
 
-        # Update result labels
-        self.lbl_total_hours.setText(f"{total_hours:,.1f} h")
-        self.lbl_total_hire_cost.setText(f"${total_hire_cost:,.2f}")
-        self.lbl_total_fuel_litres.setText(f"{total_fuel_litres:,.1f} L")
-        self.lbl_total_fuel_cost.setText(f"${total_fuel_cost:,.2f}")
-        self.lbl_mob_cost.setText(f"${mob_cost:,.2f}")
-        self.lbl_overhead_cost.setText(f"${overhead_cost:,.2f}")
-        self.lbl_grand_total.setText(f"${grand_total:,.2f}")
-
-        breakdown_lines.append("")
-        breakdown_lines.append(f"Total operating hours (all machines): {total_hours:,.1f} h")
-        breakdown_lines.append(f"Total hire cost: ${total_hire_cost:,.2f}")
-        breakdown_lines.append(f"Total fuel consumption: {total_fuel_litres:,.1f} L")
-        breakdown_lines.append(f"Total fuel cost: ${total_fuel_cost:,.2f}")
-        breakdown_lines.append(f"Mobilisation + demobilisation: ${mob_cost:,.2f}")
-        breakdown_lines.append(f"Plant overhead + misc: ${overhead_cost:,.2f}")
-        breakdown_lines.append(f"Grand total equipment cost: ${grand_total:,.2f}")
-
-        self.breakdown_text.setPlainText("\n".join(breakdown_lines))
+        footer_lines = [
+            "",
+            f"Total operating hours (all machines): {total_hours:,.1f} h",
+            f"Total hire cost: ${total_hire_cost:,.2f}",
+            f"Total fuel consumption: {total_fuel_litres:,.1f} L",
+            f"Total fuel cost: ${total_fuel_cost:,.2f}",
+            f"Mobilisation + demobilisation: ${mob_cost:,.2f}",
+            f"Plant overhead + misc: ${overhead_cost:,.2f}",
+            f"Grand total equipment cost: ${grand_total:,.2f}",
+        ]
+
+        # Update all results inside one suppressed-repaint window so the
+        # group schedules a single paint instead of one per setText.
+        self.result_group.setUpdatesEnabled(False)
+        try:
+            self.lbl_total_hours.setText(f"{total_hours:,.1f} h")
+            self.lbl_total_hire_cost.setText(f"${total_hire_cost:,.2f}")
+            self.lbl_total_fuel_litres.setText(f"{total_fuel_litres:,.1f} L")
+            self.lbl_total_fuel_cost.setText(f"${total_fuel_cost:,.2f}")
+            self.lbl_mob_cost.setText(f"${mob_cost:,.2f}")
+            self.lbl_overhead_cost.setText(f"${overhead_cost:,.2f}")
+            self.lbl_grand_total.setText(f"${grand_total:,.2f}")
+            self.total_cost_value = grand_total
+            self.results_version += 1
+            self.breakdown_rows = header_lines + row_lines + footer_lines
+            self.breakdown_text.setPlainText("\n".join(self.breakdown_rows))
+        finally:
+            self.result_group.setUpdatesEnabled(True)
+            self.result_group.update()
+
+        # Recorded only after a successful run, so a failed validation
+        # does not mark the current inputs as calculated.
+        self._last_calc_version = self._state_version
 
     def _on_reset_clicked(self) -> None:
+        """
+        Reset to defaults with input signals blocked, so the burst of
+        widget writes does not fire connected slots once per assignment.
+        """
+        with ExitStack() as stack:
+            for w in self.findChildren(
+                (
+                    QtWidgets.QLineEdit,
+                    QtWidgets.QSpinBox,
+                    QtWidgets.QDoubleSpinBox,
+                    QtWidgets.QComboBox,
+                )
+            ):
+                stack.enter_context(QtCore.QSignalBlocker(w))
+            self._apply_defaults()
+        # Blocked signals also suppress the version bump; do it once here.
+        self._bump_state_version()
+
+    def _apply_defaults(self) -> None:
         """Reset all inputs and outputs to default values."""
         # Reset equipment rows: counts and utilisation to 0, keep default rates & names
-        for i in range(len(self.equip_name_edits)):
-            self.equip_count_spins[i].setValue(0)
-            self.equip_util_spins[i].setValue(70.0)
+        for row in self.rows:
+            row.count.setValue(0)
+            row.util.setValue(70.0)
 
         # Schedule
         self.days_spin.setValue(30)
@@ -575,15 +666,23 @@ class EquipmentTab(QtWidgets.QWidget):
         self.daily_plant_overhead_spin.setValue(0.0)
         self.misc_plant_allow_spin.setValue(0.0)
 
-        # Results
-        self.lbl_total_hours.setText("0.0 h")
-        self.lbl_total_hire_cost.setText("$0.00")
-        self.lbl_total_fuel_litres.setText("0.0 L")
-        self.lbl_total_fuel_cost.setText("$0.00")
-        self.lbl_mob_cost.setText("$0.00")
-        self.lbl_overhead_cost.setText("$0.00")
-        self.lbl_grand_total.setText("$0.00")
-        self.breakdown_text.clear()
-        self.breakdown_text.setPlaceholderText(
-            "Per-equipment breakdown will appear here after calculation."
-        )
+        # Results, repainted once as a group
+        self.result_group.setUpdatesEnabled(False)
+        try:
+            self.lbl_total_hours.setText("0.0 h")
+            self.lbl_total_hire_cost.setText("$0.00")
+            self.lbl_total_fuel_litres.setText("0.0 L")
+            self.lbl_total_fuel_cost.setText("$0.00")
+            self.lbl_mob_cost.setText("$0.00")
+            self.lbl_overhead_cost.setText("$0.00")
+            self.lbl_grand_total.setText("$0.00")
+            self.total_cost_value = 0.0
+            self.results_version += 1
+            self.breakdown_rows = []
+            self.breakdown_text.clear()
+            self.breakdown_text.setPlaceholderText(
+                "Per-equipment breakdown will appear here after calculation."
+            )
+        finally:
+            self.result_group.setUpdatesEnabled(True)
+            self.result_group.update()
@@ -0,0 +1,119 @@
+"""
+land_prep_math.py
+
+Earthworks arithmetic behind the land preparation tab, free of Qt
+imports so it can be driven in batch (parametric sweeps over trench
+depth or count) or profiled standalone. The GUI's calculation path and
+any sweep share compute(), so each formula exists once.
+"""
+
+from typing import List, NamedTuple, Sequence
+
+
+class LandPrepResult(NamedTuple):
+    """Everything the results panel shows, in display order."""
+    site_volume: float
+    trench_volume: float
+    total_cut_volume: float
+    platform_comp_area: float
+    trench_comp_area: float
+    total_comp_area: float
+    lifts_platform: int
+    lifts_trench: int
+    area_passes_total: float
+    cost_cut: float
+    cost_compaction: float
+    cost_total: float
+
+
+def compute(
+    site_area: float,
+    site_depth_cm: float,
+    trench_length: float,
+    trench_width: float,
+    trench_depth_cm: float,
+    trench_count: int,
+    lift_thickness_cm: float,
+    passes_per_lift: int,
+    cost_per_m3_cut: float,
+    cost_per_m2_pass: float,
+) -> LandPrepResult:
+    """
+    Volumes, compaction effort and costs for one input set.
+
+    Depths arrive in centimetres as the spins hold them; conversion to
+    metres happens here. Validation (non-negative inputs, count and
+    lift > 0) stays with the caller.
+    """
+    h_site = site_depth_cm / 100.0
+    h_trench = trench_depth_cm / 100.0
+    h_lift = lift_thickness_cm / 100.0
+
+    v_site = site_area * h_site
+    v_trench = trench_length * trench_width * h_trench * trench_count
+    v_cut_total = v_site + v_trench
+
+    a_comp_platform = site_area
+    a_trench_base = trench_length * trench_width * trench_count
+    a_trench_sides = 2.0 * trench_length * h_trench * trench_count
+    a_comp_trench = a_trench_base + a_trench_sides
+    a_comp_total = a_comp_platform + a_comp_trench
+
+    # Lift counts in integer tenths of a centimetre — the spins hold
+    # one decimal, so the scaling is exact — with an integer ceiling
+    # division. Avoids the float-division rounding noise that could tip
+    # ceil() over an extra lift when a depth is a whole multiple of the
+    # lift thickness.
+    site_depth_tenths = round(site_depth_cm * 10.0)
+    trench_depth_tenths = round(trench_depth_cm * 10.0)
+    lift_tenths = round(lift_thickness_cm * 10.0)
+
+    n_lifts_platform = 0
+    if site_area > 0.0 and site_depth_tenths > 0 and lift_tenths > 0:
+        n_lifts_platform = -(-site_depth_tenths // lift_tenths)
+
+    n_lifts_trench = 0
+    if trench_length > 0.0 and trench_width > 0.0 and trench_depth_tenths > 0 and lift_tenths > 0:
+        n_lifts_trench = -(-trench_depth_tenths // lift_tenths)
+
+    a_pass_platform = a_comp_platform * n_lifts_platform * passes_per_lift
+    a_pass_trench = a_comp_trench * n_lifts_trench * passes_per_lift
+    a_pass_total = a_pass_platform + a_pass_trench
+
+    cost_cut = v_cut_total * cost_per_m3_cut
+    cost_compaction = a_pass_total * cost_per_m2_pass
+
+    return LandPrepResult(
+        v_site, v_trench, v_cut_total,
+        a_comp_platform, a_comp_trench, a_comp_total,
+        n_lifts_platform, n_lifts_trench, a_pass_total,
+        cost_cut, cost_compaction, cost_cut + cost_compaction,
+    )
+
+
+def compute_sweep(
+    site_areas: Sequence[float],
+    site_depths_cm: Sequence[float],
+    trench_lengths: Sequence[float],
+    trench_widths: Sequence[float],
+    trench_depths_cm: Sequence[float],
+    trench_counts: Sequence[int],
+    lift_thicknesses_cm: Sequence[float],
+    passes_per_lift: Sequence[int],
+    costs_per_m3_cut: Sequence[float],
+    costs_per_m2_pass: Sequence[float],
+) -> List[LandPrepResult]:
+    """
+    Evaluate compute() over parallel scenario sequences, one result per
+    scenario. A plain-Python loop is ample for the few-thousand-point
+    sweeps a cost-curve panel needs, without a compiled dependency.
+    """
+    fn = compute
+    return [
+        fn(*scenario)
+        for scenario in zip(
+            site_areas, site_depths_cm, trench_lengths, trench_widths,
+            trench_depths_cm, trench_counts, lift_thicknesses_cm,
+            passes_per_lift, costs_per_m3_cut, costs_per_m2_pass,
+        )
+    ]
@@ -83,11 +83,40 @@ High-level model
          cost_total = cost_cut + cost_compaction
 """
 
-import math
-from typing import Optional
+from contextlib import ExitStack
+from typing import NamedTuple, Optional, Tuple
 
 from PyQt5 import QtCore, QtWidgets
 
+from .land_prep_math import compute
+
+
+class _StateField(NamedTuple):
+    """One save-file entry: its JSON key, spin attribute and inbound rules."""
+    key: str
+    attr: str
+    cast: type
+    default: Optional[float]   # None = keep the widget's current value
+    minimum: Optional[int]     # clamp floor for inbound values, if any
+
+
+# Keys must stay stable for project file compatibility; attrs are the
+# real widget names from _build_ui. Export and import are both plain
+# loops over this table, so adding a field is a one-line change.
+_STATE_FIELDS: Tuple[_StateField, ...] = (
+    _StateField("site_area", "site_area_spin", float, 0.0, None),
+    _StateField("site_depth_cm", "site_depth_spin", float, 0.0, None),
+    _StateField("trench_length", "trench_length_spin", float, 0.0, None),
+    _StateField("trench_width", "trench_width_spin", float, 0.0, None),
+    _StateField("trench_depth_cm", "trench_depth_spin", float, 0.0, None),
+    _StateField("trench_count", "trench_count_spin", int, 1, 1),
+    _StateField("compaction_target_pct", "compaction_target_spin", float, None, None),
+    _StateField("lift_thickness_cm", "lift_thickness_spin", float, None, None),
+    _StateField("passes_per_lift", "passes_per_lift_spin", int, None, 1),
+    _StateField("cost_per_m3_cut", "cost_per_m3_cut_spin", float, None, None),
+    _StateField("cost_per_m2_pass", "cost_per_m2_pass_spin", float, None, None),
+)
+
 
 class LandPrepTab(QtWidgets.QWidget):
     """
@@ -104,32 +133,10 @@ class LandPrepTab(QtWidgets.QWidget):
 
     def export_state(self) -> dict:
         """
-        Return a JSON-serializable snapshot of LandPrepTab inputs.
-
-        IMPORTANT:
-        Keep these keys stable (for project file compatibility),
-        but always reference the REAL widget attribute names defined in _build_ui().
+        Return a JSON-serializable snapshot of LandPrepTab inputs,
+        one entry per _STATE_FIELDS row.
         """
-        return {
-            # Platform
-            "site_area": float(self.site_area_spin.value()),
-            "site_depth_cm": float(self.site_depth_spin.value()),
-
-            # Trenches
-            "trench_length": float(self.trench_length_spin.value()),
-            "trench_width": float(self.trench_width_spin.value()),
-            "trench_depth_cm": float(self.trench_depth_spin.value()),
-            "trench_count": int(self.trench_count_spin.value()),
-
-            # Compaction settings
-            "compaction_target_pct": float(self.compaction_target_spin.value()),
-            "lift_thickness_cm": float(self.lift_thickness_spin.value()),
-            "passes_per_lift": int(self.passes_per_lift_spin.value()),
-
-            # Costs
-            "cost_per_m3_cut": float(self.cost_per_m3_cut_spin.value()),
-            "cost_per_m2_pass": float(self.cost_per_m2_pass_spin.value()),
-        }
+        return {f.key: getattr(self, f.attr).value() for f in _STATE_FIELDS}
 
     def import_state(self, state: dict) -> None:
         """
@@ -138,42 +145,50 @@ class LandPrepTab(QtWidgets.QWidget):
         if not isinstance(state, dict):
             return
 
-        # Platform
-        self.site_area_spin.setValue(float(state.get("site_area", 0.0)))
-        self.site_depth_spin.setValue(float(state.get("site_depth_cm", 0.0)))
-
-        # Trenches
-        self.trench_length_spin.setValue(float(state.get("trench_length", 0.0)))
-        self.trench_width_spin.setValue(float(state.get("trench_width", 0.0)))
-        self.trench_depth_spin.setValue(float(state.get("trench_depth_cm", 0.0)))
+        # Block signals across the whole apply: each setValue would
+        # otherwise bump the version and restart the debounce once per
+        # field. One bump and one scheduled recalc at the end suffice.
+        with ExitStack() as stack:
+            spins = [getattr(self, f.attr) for f in _STATE_FIELDS]
+            for spin in spins:
+                stack.enter_context(QtCore.QSignalBlocker(spin))
 
-        # trench_count_spin has a minimum of 1 in the UI, so don't import 0 accidentally
-        trench_count = int(state.get("trench_count", 1))
-        self.trench_count_spin.setValue(max(1, trench_count))
-
-        # Compaction settings
-        self.compaction_target_spin.setValue(
-            float(state.get("compaction_target_pct", self.compaction_target_spin.value()))
-        )
-        self.lift_thickness_spin.setValue(
-            float(state.get("lift_thickness_cm", self.lift_thickness_spin.value()))
-        )
-        self.passes_per_lift_spin.setValue(
-            max(1, int(state.get("passes_per_lift", self.passes_per_lift_spin.value())))
-        )
+            for f, spin in zip(_STATE_FIELDS, spins):
+                raw = state.get(f.key, f.default if f.default is not None else spin.value())
+                try:
+                    value = f.cast(raw)
+                except (TypeError, ValueError):
+                    continue
+                if f.minimum is not None:
+                    value = max(f.minimum, value)
+                spin.setValue(value)
 
-        # Costs
-        self.cost_per_m3_cut_spin.setValue(
-            float(state.get("cost_per_m3_cut", self.cost_per_m3_cut_spin.value()))
-        )
-        self.cost_per_m2_pass_spin.setValue(
-            float(state.get("cost_per_m2_pass", self.cost_per_m2_pass_spin.value()))
-        )
+        self._bump_state_version()
+        self._schedule_recalculate()
 
 
 
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
+        self._state_version = 0
+        # Numeric mirror of lbl_total_cost kept for the Summary
+        # tab, which prefers the float over string parsing.
+        self.total_cost_value = 0.0
+        # Monotonic counter bumped whenever the result labels are
+        # repainted; the Summary tab uses it to skip stale-free
+        # refreshes.
+        self.results_version = 0
+        # Inputs of the last completed calculation; None = stale results
+        self._last_inputs: Optional[tuple] = None
+
+        # Debounce for live recalculation: editing a spin restarts this
+        # short single-shot timer, so results refresh once per pause in
+        # typing/scrolling rather than once per keystroke.
+        self._recalc_timer = QtCore.QTimer(self)
+        self._recalc_timer.setSingleShot(True)
+        self._recalc_timer.setInterval(120)
+        self._recalc_timer.timeout.connect(self._on_calculate_clicked)
+
         self._build_ui()
         self._connect_signals()
 
@@ -375,7 +390,8 @@ class LandPrepTab(QtWidgets.QWidget):
         button_layout.addWidget(self.calculate_button)
 
         # ---------------- Results ----------------
-        result_group = QtWidgets.QGroupBox("Results", content_widget)
+        self.result_group = QtWidgets.QGroupBox("Results", content_widget)
+        result_group = self.result_group
         result_form = QtWidgets.QFormLayout(result_group)
         result_form.setLabelAlignment(QtCore.Qt.AlignRight)
 
@@ -411,6 +427,25 @@ class LandPrepTab(QtWidgets.QWidget):
         result_form.addRow("Compaction cost:", self.lbl_compaction_cost)
         result_form.addRow("Total land prep cost:", self.lbl_total_cost)
 
+        # Result painter table: (bound setText, pre-bound format) per
+        # label, in the order _paint_results receives its values. Built
+        # once here so painting is a plain zip loop with no per-call
+        # attribute resolution or format-spec re-parsing.
+        self._result_bindings = (
+            (self.lbl_site_volume.setText, "{:,.3f} m³".format),
+            (self.lbl_trench_volume.setText, "{:,.3f} m³".format),
+            (self.lbl_total_cut_volume.setText, "{:,.3f} m³".format),
+            (self.lbl_platform_comp_area.setText, "{:,.2f} m²".format),
+            (self.lbl_trench_comp_area.setText, "{:,.2f} m²".format),
+            (self.lbl_total_comp_area.setText, "{:,.2f} m²".format),
+            (self.lbl_lifts_platform.setText, "{}".format),
+            (self.lbl_lifts_trench.setText, "{}".format),
+            (self.lbl_total_area_passes.setText, "{:,.2f} m²·passes".format),
+            (self.lbl_cut_cost.setText, "${:,.2f}".format),
+            (self.lbl_compaction_cost.setText, "${:,.2f}".format),
+            (self.lbl_total_cost.setText, "${:,.2f}".format),
+        )
+
         # ---------------- Add everything to the content layout ----------------
         content_layout.addWidget(prep_group)
         content_layout.addWidget(prep_note)
@@ -437,6 +472,20 @@ class LandPrepTab(QtWidgets.QWidget):
         self.calculate_button.clicked.connect(self._on_calculate_clicked)
         self.reset_button.clicked.connect(self._on_reset_clicked)
 
+        # Any input edit bumps the state version so MainWindow can reuse
+        # cached export_state snapshots for unchanged tabs, and restarts
+        # the debounce so results track the inputs live. The unchanged-
+        # input memo makes no-op edits (e.g. retyping a value) free.
+        for spin in self.findChildren((QtWidgets.QSpinBox, QtWidgets.QDoubleSpinBox)):
+            spin.valueChanged.connect(self._bump_state_version)
+            spin.valueChanged.connect(self._schedule_recalculate)
+
+    def _schedule_recalculate(self, *_args) -> None:
+        self._recalc_timer.start()
+
+    def _bump_state_version(self, *_args) -> None:
+        self._state_version += 1
+
     # ------------------------------------------------------------------
     # Core calculation logic
     # ------------------------------------------------------------------
@@ -466,6 +515,15 @@ class LandPrepTab(QtWidgets.QWidget):
         cost_per_m3_cut = float(self.cost_per_m3_cut_spin.value())
         cost_per_m2_pass = float(self.cost_per_m2_pass_spin.value())
 
+        # The labels already show the results for these exact inputs, so
+        # skip the arithmetic and the twelve setText relayouts.
+        key = (
+            A_site, H_site_cm, L_trench, W_trench, H_trench_cm, N_trench,
+            H_lift_cm, passes_per_lift, cost_per_m3_cut, cost_per_m2_pass,
+        )
+        if key == self._last_inputs:
+            return
+
         # Basic validation
         if A_site < 0 or H_site < 0 or L_trench < 0 or W_trench < 0 or H_trench < 0:
             QtWidgets.QMessageBox.warning(
@@ -499,69 +557,62 @@ class LandPrepTab(QtWidgets.QWidget):
             )
             return
 
-        # --- Volumes ---
-        # Platform disturbed volume
-        V_site = A_site * H_site
-
-        # Trench volume
-        V_trench = L_trench * W_trench * H_trench * N_trench
-
-        # Total cut volume
-        V_cut_total = V_site + V_trench
-
-        # --- Compaction areas ---
-        # Platform compaction area is just the platform plan area
-        A_comp_platform = A_site
-
-        # Trench base area
-        A_trench_base = L_trench * W_trench * N_trench
-
-        # Trench side walls (2 long sides per trench, ignoring ends)
-        A_trench_sides = 2.0 * L_trench * H_trench * N_trench
-
-        A_comp_trench = A_trench_base + A_trench_sides
-
-        # Total compaction area
-        A_comp_total = A_comp_platform + A_comp_trench
-
-        # --- Lifts and passes ---
-        n_lifts_platform = 0
-        if A_site > 0 and H_site > 0 and H_lift > 0:
-            n_lifts_platform = math.ceil(H_site / H_lift)
-
-        n_lifts_trench = 0
-        if L_trench > 0 and W_trench > 0 and H_trench > 0 and H_lift > 0:
-            n_lifts_trench = math.ceil(H_trench / H_lift)
-
-        # Total area * passes
-        A_pass_platform = A_comp_platform * n_lifts_platform * passes_per_lift
-        A_pass_trench = A_comp_trench * n_lifts_trench * passes_per_lift
-        A_pass_total = A_pass_platform + A_pass_trench
-
-        # --- Costs ---
-        cost_cut = V_cut_total * cost_per_m3_cut
-        cost_compaction = A_pass_total * cost_per_m2_pass
-        cost_total = cost_cut + cost_compaction
-
-        # --- Update labels ---
-        self.lbl_site_volume.setText(f"{V_site:,.3f} m³")
-        self.lbl_trench_volume.setText(f"{V_trench:,.3f} m³")
-        self.lbl_total_cut_volume.setText(f"{V_cut_total:,.3f} m³")
-
-        self.lbl_platform_comp_area.setText(f"{A_comp_platform:,.2f} m²")
-        self.lbl_trench_comp_area.setText(f"{A_comp_trench:,.2f} m²")
-        self.lbl_total_comp_area.setText(f"{A_comp_total:,.2f} m²")
+        # --- Compute and paint ---
+        # The shared kernel returns the twelve results in the painter's
+        # binding order, so its tuple feeds _paint_results directly.
+        result = compute(
+            A_site, H_site_cm, L_trench, W_trench, H_trench_cm, N_trench,
+            H_lift_cm, passes_per_lift, cost_per_m3_cut, cost_per_m2_pass,
+        )
+        self.total_cost_value = result.cost_total
+        self.results_version += 1
+        self._paint_results(result)
 
-        self.lbl_lifts_platform.setText(str(n_lifts_platform))
-        self.lbl_lifts_trench.setText(str(n_lifts_trench))
-        self.lbl_total_area_passes.setText(f"{A_pass_total:,.2f} m²·passes")
+        # Recorded only after the labels are written, so a validation
+        # bail-out above leaves the results marked stale.
+        self._last_inputs = key
 
-        self.lbl_cut_cost.setText(f"${cost_cut:,.2f}")
-        self.lbl_compaction_cost.setText(f"${cost_compaction:,.2f}")
-        self.lbl_total_cost.setText(f"${cost_total:,.2f}")
+    def _paint_results(self, values: tuple) -> None:
+        """
+        Write all twelve result labels — values in _result_bindings
+        order — inside one suppressed-repaint window, so the Results
+        group schedules a single paint rather than one relayout per
+        setText.
+        """
+        self.result_group.setUpdatesEnabled(False)
+        try:
+            for (setter, fmt), value in zip(self._result_bindings, values):
+                setter(fmt(value))
+        finally:
+            self.result_group.setUpdatesEnabled(True)
+            self.result_group.update()
 
     def _on_reset_clicked(self) -> None:
+        """
+        Reset to defaults with input signals blocked, so the burst of
+        widget writes does not fire connected slots once per assignment.
+        """
+        with ExitStack() as stack:
+            for w in self.findChildren(
+                (
+                    QtWidgets.QLineEdit,
+                    QtWidgets.QSpinBox,
+                    QtWidgets.QDoubleSpinBox,
+                    QtWidgets.QComboBox,
+                )
+            ):
+                stack.enter_context(QtCore.QSignalBlocker(w))
+            self._apply_defaults()
+        # Blocked signals also suppress the version bump; do it once here.
+        self._bump_state_version()
+
+    def _apply_defaults(self) -> None:
         """Reset all inputs and outputs to defaults."""
+        # The labels are rewritten directly below; drop the memo so the
+        # next calculation does not mistake them for computed results.
+        self._last_inputs = None
+        self.total_cost_value = 0.0
+        self.results_version += 1
 
         # Platform
         self.site_area_spin.setValue(0.0)
@@ -583,16 +634,10 @@ class LandPrepTab(QtWidgets.QWidget):
         self.cost_per_m3_cut_spin.setValue(3.0)
         self.cost_per_m2_pass_spin.setValue(0.01)
 
-        # Results
-        self.lbl_site_volume.setText("0.000 m³")
-        self.lbl_trench_volume.setText("0.000 m³")
-        self.lbl_total_cut_volume.setText("0.000 m³")
-        self.lbl_platform_comp_area.setText("0.00 m²")
-        self.lbl_trench_comp_area.setText("0.00 m²")
-        self.lbl_total_comp_area.setText("0.00 m²")
-        self.lbl_lifts_platform.setText("0")
-        self.lbl_lifts_trench.setText("0")
-        self.lbl_total_area_passes.setText("0.00 m²·passes")
-        self.lbl_cut_cost.setText("$0.00")
-        self.lbl_compaction_cost.setText("$0.00")
-        self.lbl_total_cost.setText("$0.00")
+        # Results, repainted once as a group
+        self._paint_results((
+            0.0, 0.0, 0.0,
+            0.0, 0.0, 0.0,
+            0, 0, 0.0,
+            0.0, 0.0, 0.0,
+        ))
@@ -0,0 +1,90 @@
+"""
+manpower_math.py
+
+Labour arithmetic behind the manpower tab, free of Qt imports so it can
+be driven in batch (crew-size scenarios) or profiled standalone. The
+GUI's Calculate path runs through the same single pass, so the
+per-trade formulas exist in exactly one place.
+"""
+
+from typing import List, NamedTuple, Sequence, Tuple
+
+
+class TradeResult(NamedTuple):
+    """Computed figures for one active trade row."""
+    index: int
+    manhours: float
+    cost: float
+
+
+class LabourTotals(NamedTuple):
+    """Workforce-wide sums over the active trades."""
+    manhours: float
+    cost: float
+
+
+def labour_costs(
+    workers: Sequence[int],
+    rates: Sequence[float],
+    days: int,
+    hours_normal: float,
+    hours_ot: float,
+    ot_factor: float,
+) -> Tuple[List[TradeResult], LabourTotals]:
+    """
+    Evaluate every trade in one pass over the two parallel input
+    sequences, returning per-trade results for the active trades plus
+    workforce totals.
+
+    A trade is active when both its headcount and rate are > 0;
+    inactive trades contribute nothing and produce no TradeResult.
+    The per-day hour terms are folded into two constants up front, so
+    the loop body is two multiplies per trade.
+    """
+    hours_per_day = hours_normal + hours_ot
+    paid_hours_per_day = hours_normal + hours_ot * ot_factor
+
+    rows: List[TradeResult] = []
+    append = rows.append
+    total_manhours = total_cost = 0.0
+
+    for i, (n, rate) in enumerate(zip(workers, rates)):
+        if n <= 0 or rate <= 0.0:
+            continue
+        worker_days = n * days
+        manhours = worker_days * hours_per_day
+        cost = worker_days * rate * paid_hours_per_day
+
+        total_manhours += manhours
+        total_cost += cost
+        append(TradeResult(i, manhours, cost))
+
+    return rows, LabourTotals(total_manhours, total_cost)
+
+
+def labour_totals(
+    workers: Sequence[int],
+    rates: Sequence[float],
+    days: int,
+    hours_normal: float,
+    hours_ot: float,
+    ot_factor: float,
+) -> LabourTotals:
+    """
+    Totals-only variant of labour_costs for batch scenario analysis,
+    where per-trade rows are not wanted. The allocation-free loop keeps
+    the fused multiply-accumulate tight enough for workforces far
+    beyond the eleven GUI trades without a compiled dependency.
+    """
+    hours_per_day = hours_normal + hours_ot
+    paid_hours_per_day = hours_normal + hours_ot * ot_factor
+
+    total_manhours = total_cost = 0.0
+    for n, rate in zip(workers, rates):
+        if n <= 0 or rate <= 0.0:
+            continue
+        worker_days = n * days
+        total_manhours += worker_days * hours_per_day
+        total_cost += worker_days * rate * paid_hours_per_day
+
+    return LabourTotals(total_manhours, total_cost)
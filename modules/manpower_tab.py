@@ -62,10 +62,45 @@ Overheads and mobilisation
                      + Cost_overhead + misc_allowance
 """
 
+from contextlib import ExitStack
 from typing import Optional, List, Tuple
 
 from PyQt5 import QtCore, QtWidgets
 
+from .manpower_math import labour_costs
+
+# The fixed trade list and its matching default rates (USD/h), built
+# once at import instead of per tab instance. Tuples: the table shape
+# is part of the saved-state contract and must not mutate at runtime.
+_TRADES: Tuple[str, ...] = (
+    "General Labourer",
+    "Carpenter / Formwork",
+    "Steel Fixer",
+    "Concrete Crew / Finisher",
+    "Mason / Block Layer",
+    "Electrician",
+    "Plumber / Pipefitter",
+    "Equipment Operator",
+    "Foreman / Supervisor",
+    "Site Engineer / Manager",
+    "Safety Officer / HSE",
+)
+
+# Reasonable default rates (USD/h) – adjust to your own reality
+_DEFAULT_RATES: Tuple[float, ...] = (
+    5.0,   # General Labourer
+    7.0,   # Carpenter / Formwork
+    7.5,   # Steel Fixer
+    6.5,   # Concrete Crew / Finisher
+    6.5,   # Mason / Block Layer
+    8.0,   # Electrician
+    7.5,   # Plumber / Pipefitter
+    8.0,   # Equipment Operator
+    10.0,  # Foreman / Supervisor
+    12.0,  # Site Engineer / Manager
+    9.0,   # Safety Officer / HSE
+)
+
 
 class ManpowerTab(QtWidgets.QWidget):
     """
@@ -74,6 +109,17 @@ class ManpowerTab(QtWidgets.QWidget):
     Wrapped in a QScrollArea so it works on smaller screens.
     """
 
+    # Static breakdown header and per-row format, bound once at class
+    # scope so each calculation reuses the compiled format instead of
+    # re-parsing the spec per trade.
+    _BREAKDOWN_HEADER = (
+        "Per-trade details:\n"
+        "Trade | Workers | Man-hours | Labour cost (USD)\n" + "-" * 60
+    )
+    _ROW_FMT = "{} | {} | {:,.1f} h | ${:,.2f}".format
+    _FMT_HOURS = "{:,.1f} h".format
+    _FMT_MONEY = "${:,.2f}".format
+
 
 
 
@@ -86,15 +132,14 @@ class ManpowerTab(QtWidgets.QWidget):
     # ------------------------------------------------------------------
 
     def export_state(self) -> dict:
-        workforce = []
-        for i in range(len(self.trades)):
-            workforce.append(
-                {
-                    "trade": self.trades[i],
-                    "workers": int(self.worker_spin_boxes[i].value()),
-                    "rate": float(self.rate_spin_boxes[i].value()),
-                }
+        # One zip pass over the parallel columns; spin values are
+        # already native ints/floats.
+        workforce = [
+            {"trade": trade, "workers": w.value(), "rate": r.value()}
+            for trade, w, r in zip(
+                self.trades, self.worker_spin_boxes, self.rate_spin_boxes
             )
+        ]
 
         return {
             "workforce": workforce,
@@ -112,15 +157,41 @@ class ManpowerTab(QtWidgets.QWidget):
         if not isinstance(state, dict):
             return
 
+        # Block every input spin for the duration of the bulk apply so
+        # the ~26 setValue calls fire no per-widget signals; the single
+        # explicit bump at the end propagates the new state.
+        with ExitStack() as stack:
+            for w in (
+                self.worker_spin_boxes
+                + self.rate_spin_boxes
+                + [
+                    self.days_spin,
+                    self.hours_normal_spin,
+                    self.hours_ot_spin,
+                    self.ot_factor_spin,
+                    self.mobilisation_spin,
+                    self.demobilisation_spin,
+                    self.daily_overhead_spin,
+                    self.misc_allowance_spin,
+                ]
+            ):
+                stack.enter_context(QtCore.QSignalBlocker(w))
+            self._apply_state(state)
+
+        # Explicit bump: widget signals were blocked during the apply.
+        self._bump_state_version()
+
+    def _apply_state(self, state: dict) -> None:
         # Workforce table
         workforce = state.get("workforce", [])
         if isinstance(workforce, list):
-            # Match by index (stable), and fall back to whatever exists
-            for i in range(min(len(workforce), len(self.trades))):
-                row = workforce[i]
+            # Match by index (stable); zip stops at the shorter side
+            for row, w_spin, r_spin in zip(
+                workforce, self.worker_spin_boxes, self.rate_spin_boxes
+            ):
                 if isinstance(row, dict):
-                    self.worker_spin_boxes[i].setValue(int(row.get("workers", 0)))
-                    self.rate_spin_boxes[i].setValue(float(row.get("rate", self.rate_spin_boxes[i].value())))
+                    w_spin.setValue(int(row.get("workers", 0)))
+                    r_spin.setValue(float(row.get("rate", r_spin.value())))
 
         # Schedule
         self.days_spin.setValue(int(state.get("days", self.days_spin.value())))
@@ -139,21 +210,19 @@ class ManpowerTab(QtWidgets.QWidget):
 
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
-        self.trades: List[str] = [
-            "General Labourer",
-            "Carpenter / Formwork",
-            "Steel Fixer",
-            "Concrete Crew / Finisher",
-            "Mason / Block Layer",
-            "Electrician",
-            "Plumber / Pipefitter",
-            "Equipment Operator",
-            "Foreman / Supervisor",
-            "Site Engineer / Manager",
-            "Safety Officer / HSE",
-        ]
+        self.trades: Tuple[str, ...] = _TRADES
         self.worker_spin_boxes: List[QtWidgets.QSpinBox] = []
         self.rate_spin_boxes: List[QtWidgets.QDoubleSpinBox] = []
+        self._state_version = 0
+        # Numeric mirror of lbl_grand_total for the Summary tab;
+        # unlike the label it exists before the lazy results UI.
+        self.total_cost_value = 0.0
+        # Monotonic counter bumped whenever the result labels are
+        # rewritten; the Summary tab uses it to skip stale-free
+        # refreshes.
+        self.results_version = 0
+        # Version last run through _on_calculate_clicked; None = never
+        self._last_calc_version: Optional[int] = None
 
         self._build_ui()
         self._connect_signals()
@@ -201,29 +270,16 @@ class ManpowerTab(QtWidgets.QWidget):
         header_trade = QtWidgets.QLabel("Trade")
         header_workers = QtWidgets.QLabel("Workers")
         header_rate = QtWidgets.QLabel("Rate (USD/h)")
-        header_trade.setStyleSheet("font-weight: bold;")
-        header_workers.setStyleSheet("font-weight: bold;")
-        header_rate.setStyleSheet("font-weight: bold;")
+        # One stylesheet on the group with a child selector, parsed
+        # once, instead of a per-label setStyleSheet CSS parse.
+        for lbl in (header_trade, header_workers, header_rate):
+            lbl.setObjectName("columnHeader")
+        workforce_group.setStyleSheet("QLabel#columnHeader { font-weight: bold; }")
 
         grid.addWidget(header_trade, 0, 0)
         grid.addWidget(header_workers, 0, 1)
         grid.addWidget(header_rate, 0, 2)
 
-        # Reasonable default rates (USD/h) – adjust to your own reality
-        default_rates = [
-            5.0,   # General Labourer
-            7.0,   # Carpenter / Formwork
-            7.5,   # Steel Fixer
-            6.5,   # Concrete Crew / Finisher
-            6.5,   # Mason / Block Layer
-            8.0,   # Electrician
-            7.5,   # Plumber / Pipefitter
-            8.0,   # Equipment Operator
-            10.0,  # Foreman / Supervisor
-            12.0,  # Site Engineer / Manager
-            9.0,   # Safety Officer / HSE
-        ]
-
         for row, trade in enumerate(self.trades, start=1):
             trade_label = QtWidgets.QLabel(trade)
             grid.addWidget(trade_label, row, 0)
@@ -238,7 +294,7 @@ class ManpowerTab(QtWidgets.QWidget):
             rate_spin.setDecimals(2)
             rate_spin.setRange(0.0, 1000.0)
             rate_spin.setSingleStep(0.5)
-            rate_spin.setValue(default_rates[row - 1])
+            rate_spin.setValue(_DEFAULT_RATES[row - 1])
             grid.addWidget(rate_spin, row, 2)
 
             self.worker_spin_boxes.append(worker_spin)
@@ -345,8 +401,35 @@ class ManpowerTab(QtWidgets.QWidget):
         button_layout.addWidget(self.reset_button)
         button_layout.addWidget(self.calculate_button)
 
-        # ---------------- Results ----------------
-        result_group = QtWidgets.QGroupBox("Results", content_widget)
+        # ---------------- Results (built lazily) ----------------
+        # The results group — five labels plus the breakdown document —
+        # is the most widget-heavy block of the tab and shows nothing
+        # until the first calculation, so a bare placeholder holds its
+        # spot and _ensure_results_ui builds the real group on demand.
+        self._results_built = False
+        self._results_placeholder = QtWidgets.QWidget(content_widget)
+        self._content_layout = content_layout
+
+        # ---------------- Assemble content layout ----------------
+        content_layout.addWidget(workforce_group)
+        content_layout.addWidget(schedule_group)
+        content_layout.addWidget(schedule_note)
+        content_layout.addWidget(overhead_group)
+        content_layout.addWidget(overhead_note)
+        content_layout.addLayout(button_layout)
+        content_layout.addWidget(self._results_placeholder)
+        content_layout.addStretch(1)
+
+        scroll_area.setWidget(content_widget)
+        outer_layout.addWidget(scroll_area)
+
+    def _ensure_results_ui(self) -> None:
+        """Build the Results group on first use and swap it into place."""
+        if self._results_built:
+            return
+        self._results_built = True
+
+        result_group = QtWidgets.QGroupBox("Results")
         result_form = QtWidgets.QFormLayout(result_group)
         result_form.setLabelAlignment(QtCore.Qt.AlignRight)
 
@@ -370,18 +453,10 @@ class ManpowerTab(QtWidgets.QWidget):
         )
         result_form.addRow("Per-trade breakdown:", self.breakdown_text)
 
-        # ---------------- Assemble content layout ----------------
-        content_layout.addWidget(workforce_group)
-        content_layout.addWidget(schedule_group)
-        content_layout.addWidget(schedule_note)
-        content_layout.addWidget(overhead_group)
-        content_layout.addWidget(overhead_note)
-        content_layout.addLayout(button_layout)
-        content_layout.addWidget(result_group)
-        content_layout.addStretch(1)
-
-        scroll_area.setWidget(content_widget)
-        outer_layout.addWidget(scroll_area)
+        index = self._content_layout.indexOf(self._results_placeholder)
+        self._content_layout.removeWidget(self._results_placeholder)
+        self._results_placeholder.deleteLater()
+        self._content_layout.insertWidget(index, result_group)
 
     # ------------------------------------------------------------------
     # Signal wiring
@@ -392,6 +467,14 @@ class ManpowerTab(QtWidgets.QWidget):
         self.calculate_button.clicked.connect(self._on_calculate_clicked)
         self.reset_button.clicked.connect(self._on_reset_clicked)
 
+        # Any input edit bumps the state version so MainWindow can reuse
+        # cached export_state snapshots for unchanged tabs.
+        for spin in self.findChildren((QtWidgets.QSpinBox, QtWidgets.QDoubleSpinBox)):
+            spin.valueChanged.connect(self._bump_state_version)
+
+    def _bump_state_version(self, *_args) -> None:
+        self._state_version += 1
+
     # ------------------------------------------------------------------
     # Core logic
     # ------------------------------------------------------------------
@@ -401,6 +484,13 @@ class ManpowerTab(QtWidgets.QWidget):
         Calculate man-hours and costs for all trades
         plus mobilisation and overheads.
         """
+        # Nothing changed since the last run: the displayed results are
+        # still valid, so skip the recompute and breakdown rebuild.
+        if self._state_version == self._last_calc_version:
+            return
+
+        self._ensure_results_ui()
+
         days = int(self.days_spin.value())
         hours_normal = float(self.hours_normal_spin.value())
         hours_ot = float(self.hours_ot_spin.value())
@@ -411,97 +501,117 @@ class ManpowerTab(QtWidgets.QWidget):
         daily_overhead = float(self.daily_overhead_spin.value())
         misc_allowance = float(self.misc_allowance_spin.value())
 
-        if days <= 0:
+        # One combined check on the hot path; the specific message is
+        # only worked out in the cold helper once something is wrong.
+        if days <= 0 or hours_normal < 0 or hours_ot < 0 or ot_factor < 1.0:
             QtWidgets.QMessageBox.warning(
                 self,
                 "Invalid Input",
-                "Working days must be greater than zero.",
+                self._validation_error(days, hours_normal, hours_ot, ot_factor),
             )
             return
 
-        if hours_normal < 0 or hours_ot < 0:
-            QtWidgets.QMessageBox.warning(
-                self,
-                "Invalid Input",
-                "Working hours cannot be negative.",
-            )
-            return
-
-        if ot_factor < 1.0:
-            QtWidgets.QMessageBox.warning(
-                self,
-                "Invalid Input",
-                "Overtime factor should be at least 1.0.",
-            )
-            return
-
-        total_manhours = 0.0
-        total_labour_cost = 0.0
-
-        breakdown_lines: List[str] = []
-        breakdown_lines.append(
-            f"Schedule: {days} days, {hours_normal:.1f} h/day normal, "
-            f"{hours_ot:.1f} h/day overtime at x{ot_factor:.2f}.\n"
-        )
-        breakdown_lines.append("Per-trade details:")
-        breakdown_lines.append(
-            "Trade | Workers | Man-hours | Labour cost (USD)"
+        # Snapshot the trade columns, then run the whole workforce
+        # through the shared single-pass kernel.
+        workers = [sb.value() for sb in self.worker_spin_boxes]
+        rates = [sb.value() for sb in self.rate_spin_boxes]
+        trade_results, totals = labour_costs(
+            workers, rates, days, hours_normal, hours_ot, ot_factor
         )
-        breakdown_lines.append("-" * 60)
-
-        # Per-trade calculations
-        for idx, trade in enumerate(self.trades):
-            n_workers = int(self.worker_spin_boxes[idx].value())
-            rate = float(self.rate_spin_boxes[idx].value())
-
-            if n_workers <= 0 or rate <= 0:
-                # If either is zero, we treat the trade as inactive.
-                continue
-
-            manhours_trade = n_workers * days * (hours_normal + hours_ot)
-
-            cost_normal = n_workers * days * hours_normal * rate
-            cost_ot = n_workers * days * hours_ot * rate * ot_factor
-            cost_trade = cost_normal + cost_ot
+        total_manhours = totals.manhours
+        total_labour_cost = totals.cost
 
-            total_manhours += manhours_trade
-            total_labour_cost += cost_trade
+        header_lines = [
+            f"Schedule: {days} days, {hours_normal:.1f} h/day normal, "
+            f"{hours_ot:.1f} h/day overtime at x{ot_factor:.2f}.\n",
+            self._BREAKDOWN_HEADER,
+        ]
 
-            breakdown_lines.append(
-                f"{trade} | {n_workers} | {manhours_trade:,.1f} h | ${cost_trade:,.2f}"
-            )
+        # One preformatted line per active trade via the class-level
+        # row format, built in a single comprehension.
+        row_fmt = self._ROW_FMT
+        row_lines = [
+            row_fmt(self.trades[r.index], workers[r.index], r.manhours, r.cost)
+            for r in trade_results
+        ]
 
         # Mobilisation, overheads, grand total
         mob_cost = mobilisation + demobilisation
         overhead_cost = daily_overhead * days + misc_allowance
         grand_total = total_labour_cost + mob_cost + overhead_cost
 
-        # Update labels
-        self.lbl_total_manhours.setText(f"{total_manhours:,.1f} h")
-        self.lbl_total_labour_cost.setText(f"${total_labour_cost:,.2f}")
-        self.lbl_mob_cost.setText(f"${mob_cost:,.2f}")
-        self.lbl_overhead_cost.setText(f"${overhead_cost:,.2f}")
-        self.lbl_grand_total.setText(f"${grand_total:,.2f}")
-
-        # Add summary lines for overheads and totals
-        breakdown_lines.append("")
-        breakdown_lines.append(
-            f"Total labour cost: ${total_labour_cost:,.2f}"
-        )
-        breakdown_lines.append(
-            f"Mobilisation + demobilisation: ${mob_cost:,.2f}"
-        )
-        breakdown_lines.append(
-            f"Overhead + misc: ${overhead_cost:,.2f}"
-        )
-        breakdown_lines.append(
-            f"Grand total manpower-related cost: ${grand_total:,.2f}"
+        # Update labels through the class-level pre-bound formats; the
+        # changed-guard skips the relayout/repaint for any label whose
+        # rendered text is identical to what it already shows.
+        money = self._FMT_MONEY
+        set_text = self._set_if_changed
+        set_text(self.lbl_total_manhours, self._FMT_HOURS(total_manhours))
+        set_text(self.lbl_total_labour_cost, money(total_labour_cost))
+        set_text(self.lbl_mob_cost, money(mob_cost))
+        set_text(self.lbl_overhead_cost, money(overhead_cost))
+        set_text(self.lbl_grand_total, money(grand_total))
+        self.total_cost_value = grand_total
+        self.results_version += 1
+
+        # Summary lines for overheads and totals
+        footer_lines = [
+            "",
+            f"Total labour cost: ${total_labour_cost:,.2f}",
+            f"Mobilisation + demobilisation: ${mob_cost:,.2f}",
+            f"Overhead + misc: ${overhead_cost:,.2f}",
+            f"Grand total manpower-related cost: ${grand_total:,.2f}",
+        ]
+
+        self.breakdown_text.setPlainText(
+            "\n".join(header_lines + row_lines + footer_lines)
         )
 
-        self.breakdown_text.setPlainText("\n".join(breakdown_lines))
+        # Recorded only after a successful run, so a failed validation
+        # does not mark the current inputs as calculated.
+        self._last_calc_version = self._state_version
+
+    @staticmethod
+    def _validation_error(
+        days: int, hours_normal: float, hours_ot: float, ot_factor: float
+    ) -> str:
+        """Pick the message for the first failed schedule check.
+        Called only after the combined test has already failed."""
+        if days <= 0:
+            return "Working days must be greater than zero."
+        if hours_normal < 0 or hours_ot < 0:
+            return "Working hours cannot be negative."
+        return "Overtime factor should be at least 1.0."
+
+    @staticmethod
+    def _set_if_changed(label: QtWidgets.QLabel, text: str) -> None:
+        """setText only when the text differs; QLabel.setText always
+        invalidates its layout even for an identical string."""
+        if label.text() != text:
+            label.setText(text)
 
     def _on_reset_clicked(self) -> None:
+        """
+        Reset to defaults with input signals blocked, so the burst of
+        widget writes does not fire connected slots once per assignment.
+        """
+        with ExitStack() as stack:
+            for w in self.findChildren(
+                (
+                    QtWidgets.QLineEdit,
+                    QtWidgets.QSpinBox,
+                    QtWidgets.QDoubleSpinBox,
+                    QtWidgets.QComboBox,
+                )
+            ):
+                stack.enter_context(QtCore.QSignalBlocker(w))
+            self._apply_defaults()
+        # Blocked signals also suppress the version bump; do it once here.
+        self._bump_state_version()
+
+    def _apply_defaults(self) -> None:
         """Reset all inputs and outputs to defaults."""
+        self.total_cost_value = 0.0
+        self.results_version += 1
 
         # Reset workers and keep default rates
         for spin in self.worker_spin_boxes:
@@ -517,12 +627,17 @@ class ManpowerTab(QtWidgets.QWidget):
         self.daily_overhead_spin.setValue(0.0)
         self.misc_allowance_spin.setValue(0.0)
 
-        self.lbl_total_manhours.setText("0.0 h")
-        self.lbl_total_labour_cost.setText("$0.00")
-        self.lbl_mob_cost.setText("$0.00")
-        self.lbl_overhead_cost.setText("$0.00")
-        self.lbl_grand_total.setText("$0.00")
-        self.breakdown_text.clear()
-        self.breakdown_text.setPlaceholderText(
-            "Per-trade breakdown will appear here after calculation."
-        )
+        # Result widgets only exist once something has been calculated.
+        # A reset straight after a reset leaves all of these at their
+        # zero text already, so the guard makes the second pass free.
+        if self._results_built:
+            set_text = self._set_if_changed
+            set_text(self.lbl_total_manhours, "0.0 h")
+            set_text(self.lbl_total_labour_cost, "$0.00")
+            set_text(self.lbl_mob_cost, "$0.00")
+            set_text(self.lbl_overhead_cost, "$0.00")
+            set_text(self.lbl_grand_total, "$0.00")
+            self.breakdown_text.clear()
+            self.breakdown_text.setPlaceholderText(
+                "Per-trade breakdown will appear here after calculation."
+            )
@@ -14,14 +14,27 @@ This is intentionally plain JSON:
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+# Optional C-accelerated JSON backend. Falls back to stdlib json, which
+# produces the same plain, diffable files.
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
 PROJECT_FILE_EXT = ".ashproj.json"
 PROJECT_SCHEMA_VERSION = 1
 
+# Buffer size for project file reads/writes (project files are small,
+# but one buffered write beats many small ones on slow/network drives).
+_IO_BUFFER_SIZE = 1 << 20
+
 
 def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -43,7 +56,86 @@ def save_project(path: str, data: Dict[str, Any]) -> None:
 
     p = Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    # Write to a sibling temp file and rename over the target, so a
+    # crash mid-save can never leave a truncated project behind —
+    # os.replace is atomic on the same filesystem.
+    tmp = p.with_name(p.name + ".tmp")
+    try:
+        if orjson is not None:
+            with open(tmp, "wb", buffering=_IO_BUFFER_SIZE) as f:
+                f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+                f.flush()
+                os.fsync(f.fileno())
+        else:
+            # json.dump streams straight into the buffered handle,
+            # skipping the intermediate str + encode of dumps().
+            with open(tmp, "w", encoding="utf-8", buffering=_IO_BUFFER_SIZE) as f:
+                json.dump(payload, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, p)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def state_digest(data: Dict[str, Any]) -> str:
+    """
+    Stable fingerprint of a project state dict.
+
+    Keys are sorted so the digest only changes when the actual inputs do,
+    not when dict insertion order happens to differ.
+    """
+    if orjson is not None:
+        raw = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    else:
+        raw = json.dumps(data, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _summary_cache_path(project_path: str) -> Path:
+    return Path(project_path + ".cache")
+
+
+def save_summary_cache(project_path: str, data: Dict[str, Any], totals: Dict[str, Any]) -> None:
+    """
+    Write the computed summary totals to a sidecar cache file next to
+    the project, keyed by the project state's digest. Best-effort: a
+    failure here must never break a save.
+    """
+    payload = {"state_digest": state_digest(data), "totals": totals}
+    try:
+        if orjson is not None:
+            raw = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+        else:
+            raw = json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+        with open(_summary_cache_path(project_path), "wb", buffering=_IO_BUFFER_SIZE) as f:
+            f.write(raw)
+    except OSError:
+        pass
+
+
+def load_summary_cache(project_path: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Return cached summary totals for `data` if the sidecar cache exists
+    and its digest matches, else None (missing/stale/corrupt all count
+    as a miss).
+    """
+    try:
+        with open(_summary_cache_path(project_path), "rb", buffering=_IO_BUFFER_SIZE) as f:
+            raw = f.read()
+        payload = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(payload, dict):
+        return None
+    if payload.get("state_digest") != state_digest(data):
+        return None
+
+    totals = payload.get("totals", None)
+    return totals if isinstance(totals, dict) else None
 
 
 def load_project(path: str) -> Dict[str, Any]:
@@ -53,8 +145,13 @@ def load_project(path: str) -> Dict[str, Any]:
     Returns:
         The 'data' dict from the project file.
     """
-    p = Path(path)
-    payload = json.loads(p.read_text(encoding="utf-8"))
+    with open(path, "rb", buffering=_IO_BUFFER_SIZE) as f:
+        raw = f.read()
+
+    if orjson is not None:
+        payload = orjson.loads(raw)
+    else:
+        payload = json.loads(raw)
 
     if not isinstance(payload, dict):
         raise ValueError("Invalid project file: root is not an object.")
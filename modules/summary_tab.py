@@ -24,62 +24,202 @@ The tab is intentionally defensive:
   it will show "N/A" instead of crashing.
 """
 
+import functools
+import importlib.util
+import io
+import math
 import os
 import datetime
 
 import sys
 import subprocess
-from typing import Optional, List
+from typing import Callable, Optional, List
 
-from PyQt5 import QtCore, QtWidgets
+from PyQt5 import QtCore, QtGui, QtWidgets
 
 
-# Optional import of reportlab for PDF generation
-try:
-    from reportlab.lib.pagesizes import A4
-    from reportlab.pdfgen import canvas
-    from reportlab.lib import colors
-except ImportError:  # pragma: no cover
-    canvas = None  # type: ignore[misc]
+# Deletes "$" and "," in one C-level pass when parsing currency text.
+_STRIP_TABLE = str.maketrans("", "", "$,")
+
+# reportlab (optional, for PDF generation) is imported lazily by
+# _ensure_reportlab on the first export: the package drags in many
+# submodules and font data, a cost users who never export should not
+# pay at startup. Until then these globals stay None.
+canvas = None  # type: ignore[assignment]
+A4 = None
+colors = None
+
+
+def _ensure_reportlab() -> bool:
+    """
+    Import reportlab and build the report geometry/palette constants on
+    first use. Returns False when the package is not installed; later
+    calls after a success are a single boolean check.
+    """
+    global canvas, A4, colors
+    global _A4_W, _A4_H, _PDF_BG, _PDF_BORDER, _PDF_TEXT, _PDF_TEXT_DIM, _PDF_ORANGE
+
+    if canvas is not None:
+        return True
+
+    try:
+        from reportlab.lib.pagesizes import A4 as _a4
+        from reportlab.pdfgen import canvas as _canvas
+        from reportlab.lib import colors as _colors
+    except ImportError:  # pragma: no cover
+        return False
+
+    A4 = _a4
+    colors = _colors
+
+    # Geometry and palette, built once per process instead of
+    # re-parsing five hex colours on every export.
+    _A4_W, _A4_H = _a4
+    _PDF_BG = _colors.HexColor("#050B1A")        # deep navy background
+    _PDF_BORDER = _colors.HexColor("#223056")    # subtle borders/lines
+    _PDF_TEXT = _colors.HexColor("#F5F5F5")      # main text
+    _PDF_TEXT_DIM = _colors.HexColor("#A9B0C5")  # secondary text
+    _PDF_ORANGE = _colors.HexColor("#FF7A00")    # signature accent
+
+    # Assigned last so a half-initialised module can never look ready.
+    canvas = _canvas
+    return True
+
+
+# Static report layout, built once at import. Each section body is a
+# tuple of literal lines and (label, template) pairs; the templates are
+# resolved against the snapshot dict with str.format_map at draw time,
+# so per-export work for the fixed parts of the report is a lookup and
+# a format, not rebuilding the structure.
+_SECTION_COSTS_ROWS = (
+    ("1.1 Blockwork (breeze blocks):", "{blocks_cost}"),
+    ("1.2 Sweet sand (reactor base):", "{sand_cost}"),
+    ("1.3 Concrete works:", "{concrete_cost}"),
+    ("1.4 Land preparation:", "{land_prep_cost}"),
+    ("1.5 Manpower:", "{manpower_cost}"),
+    ("1.6 Equipment & machinery:", "{equipment_cost}"),
+)
+
+_SECTION_BLOCKWORK_ROWS = (
+    ("2.1 Total blockwork area:", "{block_area}"),
+    ("2.2 Straight walls area:", "{wall_area}"),
+    ("2.3 Half-circle arcs area:", "{arc_area}"),
+    ("2.4 Raceway reactor walls area:", "{reactor_area}"),
+    "",
+    ("2.5 Blocks required:", "{blocks}"),
+    ("2.6 Pallets required:", "{pallets}"),
+    ("2.7 Leftover blocks (last pallet):", "{leftover}"),
+)
+
+_SECTION_SAND_ROWS = (
+    ("3.1 Total sweet sand cost:", "{sand_cost}"),
+    ("3.2 Sweet sand volume:", "{sand_volume}"),
+)
+
+_SECTION_CONCRETE_ROWS = (
+    "4.1 Total concrete works cost (tab total): {concrete_cost}",
+    "",
+    "4.2 Key quantities:",
+    ("      • Concrete volume:", "{concrete_volume}"),
+    ("      • Concrete weight:", "{conc_weight}"),
+    ("      • Rebar quantity:", "{rebar_kg} ({rebar_tons})"),
+    ("      • Formwork area (vertical):", "{form_area}"),
+    "",
+    "4.3 Cost breakdown (if available on tab):",
+    ("      • Concrete cost:", "{conc_cost}"),
+    ("      • Rebar cost:", "{rebar_cost}"),
+    ("      • Formwork cost:", "{formwork_cost}"),
+)
+
+_SECTION_LAND_ROWS = (
+    ("5.1 Total land preparation cost:", "{land_prep_cost}"),
+    ("5.2 Total cut volume:", "{land_cut_volume}"),
+)
+
+_SECTION_MANPOWER_ROWS = (
+    ("6.1 Total manpower cost:", "{manpower_cost}"),
+    ("6.2 Total man-hours:", "{manhours}"),
+    "",
+    "6.3 Notes:",
+    "      • Uses your tab totals (refresh the tab before exporting for best results).",
+)
+
+_SECTION_EQUIPMENT_ROWS = (
+    "7.1 Totals:",
+    ("      • Operating hours (all machines):", "{equipment_hours}"),
+    ("      • Total equipment cost:", "{equipment_cost}"),
+    "",
+    "7.2 Fuel & overheads:",
+    ("      • Fuel consumption:", "{fuel_litres}"),
+    ("      • Fuel cost:", "{fuel_cost}"),
+    ("      • Mobilisation + demob:", "{mob_cost}"),
+    ("      • Plant overhead + misc:", "{overhead_cost}"),
+    "",
+)
+
+_SECTION_NOTES_ROWS = (
+    "- This is an internal report for internal use and estimates only.",
+    "- For final design and construction, verify quantities, unit rates,",
+    "  and assumptions with detailed engineering drawings and site conditions.",
+)
+
+
+class _ReportSignals(QtCore.QObject):
+    """Signal holder for _ReportWorker (QRunnable cannot emit itself)."""
+
+    finished = QtCore.pyqtSignal(str)           # path
+    failed = QtCore.pyqtSignal(str, str)        # path, error message
+
+
+class _ReportWorker(QtCore.QRunnable):
+    """
+    Draws the PDF report on a pool thread from a plain-dict snapshot of
+    the label texts, keeping the GUI thread free to pump events while
+    ReportLab does its CPU-bound work. The snapshot is taken on the UI
+    thread, so run() never touches a widget.
+    """
+
+    def __init__(self, path: str, snapshot: dict) -> None:
+        super().__init__()
+        self.signals = _ReportSignals()
+        self._path = path
+        self._snapshot = snapshot
+
+    def run(self) -> None:  # executed on a QThreadPool thread
+        try:
+            SummaryTab._write_pdf_from_snapshot(self._path, self._snapshot)
+        except Exception as exc:  # pragma: no cover
+            self.signals.failed.emit(self._path, str(exc))
+        else:
+            self.signals.finished.emit(self._path)
 
 
 class SummaryTab(QtWidgets.QWidget):
     """
     Summary / dashboard tab.
 
-    It does NOT own the data. Instead it receives references to the
-    other tabs and reads from their labels when "Refresh" or "Export"
-    is pressed.
+    It does NOT own the data. Instead it receives a tab provider
+    callable and reads from the other tabs' labels when "Refresh" or
+    "Export" is pressed. Tabs are only resolved (and therefore only
+    built, if the main window constructs them lazily) at that point,
+    so creating the Summary does not force every calculator to exist.
 
     Parameters
     ----------
-    breeze_tab        : BreezeBlockTab
-    sweet_sand_tab    : SweetSandTab
-    concrete_tab      : ConcreteTab
-    land_prep_tab     : LandPrepTab
-    manpower_tab      : ManpowerTab
-    equipment_tab     : EquipmentTab
+    tab_provider : Callable[[str], QtWidgets.QWidget]
+        Maps a tab key ("breeze_block", "sweet_sand", "concrete",
+        "land_prep", "manpower", "equipment") to the tab widget.
     """
 
     def __init__(
         self,
-        breeze_tab: QtWidgets.QWidget,
-        sweet_sand_tab: QtWidgets.QWidget,
-        concrete_tab: QtWidgets.QWidget,
-        land_prep_tab: QtWidgets.QWidget,
-        manpower_tab: QtWidgets.QWidget,
-        equipment_tab: QtWidgets.QWidget,
+        tab_provider: Callable[[str], QtWidgets.QWidget],
         parent: Optional[QtWidgets.QWidget] = None,
     ) -> None:
         super().__init__(parent)
 
-        # References to the other tabs
-        self.breeze_tab = breeze_tab
-        self.sweet_sand_tab = sweet_sand_tab
-        self.concrete_tab = concrete_tab
-        self.land_prep_tab = land_prep_tab
-        self.manpower_tab = manpower_tab
-        self.equipment_tab = equipment_tab
+        # Resolves tab keys to the live tab widgets on demand
+        self._tab_provider = tab_provider
 
         # These will hold the last computed numeric totals
         self._cost_block = 0.0
@@ -90,9 +230,46 @@ class SummaryTab(QtWidgets.QWidget):
         self._cost_equipment = 0.0
         self._cost_total = 0.0
 
+        # Candidate label names resolved per tab: (id(tab), key) -> the
+        # attribute that actually exists, so refresh probes each list
+        # of fallback names only once.
+        self._resolved_attrs: dict = {}
+
+        # results_version of each tab as of the last refresh; when no
+        # counter moved, refresh_summary returns without doing any work.
+        self._last_versions: dict = {}
+
         self._build_ui()
         self._connect_signals()
 
+    # ------------------------------------------------------------------
+    # Tab access (resolved lazily through the provider)
+    # ------------------------------------------------------------------
+
+    @property
+    def breeze_tab(self) -> QtWidgets.QWidget:
+        return self._tab_provider("breeze_block")
+
+    @property
+    def sweet_sand_tab(self) -> QtWidgets.QWidget:
+        return self._tab_provider("sweet_sand")
+
+    @property
+    def concrete_tab(self) -> QtWidgets.QWidget:
+        return self._tab_provider("concrete")
+
+    @property
+    def land_prep_tab(self) -> QtWidgets.QWidget:
+        return self._tab_provider("land_prep")
+
+    @property
+    def manpower_tab(self) -> QtWidgets.QWidget:
+        return self._tab_provider("manpower")
+
+    @property
+    def equipment_tab(self) -> QtWidgets.QWidget:
+        return self._tab_provider("equipment")
+
     # ------------------------------------------------------------------
     # UI
     # ------------------------------------------------------------------
@@ -164,6 +341,16 @@ class SummaryTab(QtWidgets.QWidget):
 
         self.export_button = QtWidgets.QPushButton("Export Report (PDF)", self)
         self.export_button.setObjectName("primaryButton")
+        # find_spec tells us whether reportlab is installed without
+        # importing it (the import itself stays deferred to the first
+        # export). Disabling here spares the user picking a filename
+        # only to hit the "not installed" dialog afterwards.
+        if importlib.util.find_spec("reportlab") is None:
+            self.export_button.setEnabled(False)
+            self.export_button.setToolTip(
+                "PDF export requires the 'reportlab' package "
+                "(pip install reportlab)."
+            )
 
         btn_layout.addWidget(self.refresh_button)
         btn_layout.addWidget(self.export_button)
@@ -196,31 +383,84 @@ class SummaryTab(QtWidgets.QWidget):
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _parse_currency_label(lbl: Optional[QtWidgets.QLabel]) -> float:
+    @functools.lru_cache(maxsize=256)
+    def _parse_currency_text(text: str) -> float:
         """
-        Parse a QLabel containing a currency-like string such as:
-        "$1,234.56" or "1,234.56 USD" into a float.
+        Parse a currency-like string such as "$1,234.56" or
+        "1,234.56 USD" into a float. Returns 0.0 if parsing fails.
 
-        Returns 0.0 if parsing fails or lbl is None.
+        Cached on the raw string: refreshes and exports keep handing in
+        the same unchanged label texts ("$0.00" above all), so repeat
+        parses collapse into a dict hit. Strings are immutable, which
+        makes the cache safe to share across instances.
         """
-        if lbl is None:
-            return 0.0
-
-        text = lbl.text().strip()
+        # Strip "$" and "," via one translate pass plus a single
+        # replace for the multi-character "USD" marker, instead of a
+        # fresh string allocation per stripped token.
+        text = text.translate(_STRIP_TABLE).replace("USD", "").strip()
         if not text:
             return 0.0
 
-        # Remove common currency characters and commas
-        for ch in ["$", "USD", ","]:
-            text = text.replace(ch, "")
-
-        text = text.strip()
-
         try:
             return float(text)
         except ValueError:
             return 0.0
 
+    @classmethod
+    def _parse_currency_label(cls, lbl: Optional[QtWidgets.QLabel]) -> float:
+        """
+        Parse the currency text of a QLabel into a float;
+        0.0 if lbl is None.
+        """
+        if lbl is None:
+            return 0.0
+        return cls._parse_currency_text(lbl.text())
+
+    def _tab_cost(self, tab: QtWidgets.QWidget, label_attr: str) -> float:
+        """
+        Read a tab's total cost as a number.
+
+        Every bundled tab mirrors its total into `total_cost_value`
+        whenever it calculates, so the common path is a plain attribute
+        load; parsing the label text remains as the fallback for tabs
+        that predate the mirror.
+        """
+        value = getattr(tab, "total_cost_value", None)
+        if value is not None:
+            return float(value)
+        return self._parse_currency_label(getattr(tab, label_attr, None))
+
+    def _find_label_text(
+        self,
+        tab: QtWidgets.QWidget,
+        key: str,
+        candidates: List[str],
+        default: str = "N/A",
+    ) -> str:
+        """
+        Return the text of the first existing label among `candidates`
+        on `tab`, remembering which name matched so later refreshes go
+        straight to it instead of re-probing the whole list.
+        """
+        cache_key = (id(tab), key)
+        attr = self._resolved_attrs.get(cache_key)
+        if attr is not None:
+            return self._safe_label_text(tab, attr, default)
+
+        for candidate in candidates:
+            text = self._safe_label_text(tab, candidate, default)
+            if text != default:
+                self._resolved_attrs[cache_key] = candidate
+                return text
+        return default
+
+    @staticmethod
+    def _set_if_changed(label: QtWidgets.QLabel, text: str) -> None:
+        """setText only when the text differs — QLabel relayouts and
+        repaints even when handed an identical string."""
+        if label.text() != text:
+            label.setText(text)
+
     @staticmethod
     def _safe_label_text(widget: QtWidgets.QWidget, attr: str, default: str = "N/A") -> str:
         """
@@ -241,97 +481,171 @@ class SummaryTab(QtWidgets.QWidget):
         Pull values from all other tabs and update the summary labels.
         """
 
-        # ------------ Blockwork cost ------------
-        blocks_cost_lbl = getattr(self.breeze_tab, "lbl_total_cost", None)
-        self._cost_block = self._parse_currency_label(blocks_cost_lbl)
-        self.lbl_blocks_cost.setText(f"${self._cost_block:,.2f}")
+        # Every tab bumps results_version when its result labels are
+        # rewritten, so an unchanged set of counters means this summary
+        # is already current — the frequent "refresh to be safe" /
+        # export-without-edits case costs six attribute reads. A tab
+        # without the counter reports None and always refreshes.
+        versions = {
+            "breeze": getattr(self.breeze_tab, "results_version", None),
+            "sand": getattr(self.sweet_sand_tab, "results_version", None),
+            "concrete": getattr(self.concrete_tab, "results_version", None),
+            "land_prep": getattr(self.land_prep_tab, "results_version", None),
+            "manpower": getattr(self.manpower_tab, "results_version", None),
+            "equipment": getattr(self.equipment_tab, "results_version", None),
+        }
+        if None not in versions.values() and versions == self._last_versions:
+            return
 
-        # Blockwork area
-        self.lbl_block_area.setText(
-            self._safe_label_text(self.breeze_tab, "lbl_total_area", "N/A")
-        )
+        # Suppress repaints while the fifteen labels are rewritten, so
+        # the two form layouts settle in one pass instead of once per
+        # setText.
+        self.setUpdatesEnabled(False)
+        set_text = self._set_if_changed
+        try:
+            # ------------ Costs ------------
+            tab_cost = self._tab_cost
+            vals = (
+                tab_cost(self.breeze_tab, "lbl_total_cost"),
+                tab_cost(self.sweet_sand_tab, "lbl_total_cost"),
+                tab_cost(self.concrete_tab, "lbl_total_cost"),
+                tab_cost(self.land_prep_tab, "lbl_total_cost"),
+                tab_cost(self.manpower_tab, "lbl_grand_total"),
+                tab_cost(self.equipment_tab, "lbl_grand_total"),
+            )
+            (
+                self._cost_block,
+                self._cost_sand,
+                self._cost_concrete,
+                self._cost_land_prep,
+                self._cost_manpower,
+                self._cost_equipment,
+            ) = vals
+
+            # One comprehension formats all six costs, then the pairs
+            # zip onto their labels through the changed-guard.
+            cost_labels = (
+                self.lbl_blocks_cost,
+                self.lbl_sand_cost,
+                self.lbl_concrete_cost,
+                self.lbl_land_prep_cost,
+                self.lbl_manpower_cost,
+                self.lbl_equipment_cost,
+            )
+            for lbl, text in zip(cost_labels, [f"${v:,.2f}" for v in vals]):
+                set_text(lbl, text)
+
+            # fsum: one exact summation pass over the tuple.
+            self._cost_total = math.fsum(vals)
+            set_text(self.lbl_total_cost, f"${self._cost_total:,.2f}")
+
+            # ------------ Key quantity snapshots ------------
+            # Blockwork area
+            set_text(
+                self.lbl_block_area,
+                self._safe_label_text(self.breeze_tab, "lbl_total_area", "N/A"),
+            )
 
-        # ------------ Sweet sand cost ------------
-        sand_cost_lbl = getattr(self.sweet_sand_tab, "lbl_total_cost", None)
-        self._cost_sand = self._parse_currency_label(sand_cost_lbl)
-        self.lbl_sand_cost.setText(f"${self._cost_sand:,.2f}")
-
-        # Sweet sand volume
-        sand_volume = "N/A"
-        for candidate in ["lbl_volume_total", "lbl_total_volume", "lbl_total_sand_volume", "lbl_total_volume_m3"]:
-            sand_volume = self._safe_label_text(self.sweet_sand_tab, candidate, "N/A")
-            if sand_volume != "N/A":
-                break
-        self.lbl_sand_volume.setText(sand_volume)
-
-        # ------------ Concrete cost ------------
-        concrete_cost_lbl = getattr(self.concrete_tab, "lbl_total_cost", None)
-        self._cost_concrete = self._parse_currency_label(concrete_cost_lbl)
-        self.lbl_concrete_cost.setText(f"${self._cost_concrete:,.2f}")
-
-        # Concrete volume
-        concrete_volume = "N/A"
-        for candidate in ["lbl_volume", "lbl_concrete_volume", "lbl_total_concrete_volume", "lbl_concrete_vol"]:
-            concrete_volume = self._safe_label_text(self.concrete_tab, candidate, "N/A")
-            if concrete_volume != "N/A":
-                break
-        self.lbl_concrete_volume.setText(concrete_volume)
-
-        # NEW: Concrete formwork area + rebar snapshot (defensive)
-        concrete_form_area = "N/A"
-        for candidate in ["lbl_form_area", "lbl_formwork_area", "lbl_concrete_form_area"]:
-            concrete_form_area = self._safe_label_text(self.concrete_tab, candidate, "N/A")
-            if concrete_form_area != "N/A":
-                break
-        self.lbl_concrete_formwork_area.setText(concrete_form_area)
-
-        concrete_rebar = "N/A"
-        for candidate in ["lbl_rebar_kg", "lbl_rebar_qty", "lbl_rebar"]:
-            concrete_rebar = self._safe_label_text(self.concrete_tab, candidate, "N/A")
-            if concrete_rebar != "N/A":
-                break
-        self.lbl_concrete_rebar.setText(concrete_rebar)
-
-        # ------------ Land preparation cost ------------
-        land_cost_lbl = getattr(self.land_prep_tab, "lbl_total_cost", None)
-        self._cost_land_prep = self._parse_currency_label(land_cost_lbl)
-        self.lbl_land_prep_cost.setText(f"${self._cost_land_prep:,.2f}")
-
-        # Land cut volume
-        self.lbl_land_cut_volume.setText(
-            self._safe_label_text(self.land_prep_tab, "lbl_total_cut_volume", "N/A")
-        )
+            # Sweet sand volume
+            set_text(self.lbl_sand_volume, self._find_label_text(
+                self.sweet_sand_tab,
+                "sand_volume",
+                ["lbl_volume_total", "lbl_total_volume", "lbl_total_sand_volume", "lbl_total_volume_m3"],
+            ))
+
+            # Concrete volume
+            set_text(self.lbl_concrete_volume, self._find_label_text(
+                self.concrete_tab,
+                "concrete_volume",
+                ["lbl_volume", "lbl_concrete_volume", "lbl_total_concrete_volume", "lbl_concrete_vol"],
+            ))
+
+            # NEW: Concrete formwork area + rebar snapshot (defensive)
+            set_text(self.lbl_concrete_formwork_area, self._find_label_text(
+                self.concrete_tab,
+                "concrete_form_area",
+                ["lbl_form_area", "lbl_formwork_area", "lbl_concrete_form_area"],
+            ))
+
+            set_text(self.lbl_concrete_rebar, self._find_label_text(
+                self.concrete_tab,
+                "concrete_rebar",
+                ["lbl_rebar_kg", "lbl_rebar_qty", "lbl_rebar"],
+            ))
+
+            # Land cut volume
+            set_text(
+                self.lbl_land_cut_volume,
+                self._safe_label_text(self.land_prep_tab, "lbl_total_cut_volume", "N/A"),
+            )
 
-        # ------------ Manpower cost ------------
-        manpower_cost_lbl = getattr(self.manpower_tab, "lbl_grand_total", None)
-        self._cost_manpower = self._parse_currency_label(manpower_cost_lbl)
-        self.lbl_manpower_cost.setText(f"${self._cost_manpower:,.2f}")
+            # Man-hours
+            set_text(
+                self.lbl_manhours,
+                self._safe_label_text(self.manpower_tab, "lbl_total_manhours", "N/A"),
+            )
 
-        # Man-hours
-        self.lbl_manhours.setText(
-            self._safe_label_text(self.manpower_tab, "lbl_total_manhours", "N/A")
-        )
+            # Equipment hours
+            set_text(
+                self.lbl_equipment_hours,
+                self._safe_label_text(self.equipment_tab, "lbl_total_hours", "N/A"),
+            )
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
 
-        # ------------ Equipment cost ------------
-        equipment_cost_lbl = getattr(self.equipment_tab, "lbl_grand_total", None)
-        self._cost_equipment = self._parse_currency_label(equipment_cost_lbl)
-        self.lbl_equipment_cost.setText(f"${self._cost_equipment:,.2f}")
+        self._last_versions = versions
 
-        # Equipment hours
-        self.lbl_equipment_hours.setText(
-            self._safe_label_text(self.equipment_tab, "lbl_total_hours", "N/A")
-        )
+    # ------------------------------------------------------------------
+    # Totals snapshot (for the sidecar project cache)
+    # ------------------------------------------------------------------
 
-        # ------------ Total project cost ------------
-        self._cost_total = (
-            self._cost_block
-            + self._cost_sand
-            + self._cost_concrete
-            + self._cost_land_prep
-            + self._cost_manpower
-            + self._cost_equipment
-        )
-        self.lbl_total_cost.setText(f"${self._cost_total:,.2f}")
+    # Every label refresh_summary writes, in display order.
+    _TOTAL_LABEL_ATTRS = (
+        "lbl_blocks_cost",
+        "lbl_sand_cost",
+        "lbl_concrete_cost",
+        "lbl_land_prep_cost",
+        "lbl_manpower_cost",
+        "lbl_equipment_cost",
+        "lbl_total_cost",
+        "lbl_block_area",
+        "lbl_sand_volume",
+        "lbl_concrete_volume",
+        "lbl_concrete_formwork_area",
+        "lbl_concrete_rebar",
+        "lbl_land_cut_volume",
+        "lbl_manhours",
+        "lbl_equipment_hours",
+    )
+
+    def export_totals(self) -> dict:
+        """
+        Snapshot the current summary label texts as a plain dict,
+        suitable for JSON persistence.
+        """
+        return {attr: getattr(self, attr).text() for attr in self._TOTAL_LABEL_ATTRS}
+
+    def apply_cached_totals(self, totals: dict) -> None:
+        """
+        Restore a snapshot produced by export_totals without touching
+        the other tabs. Unknown keys are ignored so stale caches from
+        older builds degrade gracefully.
+        """
+        for attr in self._TOTAL_LABEL_ATTRS:
+            text = totals.get(attr)
+            if isinstance(text, str):
+                getattr(self, attr).setText(text)
+
+        # Keep the numeric fields (used by the PDF export) consistent
+        # with what the labels now show.
+        self._cost_block = self._parse_currency_label(self.lbl_blocks_cost)
+        self._cost_sand = self._parse_currency_label(self.lbl_sand_cost)
+        self._cost_concrete = self._parse_currency_label(self.lbl_concrete_cost)
+        self._cost_land_prep = self._parse_currency_label(self.lbl_land_prep_cost)
+        self._cost_manpower = self._parse_currency_label(self.lbl_manpower_cost)
+        self._cost_equipment = self._parse_currency_label(self.lbl_equipment_cost)
+        self._cost_total = self._parse_currency_label(self.lbl_total_cost)
 
     # ------------------------------------------------------------------
     # Export report
@@ -341,10 +655,10 @@ class SummaryTab(QtWidgets.QWidget):
         """
         Export a PDF report to a user-chosen filename/location and auto-open it.
         """
-        # Always refresh before exporting
-        self.refresh_summary()
-
-        if canvas is None:
+        # The button is disabled at build time when reportlab is not
+        # installed, so this only trips if the package broke between
+        # startup and now (e.g. a half-finished uninstall).
+        if not _ensure_reportlab():
             QtWidgets.QMessageBox.warning(
                 self,
                 "ReportLab Not Installed",
@@ -377,86 +691,247 @@ class SummaryTab(QtWidgets.QWidget):
 
         self._last_export_dir = os.path.dirname(selected_path)
 
-        try:
-            self._write_pdf(selected_path)
-        except Exception as exc:  # pragma: no cover
-            QtWidgets.QMessageBox.critical(
-                self,
-                "Error Generating Report",
-                f"An error occurred while creating the PDF:\n{exc}",
-            )
-            return
+        # Refresh only once the export is definitely happening; a
+        # cancelled dialog or missing reportlab no longer pays for six
+        # label parses and setText relayouts.
+        self.refresh_summary()
 
+        # Snapshot every text the report needs while still on the UI
+        # thread, then hand the drawing to the global thread pool so
+        # the window keeps painting and responding during generation.
+        snapshot = self._collect_report_snapshot()
+        self.export_button.setEnabled(False)
+
+        worker = _ReportWorker(selected_path, snapshot)
+        worker.signals.finished.connect(self._on_report_finished)
+        worker.signals.failed.connect(self._on_report_failed)
+        # Keep the signal holder alive until a slot has run; the pool
+        # releases the runnable itself as soon as run() returns.
+        self._report_worker = worker
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    def _on_report_finished(self, path: str) -> None:
+        self._report_worker = None
+        self.export_button.setEnabled(True)
         try:
-            self._open_file(selected_path)
+            self._open_file(path)
         except Exception:
             QtWidgets.QMessageBox.information(
                 self,
                 "Report Generated",
-                f"Report saved to:\n{selected_path}",
+                f"Report saved to:\n{path}",
             )
 
-    def _write_pdf(self, path: str) -> None:
+    def _on_report_failed(self, path: str, message: str) -> None:
+        self._report_worker = None
+        self.export_button.setEnabled(True)
+        QtWidgets.QMessageBox.critical(
+            self,
+            "Error Generating Report",
+            f"An error occurred while creating the PDF:\n{message}",
+        )
+
+    def _collect_report_snapshot(self) -> dict:
+        """
+        Read every label text the PDF interpolates into one plain dict.
+
+        Each .text() crosses the Python/Qt boundary once here instead
+        of once per use inside the drawing code, and the resulting dict
+        is safe to ship to a worker thread.
+        """
+        breeze = self.breeze_tab
+        concrete = self.concrete_tab
+        equipment = self.equipment_tab
+        safe = self._safe_label_text
+
+        snap = {
+            # Cost summary (own labels)
+            "blocks_cost": self.lbl_blocks_cost.text(),
+            "sand_cost": self.lbl_sand_cost.text(),
+            "concrete_cost": self.lbl_concrete_cost.text(),
+            "land_prep_cost": self.lbl_land_prep_cost.text(),
+            "manpower_cost": self.lbl_manpower_cost.text(),
+            "equipment_cost": self.lbl_equipment_cost.text(),
+            "total_cost": self.lbl_total_cost.text(),
+            # Quantities (own labels)
+            "block_area": self.lbl_block_area.text(),
+            "sand_volume": self.lbl_sand_volume.text(),
+            "concrete_volume": self.lbl_concrete_volume.text(),
+            "land_cut_volume": self.lbl_land_cut_volume.text(),
+            "manhours": self.lbl_manhours.text(),
+            "equipment_hours": self.lbl_equipment_hours.text(),
+            # Blockwork details
+            "wall_area": safe(breeze, "lbl_wall_area", "N/A"),
+            "arc_area": safe(breeze, "lbl_arc_area", "N/A"),
+            "reactor_area": safe(breeze, "lbl_reactor_area", "N/A"),
+            "blocks": safe(breeze, "lbl_blocks", "N/A"),
+            "pallets": safe(breeze, "lbl_pallets", "N/A"),
+            "leftover": safe(breeze, "lbl_leftover", "N/A"),
+            # Concrete details
+            "conc_weight": safe(concrete, "lbl_conc_weight", "N/A"),
+            "form_area": safe(concrete, "lbl_form_area", "N/A"),
+            "rebar_kg": safe(concrete, "lbl_rebar_kg", "N/A"),
+            "rebar_tons": safe(concrete, "lbl_rebar_tons", "N/A"),
+            "conc_cost": safe(concrete, "lbl_conc_cost", "N/A"),
+            "rebar_cost": safe(concrete, "lbl_rebar_cost", "N/A"),
+            "formwork_cost": safe(concrete, "lbl_formwork_cost", "N/A"),
+            # Equipment details
+            "fuel_litres": safe(equipment, "lbl_total_fuel", "N/A"),
+            "fuel_cost": safe(equipment, "lbl_total_fuel_cost", "N/A"),
+            "mob_cost": safe(equipment, "lbl_mob_cost", "N/A"),
+            "overhead_cost": safe(equipment, "lbl_overhead_cost", "N/A"),
+        }
+
+        # The equipment tab keeps a plain-list mirror of its breakdown
+        # alongside the widget; when present, take it as-is and skip
+        # the document walk entirely.
+        equip_breakdown_lines = list(getattr(equipment, "breakdown_rows", ()) or ())
+        equip_breakdown_widget = getattr(equipment, "breakdown_text", None)
+        if not equip_breakdown_lines and isinstance(
+            equip_breakdown_widget, QtWidgets.QPlainTextEdit
+        ):
+            # Walk the document block by block: each block is one line,
+            # so there is no full-buffer toPlainText() copy and no
+            # second pass to split it up again.
+            block = equip_breakdown_widget.document().begin()
+            while block.isValid():
+                equip_breakdown_lines.append(block.text())
+                block = block.next()
+            # An untouched widget still holds one empty block; treat a
+            # whitespace-only document as "no breakdown", as before.
+            if not any(s.strip() for s in equip_breakdown_lines):
+                equip_breakdown_lines = []
+        snap["equip_breakdown"] = equip_breakdown_lines
+
+        return snap
+
+    @staticmethod
+    def _write_pdf_from_snapshot(path: str, snap: dict) -> None:
         """
         Generate a detailed multi-section PDF file at the given path,
         styled to match the app's signature dark navy + orange theme.
+
+        Draws purely from the `snap` dict built by
+        _collect_report_snapshot, so it is safe to run off the GUI
+        thread.
         """
 
-        c = canvas.Canvas(path, pagesize=A4)
+        # Draw into memory and write the finished document in one go:
+        # no incremental flushes to disk while drawing, and an exception
+        # mid-draw leaves no half-written file at the target path.
+        buf = io.BytesIO()
+        c = canvas.Canvas(buf, pagesize=A4)
         c.setTitle("Construction Report")
-        width, height = A4
+        # Deflate each page's content stream. The repeated background
+        # form reference and the text-heavy sections compress well, so
+        # the file on disk shrinks to a fraction of the raw streams.
+        c.setPageCompression(1)
+        width, height = _A4_W, _A4_H
 
         margin = 40
+        inner_w = width - 2 * margin
+        # Page-break thresholds, computed once rather than per draw call.
+        y_floor = margin + 40
+        hline_floor = margin + 20
         y = height - margin
 
-        # Theme colours
-        BG = colors.HexColor("#050B1A")          # deep navy background
-        BORDER = colors.HexColor("#223056")      # subtle borders/lines
-        TEXT = colors.HexColor("#F5F5F5")        # main text
-        TEXT_DIM = colors.HexColor("#A9B0C5")    # secondary text
-        ORANGE = colors.HexColor("#FF7A00")      # signature accent
+        # Local aliases for the module-level theme constants
+        BG = _PDF_BG
+        BORDER = _PDF_BORDER
+        TEXT = _PDF_TEXT
+        TEXT_DIM = _PDF_TEXT_DIM
+        ORANGE = _PDF_ORANGE
+
+        # Current canvas graphics state, tracked so the guarded setters
+        # below can drop redundant Tf/rg/RG operators (and their Python
+        # call overhead) when the requested state is already active.
+        state = {"font": None, "size": None, "fill": None, "stroke": None}
+
+        def set_font(name, size) -> None:
+            if state["font"] != name or state["size"] != size:
+                state["font"] = name
+                state["size"] = size
+                c.setFont(name, size)
+
+        def set_fill(color) -> None:
+            if state["fill"] is not color:
+                state["fill"] = color
+                c.setFillColor(color)
+
+        def set_stroke(color) -> None:
+            if state["stroke"] is not color:
+                state["stroke"] = color
+                c.setStrokeColor(color)
+
+        # The full-page background fill is defined once as a Form
+        # XObject and stamped onto every page, so the PDF stores the
+        # rectangle (and its colour) a single time instead of repeating
+        # the path per page. The fill is baked into the form's own
+        # content stream, leaving the tracked page state untouched.
+        c.beginForm("pagebg")
+        c.setFillColor(BG)
+        c.rect(0, 0, width, height, stroke=0, fill=1)
+        c.endForm()
 
         def paint_page_background() -> None:
-            c.saveState()
-            c.setFillColor(BG)
-            c.rect(0, 0, width, height, stroke=0, fill=1)
-            c.restoreState()
+            c.doForm("pagebg")
 
         paint_page_background()
 
         def new_page() -> None:
             nonlocal y
             c.showPage()
+            # showPage resets the PDF graphics state to defaults.
+            state.update(font=None, size=None, fill=None, stroke=None)
             paint_page_background()
             y = height - margin
 
         def hline(offset: int = 8) -> None:
             nonlocal y
             line_y = y - offset
-            if line_y < margin + 20:
+            if line_y < hline_floor:
                 new_page()
                 line_y = y - offset
 
-            c.setStrokeColor(BORDER)
+            set_stroke(BORDER)
             c.setLineWidth(0.8)
             c.line(margin, line_y, width - margin, line_y)
             y = line_y - 10
 
         def line(text: str = "", fontsize: int = 10, dy: int = 14, dim: bool = False) -> None:
             nonlocal y
-            if y < margin + 40:
+            if y < y_floor:
                 new_page()
 
             if text:
-                c.setFont("Helvetica", fontsize)
-                c.setFillColor(TEXT_DIM if dim else TEXT)
+                set_font("Helvetica", fontsize)
+                set_fill(TEXT_DIM if dim else TEXT)
                 c.drawString(margin, y, text)
 
             y -= dy
 
         def paragraph(lines, fontsize: int = 10, dy: int = 14, dim: bool = False) -> None:
-            for t in lines:
-                line(t, fontsize=fontsize, dy=dy, dim=dim)
+            nonlocal y
+            # One text object per on-page run: the font and fill are set
+            # once and each row becomes a single Tj inside a shared
+            # BT/ET block, instead of one drawString block per line.
+            i = 0
+            n = len(lines)
+            while i < n:
+                if y < y_floor:
+                    new_page()
+                to = c.beginText(margin, y)
+                to.setFont("Helvetica", fontsize, leading=dy)
+                to.setFillColor(TEXT_DIM if dim else TEXT)
+                while i < n and y >= y_floor:
+                    to.textLine(lines[i])
+                    y -= dy
+                    i += 1
+                c.drawText(to)
+                # Tf and rg persist beyond the BT/ET block, so the
+                # canvas is now in the text object's font and fill.
+                state["font"], state["size"] = "Helvetica", fontsize
+                state["fill"] = TEXT_DIM if dim else TEXT
 
         def section_header(title: str) -> None:
             nonlocal y
@@ -465,33 +940,43 @@ class SummaryTab(QtWidgets.QWidget):
             if y < margin + bar_height + 30:
                 new_page()
 
-            c.setFillColor(ORANGE)
-            c.setStrokeColor(ORANGE)
+            set_fill(ORANGE)
+            set_stroke(ORANGE)
             c.roundRect(
                 margin,
                 y - bar_height + 4,
-                width - 2 * margin,
+                inner_w,
                 bar_height,
                 6,
                 stroke=0,
                 fill=1,
             )
 
-            c.setFillColor(BG)
-            c.setFont("Helvetica-Bold", 11)
+            set_fill(BG)
+            set_font("Helvetica-Bold", 11)
             c.drawString(margin + 8, y - bar_height + 9, title)
 
             y -= bar_height + 14
-            c.setFillColor(TEXT)
+            set_fill(TEXT)
+
+        def resolve_rows(rows, pad=36):
+            # Resolve a module-level section spec against the snapshot:
+            # (label, template) pairs become two aligned columns, bare
+            # strings are themselves templates (most are literal).
+            return [
+                item.format_map(snap) if isinstance(item, str)
+                else f"{item[0]:<{pad}}{item[1].format_map(snap)}"
+                for item in rows
+            ]
 
         # Header
-        c.setFont("Helvetica-Bold", 18)
-        c.setFillColor(ORANGE)
+        set_font("Helvetica-Bold", 18)
+        set_fill(ORANGE)
         c.drawString(margin, y, "Construction Project Detailed Cost Report")
         y -= 22
 
-        c.setFont("Helvetica", 9)
-        c.setFillColor(TEXT_DIM)
+        set_font("Helvetica", 9)
+        set_fill(TEXT_DIM)
         c.drawString(margin, y, "Generated by Ash's Construction Planner")
         y -= 18
 
@@ -501,23 +986,16 @@ class SummaryTab(QtWidgets.QWidget):
         section_header("1. Cost Summary")
 
         paragraph(
-            [
-                f"1.1 Blockwork (breeze blocks):      {self.lbl_blocks_cost.text()}",
-                f"1.2 Sweet sand (reactor base):      {self.lbl_sand_cost.text()}",
-                f"1.3 Concrete works:                 {self.lbl_concrete_cost.text()}",
-                f"1.4 Land preparation:               {self.lbl_land_prep_cost.text()}",
-                f"1.5 Manpower:                       {self.lbl_manpower_cost.text()}",
-                f"1.6 Equipment & machinery:          {self.lbl_equipment_cost.text()}",
-            ],
+            resolve_rows(_SECTION_COSTS_ROWS),
             fontsize=10,
             dy=14,
         )
 
         line()
-        c.setFont("Helvetica-Bold", 12)
-        c.setFillColor(ORANGE)
-        c.drawString(margin, y, f"1.7 TOTAL PROJECT COST:             {self.lbl_total_cost.text()}")
-        c.setFillColor(TEXT)
+        set_font("Helvetica-Bold", 12)
+        set_fill(ORANGE)
+        c.drawString(margin, y, f"{'1.7 TOTAL PROJECT COST:':<36}{snap['total_cost']}")
+        set_fill(TEXT)
         y -= 20
 
         hline()
@@ -525,30 +1003,8 @@ class SummaryTab(QtWidgets.QWidget):
         # 2) Blockwork Breakdown
         section_header("2. Blockwork (Breeze Blocks)")
 
-        block_area_total = self.lbl_block_area.text()
-        wall_area = self._safe_label_text(self.breeze_tab, "lbl_wall_area", "N/A")
-        arc_area = self._safe_label_text(self.breeze_tab, "lbl_arc_area", "N/A")
-        reactor_area = self._safe_label_text(self.breeze_tab, "lbl_reactor_area", "N/A")
-
-        lbl_blocks = getattr(self.breeze_tab, "lbl_blocks", None)
-        lbl_pallets = getattr(self.breeze_tab, "lbl_pallets", None)
-        lbl_leftover = getattr(self.breeze_tab, "lbl_leftover", None)
-
-        blocks_text = lbl_blocks.text() if isinstance(lbl_blocks, QtWidgets.QLabel) else "N/A"
-        pallets_text = lbl_pallets.text() if isinstance(lbl_pallets, QtWidgets.QLabel) else "N/A"
-        leftover_text = lbl_leftover.text() if isinstance(lbl_leftover, QtWidgets.QLabel) else "N/A"
-
         paragraph(
-            [
-                f"2.1 Total blockwork area:           {block_area_total}",
-                f"2.2 Straight walls area:            {wall_area}",
-                f"2.3 Half-circle arcs area:          {arc_area}",
-                f"2.4 Raceway reactor walls area:     {reactor_area}",
-                "",
-                f"2.5 Blocks required:                {blocks_text}",
-                f"2.6 Pallets required:               {pallets_text}",
-                f"2.7 Leftover blocks (last pallet):  {leftover_text}",
-            ],
+            resolve_rows(_SECTION_BLOCKWORK_ROWS),
             fontsize=10,
             dy=14,
         )
@@ -558,10 +1014,7 @@ class SummaryTab(QtWidgets.QWidget):
         # 3) Sweet Sand Breakdown
         section_header("3. Sweet Sand (Reactor Base Fill)")
         paragraph(
-            [
-                f"3.1 Total sweet sand cost:          {self.lbl_sand_cost.text()}",
-                f"3.2 Sweet sand volume:              {self.lbl_sand_volume.text()}",
-            ],
+            resolve_rows(_SECTION_SAND_ROWS),
             fontsize=10,
             dy=14,
         )
@@ -570,31 +1023,8 @@ class SummaryTab(QtWidgets.QWidget):
         # 4) Concrete Works Breakdown (UPDATED)
         section_header("4. Concrete Works")
 
-        concrete_volume = self.lbl_concrete_volume.text()
-        concrete_weight = self._safe_label_text(self.concrete_tab, "lbl_conc_weight", "N/A")
-        concrete_form_area = self._safe_label_text(self.concrete_tab, "lbl_form_area", "N/A")
-        rebar_kg = self._safe_label_text(self.concrete_tab, "lbl_rebar_kg", "N/A")
-        rebar_t = self._safe_label_text(self.concrete_tab, "lbl_rebar_tons", "N/A")
-
-        conc_cost = self._safe_label_text(self.concrete_tab, "lbl_conc_cost", "N/A")
-        rebar_cost = self._safe_label_text(self.concrete_tab, "lbl_rebar_cost", "N/A")
-        formwork_cost = self._safe_label_text(self.concrete_tab, "lbl_formwork_cost", "N/A")
-
         paragraph(
-            [
-                f"4.1 Total concrete works cost (tab total): {self.lbl_concrete_cost.text()}",
-                "",
-                "4.2 Key quantities:",
-                f"      • Concrete volume:            {concrete_volume}",
-                f"      • Concrete weight:            {concrete_weight}",
-                f"      • Rebar quantity:             {rebar_kg} ({rebar_t})",
-                f"      • Formwork area (vertical):   {concrete_form_area}",
-                "",
-                "4.3 Cost breakdown (if available on tab):",
-                f"      • Concrete cost:              {conc_cost}",
-                f"      • Rebar cost:                 {rebar_cost}",
-                f"      • Formwork cost:              {formwork_cost}",
-            ],
+            resolve_rows(_SECTION_CONCRETE_ROWS),
             fontsize=10,
             dy=14,
         )
@@ -603,10 +1033,7 @@ class SummaryTab(QtWidgets.QWidget):
         # 5) Land Preparation Breakdown
         section_header("5. Land Preparation")
         paragraph(
-            [
-                f"5.1 Total land preparation cost:    {self.lbl_land_prep_cost.text()}",
-                f"5.2 Total cut volume:               {self.lbl_land_cut_volume.text()}",
-            ],
+            resolve_rows(_SECTION_LAND_ROWS),
             fontsize=10,
             dy=14,
         )
@@ -614,15 +1041,8 @@ class SummaryTab(QtWidgets.QWidget):
 
         # 6) Manpower Breakdown
         section_header("6. Manpower")
-        manhours = self.lbl_manhours.text()
         paragraph(
-            [
-                f"6.1 Total manpower cost:            {self.lbl_manpower_cost.text()}",
-                f"6.2 Total man-hours:                {manhours}",
-                "",
-                "6.3 Notes:",
-                "      • Uses your tab totals (refresh the tab before exporting for best results).",
-            ],
+            resolve_rows(_SECTION_MANPOWER_ROWS),
             fontsize=10,
             dy=14,
         )
@@ -630,41 +1050,18 @@ class SummaryTab(QtWidgets.QWidget):
 
         # 7) Equipment Breakdown
         section_header("7. Equipment & Machinery")
-        equipment_hours = self.lbl_equipment_hours.text()
-        fuel_litres = self._safe_label_text(self.equipment_tab, "lbl_total_fuel", "N/A")
-        fuel_cost = self._safe_label_text(self.equipment_tab, "lbl_total_fuel_cost", "N/A")
-        equipment_cost = self.lbl_equipment_cost.text()
-        mob_cost = self._safe_label_text(self.equipment_tab, "lbl_mob_cost", "N/A")
-        overhead_cost = self._safe_label_text(self.equipment_tab, "lbl_overhead_cost", "N/A")
-
         paragraph(
-            [
-                "7.1 Totals:",
-                f"      • Operating hours (all machines): {equipment_hours}",
-                f"      • Total equipment cost:           {equipment_cost}",
-                "",
-                "7.2 Fuel & overheads:",
-                f"      • Fuel consumption:              {fuel_litres}",
-                f"      • Fuel cost:                     {fuel_cost}",
-                f"      • Mobilisation + demob:          {mob_cost}",
-                f"      • Plant overhead + misc:         {overhead_cost}",
-                "",
-            ],
+            resolve_rows(_SECTION_EQUIPMENT_ROWS, pad=40),
             fontsize=10,
             dy=14,
         )
 
-        equip_breakdown_widget = getattr(self.equipment_tab, "breakdown_text", None)
-        equip_breakdown_lines = []
-        if isinstance(equip_breakdown_widget, QtWidgets.QPlainTextEdit):
-            text = equip_breakdown_widget.toPlainText()
-            if text.strip():
-                equip_breakdown_lines = text.splitlines()
-
-        if equip_breakdown_lines:
+        if snap["equip_breakdown"]:
             line("7.3 Per-equipment breakdown:", fontsize=11, dy=16)
-            for row in equip_breakdown_lines:
-                line(row, fontsize=8, dy=11, dim=True)
+            # The breakdown is the longest run of rows in the report;
+            # paragraph() batches it into one text object per page
+            # rather than a drawString (and page-break check) per row.
+            paragraph(snap["equip_breakdown"], fontsize=8, dy=11, dim=True)
         else:
             line("7.3 Per-equipment breakdown not available (no calculation yet).", fontsize=9, dy=14, dim=True)
 
@@ -673,11 +1070,7 @@ class SummaryTab(QtWidgets.QWidget):
         # 8) Closing Notes
         section_header("8. Notes & Assumptions")
         paragraph(
-            [
-                "- This is an internal report for internal use and estimates only.",
-                "- For final design and construction, verify quantities, unit rates,",
-                "  and assumptions with detailed engineering drawings and site conditions.",
-            ],
+            list(_SECTION_NOTES_ROWS),
             fontsize=9,
             dy=12,
             dim=True,
@@ -686,6 +1079,9 @@ class SummaryTab(QtWidgets.QWidget):
         c.showPage()
         c.save()
 
+        with open(path, "wb") as f:
+            f.write(buf.getvalue())
+
     # ------------------------------------------------------------------
     # File opening helper
     # ------------------------------------------------------------------
@@ -696,9 +1092,24 @@ class SummaryTab(QtWidgets.QWidget):
         Open the file at 'path' with the OS default application.
         Supports Windows, macOS, Linux (xdg-open).
         """
+        # Qt talks to the platform's native opener directly — no child
+        # process on Unix, and correct behaviour under Wayland and
+        # sandboxed desktops. The spawn paths below remain as a
+        # fallback for the rare platforms where openUrl reports failure.
+        if QtGui.QDesktopServices.openUrl(
+            QtCore.QUrl.fromLocalFile(path)
+        ):
+            return
         if sys.platform.startswith("win"):
             os.startfile(path)  # type: ignore[attr-defined]
         elif sys.platform.startswith("darwin"):
             subprocess.Popen(["open", path])
-        else:
-            subprocess.Popen(["xdg-open", path])
+        elif hasattr(os, "posix_spawnp"):
+            # Fire-and-forget launch through one spawn syscall; skips
+            # the pipe setup and close-fds sweep subprocess performs
+            # for a child whose fate we never inspect.
+            os.posix_spawnp("xdg-open", ["xdg-open", path], dict(os.environ))
+        else:  # pragma: no cover
+            subprocess.Popen(
+                ["xdg-open", path], close_fds=False, start_new_session=True
+            )
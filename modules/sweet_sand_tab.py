@@ -67,10 +67,18 @@ Cost:
 """
 
 import math
+from contextlib import ExitStack
 from typing import Optional
 
 from PyQt5 import QtCore, QtWidgets
 
+# Circle constants bound once at import: the calculation below then
+# pays no math-module attribute lookups, and squaring stays a plain
+# multiplication instead of a float.__pow__ dispatch.
+_PI = math.pi
+_TWO_PI = 2.0 * math.pi
+_PI_OVER_4 = math.pi * 0.25
+
 
 class SweetSandTab(QtWidgets.QWidget):
     """
@@ -85,29 +93,81 @@ class SweetSandTab(QtWidgets.QWidget):
     # ------------------------------------------------------------------
 
     def export_state(self) -> dict:
+        # QDoubleSpinBox.value() already returns a Python float, so the
+        # readings go into the dict as-is.
         return {
-            "length_total": float(self.length_total_spin.value()),
-            "width": float(self.width_spin.value()),
-            "fill_height": float(self.fill_height_spin.value()),
-            "corner_radius": float(self.corner_radius_spin.value()),
-            "bulk_density": float(self.bulk_density_spin.value()),
-            "cost_per_ton": float(self.cost_per_ton_spin.value()),
+            "length_total": self.length_total_spin.value(),
+            "width": self.width_spin.value(),
+            "fill_height": self.fill_height_spin.value(),
+            "corner_radius": self.corner_radius_spin.value(),
+            "bulk_density": self.bulk_density_spin.value(),
+            "cost_per_ton": self.cost_per_ton_spin.value(),
         }
 
+    def _state_spins(self) -> tuple:
+        """(state key, spinbox) pairs shared by import/export logic."""
+        return (
+            ("length_total", self.length_total_spin),
+            ("width", self.width_spin),
+            ("fill_height", self.fill_height_spin),
+            ("corner_radius", self.corner_radius_spin),
+            ("bulk_density", self.bulk_density_spin),
+            ("cost_per_ton", self.cost_per_ton_spin),
+        )
+
     def import_state(self, state: dict) -> None:
         if not isinstance(state, dict):
             return
 
-        self.length_total_spin.setValue(float(state.get("length_total", 0.0)))
-        self.width_spin.setValue(float(state.get("width", 0.0)))
-        self.fill_height_spin.setValue(float(state.get("fill_height", 0.0)))
-        self.corner_radius_spin.setValue(float(state.get("corner_radius", 0.0)))
-        self.bulk_density_spin.setValue(float(state.get("bulk_density", self.bulk_density_spin.value())))
-        self.cost_per_ton_spin.setValue(float(state.get("cost_per_ton", self.cost_per_ton_spin.value())))
+        # Block signals across the whole apply: each setValue would
+        # otherwise bump the version and restart the debounce once per
+        # field. One bump and one scheduled recalc at the end suffice.
+        with ExitStack() as stack:
+            pairs = self._state_spins()
+            for _key, spin in pairs:
+                stack.enter_context(QtCore.QSignalBlocker(spin))
+
+            # A missing key leaves that spin at its current value rather
+            # than manufacturing a per-field default. Inbound JSON
+            # values may be strings or junk; skip a bad field rather
+            # than aborting the whole import.
+            for key, spin in pairs:
+                value = state.get(key)
+                if value is None:
+                    continue
+                try:
+                    spin.setValue(float(value))
+                except (TypeError, ValueError):
+                    pass
+
+        self._bump_state_version()
+        # The loaded inputs may match the pre-load display by chance;
+        # drop the memo so the scheduled pass recomputes for real.
+        self._last_inputs = None
+        self._schedule_recalculate()
 
 
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
+        self._state_version = 0
+        # Numeric mirror of lbl_total_cost for the Summary tab,
+        # saving it a round-trip through the currency string.
+        self.total_cost_value = 0.0
+        # Monotonic counter bumped whenever the result labels are
+        # rewritten; the Summary tab uses it to skip stale-free
+        # refreshes.
+        self.results_version = 0
+        # Inputs of the last completed calculation; None = stale results
+        self._last_inputs: Optional[tuple] = None
+
+        # Debounce for live recalculation: editing a spin restarts this
+        # short single-shot timer, so results follow the inputs after
+        # each pause in typing/scrolling, not once per keystroke.
+        self._recalc_timer = QtCore.QTimer(self)
+        self._recalc_timer.setSingleShot(True)
+        self._recalc_timer.setInterval(120)
+        self._recalc_timer.timeout.connect(self._on_calculate_clicked)
+
         self._build_ui()
         self._connect_signals()
 
@@ -209,7 +269,38 @@ class SweetSandTab(QtWidgets.QWidget):
         button_layout.addWidget(self.reset_button)
         button_layout.addWidget(self.calculate_button)
 
-        # ---------------- Results ----------------
+        # ---------------- Validation status ----------------
+        # Inline validation message. A modal warning box would re-enter
+        # the event loop on every invalid intermediate value now that
+        # recalculation runs live; this label just appears and goes away.
+        self.status_label = QtWidgets.QLabel("", self)
+        self.status_label.setStyleSheet("color: #FF6B6B;")
+        self.status_label.setWordWrap(True)
+        self.status_label.hide()
+
+        # ---------------- Results (built lazily) ----------------
+        # Nine result labels and their form rows show only zeros until
+        # the first calculation, so a bare placeholder holds their spot
+        # and _ensure_results_ui builds the real group on demand.
+        self._results_built = False
+        self._results_placeholder = QtWidgets.QWidget(self)
+        self._main_layout = main_layout
+
+        # ---------------- Assemble layout ----------------
+        main_layout.addWidget(geom_group)
+        main_layout.addWidget(note_label)
+        main_layout.addWidget(material_group)
+        main_layout.addLayout(button_layout)
+        main_layout.addWidget(self.status_label)
+        main_layout.addWidget(self._results_placeholder)
+        main_layout.addStretch(1)
+
+    def _ensure_results_ui(self) -> None:
+        """Build the Results group on first use and swap it into place."""
+        if self._results_built:
+            return
+        self._results_built = True
+
         result_group = QtWidgets.QGroupBox("Results", self)
         result_form = QtWidgets.QFormLayout(result_group)
         result_form.setLabelAlignment(QtCore.Qt.AlignRight)
@@ -234,13 +325,10 @@ class SweetSandTab(QtWidgets.QWidget):
         result_form.addRow("Weight (metric tons):", self.lbl_weight_tons)
         result_form.addRow("Total material cost:", self.lbl_total_cost)
 
-        # ---------------- Assemble layout ----------------
-        main_layout.addWidget(geom_group)
-        main_layout.addWidget(note_label)
-        main_layout.addWidget(material_group)
-        main_layout.addLayout(button_layout)
-        main_layout.addWidget(result_group)
-        main_layout.addStretch(1)
+        index = self._main_layout.indexOf(self._results_placeholder)
+        self._main_layout.removeWidget(self._results_placeholder)
+        self._results_placeholder.deleteLater()
+        self._main_layout.insertWidget(index, result_group)
 
     # ------------------------------------------------------------------
     # Signal wiring
@@ -251,6 +339,20 @@ class SweetSandTab(QtWidgets.QWidget):
         self.calculate_button.clicked.connect(self._on_calculate_clicked)
         self.reset_button.clicked.connect(self._on_reset_clicked)
 
+        # Any input edit bumps the state version so MainWindow can reuse
+        # cached export_state snapshots for unchanged tabs, and restarts
+        # the debounce so the results track the inputs live. Unchanged
+        # values fall into the input memo, so no-op edits stay free.
+        for spin in self.findChildren((QtWidgets.QSpinBox, QtWidgets.QDoubleSpinBox)):
+            spin.valueChanged.connect(self._bump_state_version)
+            spin.valueChanged.connect(self._schedule_recalculate)
+
+    def _schedule_recalculate(self, *_args) -> None:
+        self._recalc_timer.start()
+
+    def _bump_state_version(self, *_args) -> None:
+        self._state_version += 1
+
     # ------------------------------------------------------------------
     # Slots
     # ------------------------------------------------------------------
@@ -263,12 +365,19 @@ class SweetSandTab(QtWidgets.QWidget):
         sides of the central divider, and estimate total cost.
         """
 
-        L_total = float(self.length_total_spin.value())
-        W = float(self.width_spin.value())
-        H_cm = float(self.fill_height_spin.value())
-        r_corner_cm = float(self.corner_radius_spin.value())
-        rho = float(self.bulk_density_spin.value())
-        cost_per_ton = float(self.cost_per_ton_spin.value())
+        # value() already returns float; no conversion needed.
+        L_total = self.length_total_spin.value()
+        W = self.width_spin.value()
+        H_cm = self.fill_height_spin.value()
+        r_corner_cm = self.corner_radius_spin.value()
+        rho = self.bulk_density_spin.value()
+        cost_per_ton = self.cost_per_ton_spin.value()
+
+        # The labels already show the results for these exact inputs,
+        # so skip the arithmetic and the nine setText relayouts.
+        key = (L_total, W, H_cm, r_corner_cm, rho, cost_per_ton)
+        if key == self._last_inputs:
+            return
 
         # Convert cm inputs to meters
         H = H_cm / 100.0
@@ -276,31 +385,29 @@ class SweetSandTab(QtWidgets.QWidget):
 
         # Basic validation of geometry & materials
         if L_total <= 0 or W <= 0 or H <= 0 or rho <= 0 or cost_per_ton < 0:
-            QtWidgets.QMessageBox.warning(
-                self,
-                "Invalid Input",
-                "Please ensure length, width, height and density are all > 0,\n"
-                "and cost per tonne is not negative.",
+            self._show_invalid(
+                "Length, width, height and density must all be > 0, "
+                "and cost per tonne must not be negative."
             )
             return
 
         if L_total <= W:
-            QtWidgets.QMessageBox.warning(
-                self,
-                "Geometry Warning",
-                "Overall length (L) must be greater than width (W)\n"
-                "so that a straight section exists between the arcs.\n"
-                "Currently, L <= W. Please adjust the dimensions.",
+            self._show_invalid(
+                "Overall length (L) must be greater than width (W) so that "
+                "a straight section exists between the arcs."
             )
             return
 
+        self.status_label.hide()
+        self._ensure_results_ui()
+
         # Geometry
         L_rect = L_total - W
         R = W / 2.0
 
         # Plan area: rectangle + full circle (two semicircles)
         area_rect = W * L_rect
-        area_circle = math.pi * (R ** 2)
+        area_circle = _PI * R * R
         area_total = area_rect + area_circle
 
         # Base fill volume (flat base)
@@ -309,14 +416,14 @@ class SweetSandTab(QtWidgets.QWidget):
         # Corner radius fillet volume (optional if r_corner > 0)
         if r_corner > 0.0:
             # External racetrack perimeter
-            perimeter_outer = 2.0 * L_rect + 2.0 * math.pi * R
+            perimeter_outer = 2.0 * L_rect + _TWO_PI * R
             # Central wall, both sides
             perimeter_center = 2.0 * L_rect
             # Total fillet run length
             perimeter_total = perimeter_outer + perimeter_center
 
             # Quarter-circle cross-section area
-            fillet_cross_section = math.pi * (r_corner ** 2) / 4.0
+            fillet_cross_section = _PI_OVER_4 * r_corner * r_corner
             volume_corner = perimeter_total * fillet_cross_section
         else:
             volume_corner = 0.0
@@ -329,19 +436,70 @@ class SweetSandTab(QtWidgets.QWidget):
         # Cost
         total_cost = weight_tons * cost_per_ton
 
-        # Update labels
-        self.lbl_rect_length.setText(f"{L_rect:,.3f} m")
-        self.lbl_radius.setText(f"{R:,.3f} m")
-        self.lbl_plan_area.setText(f"{area_total:,.2f} m²")
-        self.lbl_volume_base.setText(f"{volume_base:,.3f} m³")
-        self.lbl_volume_corner.setText(f"{volume_corner:,.3f} m³")
-        self.lbl_volume_total.setText(f"{volume_total:,.3f} m³")
-        self.lbl_weight_kg.setText(f"{weight_kg:,.0f} kg")
-        self.lbl_weight_tons.setText(f"{weight_tons:,.3f} t")
-        self.lbl_total_cost.setText(f"${total_cost:,.2f}")
+        # Update labels; the guard skips the Qt relayout for any label
+        # whose text comes out identical (tweaking only the cost leaves
+        # all eight geometry labels untouched).
+        set_text = self._set_if_changed
+        set_text(self.lbl_rect_length, f"{L_rect:,.3f} m")
+        set_text(self.lbl_radius, f"{R:,.3f} m")
+        set_text(self.lbl_plan_area, f"{area_total:,.2f} m²")
+        set_text(self.lbl_volume_base, f"{volume_base:,.3f} m³")
+        set_text(self.lbl_volume_corner, f"{volume_corner:,.3f} m³")
+        set_text(self.lbl_volume_total, f"{volume_total:,.3f} m³")
+        set_text(self.lbl_weight_kg, f"{weight_kg:,.0f} kg")
+        set_text(self.lbl_weight_tons, f"{weight_tons:,.3f} t")
+        set_text(self.lbl_total_cost, f"${total_cost:,.2f}")
+        self.total_cost_value = total_cost
+        self.results_version += 1
+
+        # Recorded only after the labels are written, so a validation
+        # bail-out above leaves the results marked stale.
+        self._last_inputs = key
+
+    @staticmethod
+    def _set_if_changed(label: QtWidgets.QLabel, text: str) -> None:
+        """setText only when the text differs; QLabel.setText always
+        invalidates its layout even for an identical string."""
+        if label.text() != text:
+            label.setText(text)
+
+    def _show_invalid(self, message: str) -> None:
+        """
+        Surface a validation problem inline and zero the result labels,
+        so stale numbers never sit next to inputs they no longer match.
+        """
+        self.status_label.setText(message)
+        self.status_label.show()
+        # The labels are zeroed below; drop the memo so re-entering the
+        # last-computed inputs recomputes instead of early-returning
+        # with the error still showing over zeroed results.
+        self._last_inputs = None
+        self._reset_result_labels()
 
     def _on_reset_clicked(self) -> None:
+        """
+        Reset to defaults with input signals blocked, so the burst of
+        widget writes does not fire connected slots once per assignment.
+        """
+        with ExitStack() as stack:
+            for w in self.findChildren(
+                (
+                    QtWidgets.QLineEdit,
+                    QtWidgets.QSpinBox,
+                    QtWidgets.QDoubleSpinBox,
+                    QtWidgets.QComboBox,
+                )
+            ):
+                stack.enter_context(QtCore.QSignalBlocker(w))
+            self._apply_defaults()
+        # Blocked signals also suppress the version bump; do it once here.
+        self._bump_state_version()
+
+    def _apply_defaults(self) -> None:
         """Reset all inputs and results to defaults."""
+        # The labels are rewritten directly below; drop the memo so the
+        # next calculation does not mistake them for computed results.
+        self._last_inputs = None
         self.length_total_spin.setValue(0.0)
         self.width_spin.setValue(0.0)
         self.fill_height_spin.setValue(0.0)
@@ -351,15 +509,27 @@ class SweetSandTab(QtWidgets.QWidget):
         self.bulk_density_spin.setValue(1600.0)
         self.cost_per_ton_spin.setValue(13.3)
 
-        self.lbl_rect_length.setText("0.000 m")
-        self.lbl_radius.setText("0.000 m")
-        self.lbl_plan_area.setText("0.00 m²")
-        self.lbl_volume_base.setText("0.000 m³")
-        self.lbl_volume_corner.setText("0.000 m³")
-        self.lbl_volume_total.setText("0.000 m³")
-        self.lbl_weight_kg.setText("0 kg")
-        self.lbl_weight_tons.setText("0.000 t")
-        self.lbl_total_cost.setText("$0.00")
+        self.status_label.hide()
+        self._reset_result_labels()
+
+    def _reset_result_labels(self) -> None:
+        """Return every result label (and its mirrors) to the zero state."""
+        self.total_cost_value = 0.0
+        self.results_version += 1
+        # Result widgets only exist once something has been calculated;
+        # before that there is nothing on screen to zero.
+        if not self._results_built:
+            return
+        set_text = self._set_if_changed
+        set_text(self.lbl_rect_length, "0.000 m")
+        set_text(self.lbl_radius, "0.000 m")
+        set_text(self.lbl_plan_area, "0.00 m²")
+        set_text(self.lbl_volume_base, "0.000 m³")
+        set_text(self.lbl_volume_corner, "0.000 m³")
+        set_text(self.lbl_volume_total, "0.000 m³")
+        set_text(self.lbl_weight_kg, "0 kg")
+        set_text(self.lbl_weight_tons, "0.000 t")
+        set_text(self.lbl_total_cost, "$0.00")
 
 
 